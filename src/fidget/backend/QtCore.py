@@ -12,13 +12,16 @@ __backend__ = load()
 _QtCore = __backend__.partial('QtCore')
 
 QtCore = __backend__.module('QtCore')
+QAbstractTableModel: Type[__QtCore.QAbstractTableModel] = _QtCore['QAbstractTableModel']
 QEvent: Type[__QtCore.QEvent] = _QtCore['QEvent']
 QEventLoop: Type[__QtCore.QEventLoop] = _QtCore['QEventLoop']
+QModelIndex: Type[__QtCore.QModelIndex] = _QtCore['QModelIndex']
 QObject: Type[__QtCore.QObject] = _QtCore['QObject']
 Qt: Type[__QtCore.Qt] = _QtCore['Qt']
 pyqtSignal: Type[__QtCore.Signal] = _QtCore['pyqtSignal']
 QRect: Type[__QtCore.QRect] = _QtCore['QRect']
 QSize: Type[__QtCore.QSize] = _QtCore['QSize']
+QTimer: Type[__QtCore.QTimer] = _QtCore['QTimer']
 QRegularExpression: Type[__QtCore.QRegularExpression] = _QtCore['QRegularExpression']
 QRegExp = QRegularExpression
 # QRegExp: Type[__QtCore.QRegExp] = _QtCore['QRegExp']
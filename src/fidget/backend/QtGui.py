@@ -16,6 +16,7 @@ QtGui = __backend__.module('QtGui')
 
 QAction: Type[__QtGui.QAction] = _QtGui['QAction'] if __backend__.qt_version >= 6 else _QtWidgets['QAction']
 QDesktopServices: Type[__QtGui.QDesktopServices] = _QtGui['QDesktopServices']
+QBrush: Type[__QtGui.QBrush] = _QtGui['QBrush']
 QColor: Type[__QtGui.QColor] = _QtGui['QColor']
 QTextCharFormat: Type[__QtGui.QTextCharFormat] = _QtGui['QTextCharFormat']
 QFont: Type[__QtGui.QFont] = _QtGui['QFont']
@@ -23,6 +23,7 @@ QFontComboBox: Type[__QtWidgets.QFontComboBox] = _QtWidgets['QFontComboBox']
 QFrame: Type[__QtWidgets.QFrame] = _QtWidgets['QFrame']
 QGridLayout: Type[__QtWidgets.QGridLayout] = _QtWidgets['QGridLayout']
 QGroupBox: Type[__QtWidgets.QGroupBox] = _QtWidgets['QGroupBox']
+QHeaderView: Type[__QtWidgets.QHeaderView] = _QtWidgets['QHeaderView']
 QHBoxLayout: Type[__QtWidgets.QHBoxLayout] = _QtWidgets['QHBoxLayout']
 QLabel: Type[__QtWidgets.QLabel] = _QtWidgets['QLabel']
 QLineEdit: Type[__QtWidgets.QLineEdit] = _QtWidgets['QLineEdit']
@@ -38,7 +39,9 @@ QSizePolicy: Type[__QtWidgets.QSizePolicy] = _QtWidgets['QSizePolicy']
 QSpinBox: Type[__QtWidgets.QSpinBox] = _QtWidgets['QSpinBox']
 QStackedWidget: Type[__QtWidgets.QStackedWidget] = _QtWidgets['QStackedWidget']
 QStyle: Type[__QtWidgets.QStyle] = _QtWidgets['QStyle']
+QStyledItemDelegate: Type[__QtWidgets.QStyledItemDelegate] = _QtWidgets['QStyledItemDelegate']
 QTabWidget: Type[__QtWidgets.QTabWidget] = _QtWidgets['QTabWidget']
+QTableView: Type[__QtWidgets.QTableView] = _QtWidgets['QTableView']
 QToolButton: Type[__QtWidgets.QToolButton] = _QtWidgets['QToolButton']
 QTreeWidget: Type[__QtWidgets.QTreeWidget] = _QtWidgets['QTreeWidget']
 QTreeWidgetItem: Type[__QtWidgets.QTreeWidgetItem] = _QtWidgets['QTreeWidgetItem']
@@ -1,6 +1,4 @@
 from fidget.backend.QtGui import QIcon
-# noinspection PyUnresolvedReferences
-import fidget.backend._resources
 
 
 class LazyIcon:
@@ -10,6 +8,9 @@ class LazyIcon:
 
     def __call__(self, *args, **kwargs):
         if not self._instance:
+            # registering the embedded resources is only needed once an icon is actually created
+            # noinspection PyUnresolvedReferences
+            import fidget.backend._resources
             self._instance = QIcon(self.path)
         return self._instance
 
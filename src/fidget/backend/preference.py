@@ -3,6 +3,8 @@ from typing import Union, Optional
 from collections import OrderedDict
 
 from warnings import warn
+import logging
+import os
 
 from fidget.backend.qtbackend import QtBackend, PySide6_backend, PySide2_backend, PyQt6_backend, PyQt5_backend
 
@@ -16,6 +18,15 @@ backends = OrderedDict((b.__name__, b) for b in backends_list)
 
 loaded: Optional[QtBackend] = None
 
+BACKEND_ENV = 'FIDGET_BACKEND'
+"""
+the environment variable a user can set to a backend's name, to have it tried first (like a call to prefer) rather than
+ probing the others. Worker processes started by fidget are told of the loaded backend directly, the environment is
+ never changed.
+"""
+
+logger = logging.getLogger(__name__)
+
 
 def prefer(backend: Union[QtBackend, str], try_all=True):
     """
@@ -44,27 +55,33 @@ def load() -> QtBackend:
     load backends until one succeeds and returns that backend.
     :return: the first successful backend
     """
-    global loaded
-
     if loaded:
         return loaded
 
     first_err = None
+    first = priority
+    try_rest = fail_ok
+    if not first:
+        first = backends.get(os.environ.get(BACKEND_ENV))
+        try_rest = True
 
-    if priority:
+    if first:
         try:
-            priority.load()
+            first.load()
         except ImportError as e:
-            if not fail_ok:
+            if not try_rest:
                 raise
             first_err = e
         else:
-            loaded = priority
-            print(f'Using selected backend: {loaded.__name__}')
-            return loaded
+            return _loaded(first)
 
     for backend in backends.values():
-        if backend is priority:
+        if backend is first:
+            continue
+        # don't import packages that aren't installed at all
+        if not backend.available():
+            if not first_err:
+                first_err = ImportError(f'{backend.__name__} is not installed', name=backend.__name__)
             continue
 
         try:
@@ -73,10 +90,16 @@ def load() -> QtBackend:
             if not first_err:
                 first_err = e
         else:
-            loaded = backend
-            print(f'Using backend: {loaded.__name__}')
-            return loaded
+            return _loaded(backend)
 
     if not first_err:
         raise Exception('no backend are configured')
     raise Exception('all backends failed to load') from first_err
+
+
+def _loaded(backend: QtBackend):
+    global loaded
+
+    loaded = backend
+    logger.info('Using %sbackend: %s', 'selected ' if backend is priority else '', backend.__name__)
+    return loaded
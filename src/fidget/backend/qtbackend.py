@@ -5,6 +5,7 @@ from abc import ABC, abstractmethod
 from types import ModuleType
 
 from importlib import import_module
+from importlib.util import find_spec
 
 
 class QtWrapper(Enum):
@@ -37,6 +38,13 @@ class QtBackend(ABC):
         """
         pass
 
+    def available(self) -> bool:
+        """
+        :return: whether the backend might load, without importing it. A backend that is not available would surely
+         fail to load.
+        """
+        return True
+
     @abstractmethod
     def __getitem__(self, item: Tuple[str, str]):
         """
@@ -76,6 +84,9 @@ class NamePrefixQtBackend(QtBackend):
         for submodule in ['', 'QtWidgets', 'QtCore', 'QtGui']:
             self.load_module(submodule)
 
+    def available(self):
+        return self.__name__ in self.modules or find_spec(self.__name__) is not None
+
     def load_module(self, sub_name):
         if sub_name in self.modules:
             return self.modules[sub_name]
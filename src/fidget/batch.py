@@ -0,0 +1,259 @@
+"""
+Validate a stream of records against a form, headless. Each record is parsed with the joined plaintext parser of a
+template's model (see fidget.model) and validated, and one result line is written per record, in input order.
+
+Records are read from a JSONL file (a line is either a JSON string, parsed as its contents, or any other JSON, parsed
+as the line's text) or a CSV file (each row is parsed as a JSON object of its header's names, or as a JSON list of
+strings with --no-header). Records are processed in chunks over a pool of worker processes, with a bounded number of
+chunks in flight, so memory does not grow with the size of the input.
+
+Each result is a JSON line: {"record": 3, "ok": true} or {"record": 4, "ok": false, "error": "<error details>"}, where
+the record number is the line (or row) number in the input.
+
+usage: python -m fidget.batch package.module:template input.jsonl [--format jsonl|csv] [--out results.jsonl]
+    [--workers N] [--chunk-size N] [--max-pending N] [--progress SECONDS]
+"""
+from __future__ import annotations
+
+from typing import Iterable, Iterator, List, Optional, Tuple, TextIO
+from argparse import ArgumentParser
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from importlib import import_module
+from itertools import islice
+from multiprocessing import get_context
+from time import perf_counter
+import csv
+import json
+import os
+import sys
+
+from fidget.core.plaintext_adapter import try_parse
+from fidget.core.fidget_value import ParseError, ValidationError
+from fidget.core.__util__ import error_details
+
+CHUNK_SIZE = 500
+"""the number of records sent to a worker process at a time"""
+PENDING_PER_WORKER = 4
+"""the default number of chunks in flight, per worker process"""
+
+Record = Tuple[int, str]
+Result = Tuple[int, Optional[str]]
+
+_model = None
+
+
+def load_model(spec: str):
+    """
+    load a model from a "module:name" specification. The name may refer to a model, a FidgetTemplate or a Fidget
+     class.
+    :raises TypeError: if the name refers to a widget that cannot be modeled, such as a widget whose class overrides its
+     validation, since its records would not be validated like the form validates them
+    """
+    from fidget.model import Model, model_of
+
+    module_name, sep, name = spec.partition(':')
+    if not sep:
+        raise ValueError(f'expected a "module:name" specification, got {spec!r}')
+    ret = import_module(module_name)
+    for part in name.split('.'):
+        ret = getattr(ret, part)
+    if not isinstance(ret, Model):
+        ret = model_of(ret)
+    return ret
+
+
+def _init_worker(spec: str):
+    global _model
+    import fidget.core.offload as offload_mod
+
+    # the worker is already a separate process, validators marked process_safe run here rather than in a pool
+    offload_mod.INLINE = True
+    _model = load_model(spec)
+
+
+def process_record(model, text: str) -> Optional[str]:
+    """
+    parse and validate a single record
+    :return: None if the record is valid, or the details of its error
+    """
+    result = try_parse(model.joined_plaintext_parser, text)
+    if not result:
+        return error_details(result.exception)
+    try:
+        model.validate(result.value)
+    except (ParseError, ValidationError) as e:
+        return error_details(e)
+    return None
+
+
+def _process_chunk(chunk: List[Record]) -> List[Result]:
+    return [(n, process_record(_model, text)) for n, text in chunk]
+
+
+def jsonl_records(file: TextIO) -> Iterator[Record]:
+    for n, line in enumerate(file, 1):
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith('"'):
+            line = json.loads(line)
+        yield n, line
+
+
+def csv_records(file: TextIO, header=True) -> Iterator[Record]:
+    reader = csv.reader(file)
+    names = None
+    if header:
+        names = next(reader, None)
+    for n, row in enumerate(reader, 2 if header else 1):
+        if names is not None:
+            if len(row) != len(names):
+                raise ValueError(f'row {n} has {len(row)} fields, expected {len(names)}')
+            yield n, json.dumps(dict(zip(names, row)))
+        else:
+            yield n, json.dumps(row)
+
+
+def chunked(records: Iterable[Record], size: int) -> Iterator[List[Record]]:
+    records = iter(records)
+    while True:
+        chunk = list(islice(records, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def result_line(result: Result) -> str:
+    n, error = result
+    if error is None:
+        return json.dumps({'record': n, 'ok': True})
+    return json.dumps({'record': n, 'ok': False, 'error': error})
+
+
+class Throughput:
+    """
+    counts processed records, and reports the rate they are processed at
+    """
+
+    def __init__(self, interval: Optional[float] = None, stream: TextIO = sys.stderr):
+        """
+        :param interval: the minimum number of seconds between progress reports, None to only report at the end
+        :param stream: the stream to report to
+        """
+        self.interval = interval
+        self.stream = stream
+        self.records = 0
+        self.errors = 0
+        self.start = perf_counter()
+        self._last_report = self.start
+
+    def add(self, results: List[Result]):
+        self.records += len(results)
+        self.errors += sum(1 for _, e in results if e is not None)
+        if self.interval is not None:
+            now = perf_counter()
+            if now - self._last_report >= self.interval:
+                self._last_report = now
+                self.report()
+
+    def report(self):
+        elapsed = perf_counter() - self.start
+        rate = self.records / elapsed if elapsed else 0
+        print(f'{self.records} records ({self.errors} invalid) in {elapsed:.2f}s, {rate:.0f} records/s',
+              file=self.stream, flush=True)
+
+
+def run(spec: str, records: Iterable[Record], out: TextIO, workers: Optional[int] = None,
+        chunk_size: int = CHUNK_SIZE, max_pending: Optional[int] = None, throughput: Throughput = None):
+    """
+    validate records in worker processes, writing a result line for each, in order
+    :param spec: the "module:name" specification of the model, loaded in each worker
+    :param records: an iterable of record numbers and texts
+    :param out: the stream to write result lines to
+    :param workers: the number of worker processes, None to use the number of processors, 0 to process in this process
+    :param chunk_size: the number of records sent to a worker at a time
+    :param max_pending: the maximum number of chunks in flight
+    :param throughput: a Throughput to count the results in
+    :raises TypeError: if the model cannot be loaded, see load_model
+    """
+    throughput = throughput or Throughput()
+    # load the model here as well, so that a template that cannot be modeled fails before any worker is started
+    model = load_model(spec)
+
+    def write(results):
+        out.writelines(result_line(r) + '\n' for r in results)
+        throughput.add(results)
+
+    chunks = chunked(records, chunk_size)
+    if workers == 0:
+        global _model
+        _model = model
+        for chunk in chunks:
+            write(_process_chunk(chunk))
+        return throughput
+
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or workers * PENDING_PER_WORKER
+    # spawned workers start clean, rather than inheriting the state of this process
+    with ProcessPoolExecutor(max_workers=workers, mp_context=get_context('spawn'), initializer=_init_worker,
+                             initargs=(spec,)) as pool:
+        pending = deque()
+        for chunk in chunks:
+            if len(pending) >= max_pending:
+                write(pending.popleft().result())
+            pending.append(pool.submit(_process_chunk, chunk))
+        while pending:
+            write(pending.popleft().result())
+    return throughput
+
+
+def main(args=None):
+    parser = ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('template', help='the form to validate against, as "module:name"')
+    parser.add_argument('input', help='the input file, - for stdin')
+    parser.add_argument('--format', choices=('jsonl', 'csv'), default=None,
+                        help='the format of the input, by default inferred from its extension')
+    parser.add_argument('--no-header', dest='header', action='store_false',
+                        help='CSV rows are parsed as lists, rather than objects of the header row\'s names')
+    parser.add_argument('--out', default='-', help='the output file, - for stdout')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='the number of worker processes, 0 to process in the main process')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+    parser.add_argument('--max-pending', type=int, default=None)
+    parser.add_argument('--progress', type=float, default=None, metavar='SECONDS',
+                        help='report throughput periodically')
+    args = parser.parse_args(args)
+
+    # widget classes load a Qt backend when the template is imported, no display is needed
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    # import the model in this process too, so that a bad specification fails early
+    try:
+        load_model(args.template)
+    except TypeError as e:
+        parser.error(f'cannot validate against {args.template}: {e}')
+
+    input_format = args.format
+    if input_format is None:
+        input_format = 'csv' if args.input.lower().endswith('.csv') else 'jsonl'
+
+    in_file = sys.stdin if args.input == '-' else open(args.input, newline='' if input_format == 'csv' else None,
+                                                       encoding='utf-8')
+    out_file = sys.stdout if args.out == '-' else open(args.out, 'w', encoding='utf-8')
+    try:
+        if input_format == 'csv':
+            records = csv_records(in_file, header=args.header)
+        else:
+            records = jsonl_records(in_file)
+        throughput = run(args.template, records, out_file, workers=args.workers, chunk_size=args.chunk_size,
+                         max_pending=args.max_pending, throughput=Throughput(args.progress))
+    finally:
+        if in_file is not sys.stdin:
+            in_file.close()
+        if out_file is not sys.stdout:
+            out_file.close()
+    throughput.report()
+
+
+if __name__ == '__main__':
+    main()
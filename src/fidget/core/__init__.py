@@ -1,10 +1,36 @@
-from fidget.core.fidget import Fidget, DoNotFill, FidgetTemplate, TemplateLike
 from fidget.core.plaintext_adapter import \
     PlaintextPrintError, PlaintextParseError, \
     regex_parser, json_parser, \
     format_printer, formatted_string_printer, json_printer, \
-    explicit, low_priority, mid_priority, high_priority,\
+    explicit, low_priority, mid_priority, high_priority, overlapping,\
     wrap_plaintext_parser, wrap_plaintext_printer,\
-    inner_plaintext_printer, inner_plaintext_parser
+    inner_plaintext_printer, inner_plaintext_parser, \
+    ParserStats, result_parser, try_parse
+from fidget.core.result import Ok, Fail, Result
 from fidget.core.fidget_value import ParseError, ValidationError
 from fidget.core.user_util import wrap_parser, wrap_validator, validator
+from fidget.core.offload import process_safe
+
+# these names load a Qt backend, so they are only imported when first accessed (PEP 562). The rest of fidget.core
+# (and fidget.model) can be used without Qt.
+_lazy_names = {
+    'Fidget': 'fidget.core.fidget',
+    'DoNotFill': 'fidget.core.fidget',
+    'FidgetTemplate': 'fidget.core.fidget',
+    'TemplateLike': 'fidget.core.fidget',
+}
+
+
+def __getattr__(name):
+    module_name = _lazy_names.get(name)
+    if module_name is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    from importlib import import_module
+
+    ret = getattr(import_module(module_name), name)
+    globals()[name] = ret
+    return ret
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_names))
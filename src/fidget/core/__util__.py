@@ -1,13 +1,12 @@
 from __future__ import annotations
 
-from typing import Union, Callable, Any, Tuple, Type, TypeVar, Optional
-
-from fidget.backend.QtWidgets import QLabel
-from fidget.backend.QtCore import Qt, QtCore
+from typing import Union, Callable, Any, Tuple, Type, TypeVar, Optional, Generic, Hashable
 
 from functools import wraps, lru_cache
+from collections import OrderedDict
 
 T = TypeVar('T')
+K = TypeVar('K', bound=Hashable)
 
 
 def error_chain(e: Exception):
@@ -112,6 +111,10 @@ def shorten(s: str, width: int, filler='...'):
 
 
 def link_to(text: str, url: str):
+    # Qt is imported here, so the rest of the module can be used headless
+    from fidget.backend.QtWidgets import QLabel
+    from fidget.backend.QtCore import Qt
+
     ret = QLabel(f'''<a href='{url}'>{text}</a>''')
     ret.setTextInteractionFlags(Qt.LinksAccessibleByMouse)
     ret.setOpenExternalLinks(True)
@@ -137,3 +140,46 @@ def update(**kwargs):
         return func
 
     return ret
+
+
+class LRUCache(Generic[K, T]):
+    """
+    A mapping of a bounded size, that evicts its least recently used entries
+    """
+
+    def __init__(self, maxsize: int):
+        """
+        :param maxsize: the maximum number of entries to store
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[K, T] = OrderedDict()
+
+    def get(self, key: K, default=None):
+        """
+        :return: the value stored for the key, or default if there is none. Counts as a use of the key.
+        """
+        try:
+            ret = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return ret
+
+    def __setitem__(self, key: K, value: T):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+    def clear(self):
+        self._data.clear()
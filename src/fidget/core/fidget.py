@@ -1,25 +1,34 @@
 from __future__ import annotations
 
-from typing import Generic, TypeVar, Optional, Callable, Tuple, Iterable, Type, Dict, Any, Union, List
+from typing import Generic, TypeVar, Optional, Callable, Tuple, Iterable, Type, Dict, Any, Union, List, Hashable
 
 from abc import abstractmethod
 from contextlib import contextmanager
 from pathlib import Path
 from functools import partial, wraps, reduce
-from itertools import chain
+from itertools import chain, count
+from heapq import heappush, heappop, heapify
+from concurrent.futures import Future
+from weakref import WeakSet, WeakKeyDictionary
+import threading
 
 from fidget.backend.qtbackend import QtWrapper
 from fidget.backend.QtWidgets import QWidget, QPlainTextEdit, QPushButton, QComboBox, QLabel, QHBoxLayout, QVBoxLayout, \
-    QMessageBox, QFileDialog, QGroupBox, QGridLayout, QDialog, QSizePolicy, QBoxLayout
-from fidget.backend.QtCore import Qt, pyqtSignal, __backend__
+    QMessageBox, QFileDialog, QGroupBox, QGridLayout, QDialog, QSizePolicy, QBoxLayout, QScrollArea
+from fidget.backend.QtCore import Qt, pyqtSignal, QEvent, QTimer, __backend__
 
 from fidget.core.plaintext_adapter import PlaintextParseError, PlaintextPrintError, \
-    join_parsers, join_printers, PlaintextParser, PlaintextPrinter, \
-    format_spec_input_printer, formatted_string_input_printer, exec_printer, eval_printer, \
-    sort_adapters
-from fidget.core.fidget_value import FidgetValue, BadValue, GoodValue, ParseError, ValidationError
+    join_parsers, ParserStats, join_printers, PlaintextParser, PlaintextPrinter, \
+    format_spec_input_printer, formatted_string_input_printer, exec_printer, eval_printer, ScriptRun, \
+    sort_adapters, resolve_adapters, try_parse
+from fidget.core.fidget_value import FidgetValue, BadValue, GoodValue, PendingValue, ParseError, ValidationError, \
+    ValidationPending
+from fidget.core.result import Ok, Fail, Result, complete_result_method
+from fidget.core.worker import thread_pool, dispatcher
+from fidget.core.offload import is_process_safe, offload, submit, run_inline, EXECUTOR_ERRORS
+from fidget.core import profiling
 from fidget.core.primitive_questions import FontQuestion
-from fidget.core.__util__ import error_details, first_valid, error_attrs, optional_valid
+from fidget.core.__util__ import error_details, first_valid, error_attrs, optional_valid, LRUCache
 
 T = TypeVar('T')
 
@@ -52,6 +61,10 @@ class FidgetTemplate(Generic[T], TemplateLike[T]):
         self.args = args
         self.kwargs = kwargs
         self._instance: Optional[Fidget[T]] = None
+        self._pool: List[Fidget[T]] = []
+        self.pool_capacity = self.POOL_CAPACITY
+
+    POOL_CAPACITY = 64
 
     @property
     def title(self) -> Optional[str]:
@@ -95,6 +108,14 @@ class FidgetTemplate(Generic[T], TemplateLike[T]):
         """
         return self
 
+    def model(self):
+        """
+        create a headless model of the template's widget, that parses and validates without Qt
+        :raises TypeError: if the widget cannot be modeled, see fidget.model.model_of
+        """
+        from fidget.model import model_of
+        return model_of(self)
+
     def extract_default(*templates: FidgetTemplate, sink: dict, upper_space, keys: Iterable[str] = ...,
                         union=True):
         """
@@ -146,6 +167,72 @@ class FidgetTemplate(Generic[T], TemplateLike[T]):
             self._instance = self()
         return self._instance
 
+    def acquire(self) -> Fidget[T]:
+        """
+        :return: a widget of this template, reused from the template's pool if there is one. The widget should be
+            returned with release once it is no longer used.
+        """
+        if self._pool:
+            return self._pool.pop()
+        ret = self()
+        ret._pool_restore = ret.snapshot()
+        return ret
+
+    def release(self, widget: Fidget[T], *listeners: Callable):
+        """
+        return a widget acquired from this template to the template's pool. The owner's on_change listeners are
+        disconnected, the widget is restored to its initial state, forgets its cached values and is unparented. If the
+        pool is full, or the widget's state cannot be restored, the widget is deleted instead.
+        :param widget: the widget to release
+        :param listeners: the listeners the owner connected to the widget's on_change
+        """
+        for listener in listeners:
+            try:
+                widget.on_change.disconnect(listener)
+            except (TypeError, RuntimeError):
+                # the listener was not connected
+                pass
+
+        # the widget (or its descendants) might still be waiting in its window's deferred pass
+        root = widget._deferring_root()
+        restore = widget._pool_restore
+        recycle = restore is not None and len(self._pool) < self.pool_capacity
+        if recycle:
+            try:
+                restore()
+            except (ParseError, ValidationError, PlaintextParseError):
+                recycle = False
+        if root is not None and root is not widget:
+            root._forget_dirty(widget)
+        if not recycle:
+            widget.deleteLater()
+            return
+        widget._forget_cached()
+        widget.setParent(None)
+        self._pool.append(widget)
+
+    def clear_pool(self):
+        """
+        delete all the widgets in the template's pool
+        """
+        for widget in self._pool:
+            widget.deleteLater()
+        self._pool.clear()
+
+
+def _same_argument(a, b) -> bool:
+    """
+    :return: whether two arguments of an offloaded call are the same, so the call need not be repeated. The arguments
+     might not be of the widget's value type (such as those of a converter's inner), so their own equality is used.
+    """
+    if a is b:
+        return True
+    try:
+        return type(a) is type(b) and bool(a == b)
+    except Exception:
+        # arguments with undefined equality (like arrays) are never the same
+        return False
+
 
 class Fidget(QWidget, Generic[T], TemplateLike[T]):
     """
@@ -182,8 +269,20 @@ class Fidget(QWidget, Generic[T], TemplateLike[T]):
     MAKE_TITLE: bool = None
     MAKE_INDICATOR: bool = None
     MAKE_PLAINTEXT: bool = None
+    DEFER_CHANGES: bool = False
+    ASYNC_VALIDATION: bool = False
+    VALIDATION_CACHE_SIZE: int = 0
+    COMPARE_VALUES: bool = True
     FLAGS = Qt.WindowFlags()
 
+    # the number of existing widgets with defer_changes, plus the number of bulk updates in progress. If 0, no
+    # ancestor lookup is needed on change
+    _deferring_widgets = 0
+    _dirty_order = count()
+    # widgets whose indicator update was deferred because they could not be seen, by the innermost scroll area they are
+    # in (or their window, if there is none). Refreshed when their scroll area is scrolled.
+    _stale_indications: WeakKeyDictionary[QWidget, WeakSet[Fidget]] = WeakKeyDictionary()
+
     def __new__(cls, *args, **kwargs):
         ret = super().__new__(cls, *args, **kwargs)
         ret.__new_args = (args, kwargs)
@@ -197,16 +296,36 @@ class Fidget(QWidget, Generic[T], TemplateLike[T]):
                  make_indicator: bool = None,
                  make_plaintext: bool = None,
                  help: str = None,
+                 defer_changes: bool = None,
+                 async_validation: bool = None,
+                 validation_cache_size: int = None,
+                 validation_cache_key: Callable[[T], Hashable] = None,
+                 compare_values: bool = None,
+                 value_fingerprint: Callable[[T], Any] = None,
                  **kwargs):
         """
         :param title: the title of the Fidget
         :param args: additional arguments forwarded to QWidget
-        :param validation_func: a validation callable, that will raise ValidationError if the parsed value is invalid
+        :param validation_func: a validation callable, that will raise ValidationError if the parsed value is invalid.
+            If marked with process_safe, it will be run in a worker process, with the value pending until it is done.
         :param auto_func: a function that returns an automatic value, to fill in the UI
         :param make_title: whether to create a title widget
         :param make_indicator: whether to make an indicator widget
         :param make_plaintext: whether to make a plaintext_edit widget
         :param help: a help string to describe the widget
+        :param defer_changes: whether changes in the widget's window (with this widget as the outermost deferring
+            ancestor) are only marked, and propagated once per event loop iteration
+        :param async_validation: whether to run validate in a worker thread, marking the value as pending until it
+            is done. validate must then be thread-safe, and should not access any widgets.
+        :param validation_cache_size: the number of validation outcomes (including validation errors) to remember,
+            keyed by the parsed value. 0 to disable the cache. Call invalidate_validation_cache when an outside
+            state that validation depends on changes.
+        :param validation_cache_key: a function to get the cache key of a parsed value, by default, the value and
+            its type are used. The value is not cached if the key is unhashable.
+        :param compare_values: whether to compare the widget's new value with its previous one on change, and not
+            notify listeners if they are equal. Disable this for types with expensive or undefined equality.
+        :param value_fingerprint: a function to get a cheap, comparable fingerprint of a parsed value, to compare in
+            place of the value itself. By default, values are equal if they are of the same type and are equal.
         :param kwargs: additional arguments forwarded to QWidget
 
         :inheritors: don't set default values for these parameters, change the uppercase class variables instead.
@@ -228,6 +347,12 @@ class Fidget(QWidget, Generic[T], TemplateLike[T]):
         self.make_title = first_valid(make_title=make_title, MAKE_TITLE=self.MAKE_TITLE, _self=self)
         self.make_indicator = first_valid(make_indicator=make_indicator, MAKE_INDICATOR=self.MAKE_INDICATOR, _self=self)
         self.make_plaintext = first_valid(make_plaintext=make_plaintext, MAKE_PLAINTEXT=self.MAKE_PLAINTEXT, _self=self)
+        self.defer_changes = first_valid(defer_changes=defer_changes, DEFER_CHANGES=self.DEFER_CHANGES, _self=self)
+        if self.defer_changes:
+            Fidget._deferring_widgets += 1
+            self.destroyed.connect(Fidget._deferring_widget_destroyed)
+        self.async_validation = first_valid(async_validation=async_validation, ASYNC_VALIDATION=self.ASYNC_VALIDATION,
+                                            _self=self)
 
         self.indicator_label: Optional[QLabel] = None
         self.auto_button: Optional[QPushButton] = None
@@ -239,11 +364,41 @@ class Fidget(QWidget, Generic[T], TemplateLike[T]):
         self.validation_func = validation_func
         self.auto_func = optional_valid(auto_func=auto_func, AUTO_FUNC=self.AUTO_FUNC, _self=self)
 
+        validation_cache_size = first_valid(validation_cache_size=validation_cache_size,
+                                            VALIDATION_CACHE_SIZE=self.VALIDATION_CACHE_SIZE, _self=self)
+        self._validation_cache: Optional[LRUCache[Hashable, Optional[ValidationError]]] = \
+            LRUCache(validation_cache_size) if validation_cache_size else None
+        self.validation_cache_key = optional_valid(validation_cache_key=validation_cache_key,
+                                                   VALIDATION_CACHE_KEY=self.VALIDATION_CACHE_KEY, _self=self)
+        self.compare_values = first_valid(compare_values=compare_values, COMPARE_VALUES=self.COMPARE_VALUES,
+                                          _self=self)
+        self.value_fingerprint = optional_valid(value_fingerprint=value_fingerprint,
+                                                VALUE_FINGERPRINT=self.VALUE_FINGERPRINT, _self=self)
+
         self._suppress_update = False
+        self._bulk_depth = 0
+        self._indication_stale = False
+        self._stale_in: Optional[WeakSet[Fidget]] = None
+        self._pool_restore: Optional[Callable[[], None]] = None
+
+        self._dirty_queue: List[Tuple[int, int, Fidget]] = []
+        self._dirty: set = set()
+        self._flush_scheduled = False
+        self._flushing = False
 
         self._value: FidgetValue[T] = None
+        # the value listeners were last notified of
+        self._published_value: Optional[FidgetValue[T]] = None
+        self._validation_future: Optional[Future] = None
+        # the latest call of each process-safe function run by offloaded: its argument and future
+        self._offloaded_calls: Dict[Callable, Tuple[Any, Future]] = {}
         self._joined_plaintext_printer = None
         self._joined_plaintext_parser = None
+        self._parser_stats: Optional[ParserStats] = None
+        self._implicit_plaintext_printers: Optional[Tuple[PlaintextPrinter[T], ...]] = None
+        self._implicit_plaintext_parsers: Optional[Tuple[PlaintextParser[T], ...]] = None
+        # widgets whose plaintext adapters are derived from this widget's adapters
+        self._plaintext_dependents: WeakSet[Fidget] = WeakSet()
 
         self._plaintext_printer_delegates: List[Callable[[], Iterable[PlaintextPrinter[T]]]] = []
         self._plaintext_parser_delegates: List[Callable[[], Iterable[PlaintextParser[T]]]] = []
@@ -268,6 +423,7 @@ class Fidget(QWidget, Generic[T], TemplateLike[T]):
             self.indicator_label.setTextInteractionFlags(Qt.LinksAccessibleByMouse)
             self.indicator_label.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Fixed)
             self.indicator_label.linkActivated.connect(self._detail_button_clicked)
+            self.indicator_label.installEventFilter(self)
 
         if self.make_auto:
             self.auto_button = QPushButton('auto')
@@ -292,6 +448,8 @@ class Fidget(QWidget, Generic[T], TemplateLike[T]):
     # note that this function shouldn't be called form outside!, only call fill_value
     fill: Optional[Callable[[Fidget[T], T], None]] = None
     AUTO_FUNC: Optional[Callable[[Fidget[T]], T]] = None
+    VALIDATION_CACHE_KEY: Optional[Callable[[T], Hashable]] = None
+    VALUE_FINGERPRINT: Optional[Callable[[T], Any]] = None
 
     @abstractmethod
     def parse(self) -> T:
@@ -301,6 +459,17 @@ class Fidget(QWidget, Generic[T], TemplateLike[T]):
         """
         pass
 
+    def parse_result(self) -> Result[T]:
+        """
+        Parse the internal UI like parse, but return the error rather than raise it.
+        :return: an Ok of the parsed value, or a Fail of the error
+        :inheritors: override either parse or parse_result, the other is completed when the class is created
+        """
+        try:
+            return Ok(self.parse())
+        except (ValidationError, ParseError, ValidationPending) as e:
+            return Fail.of(e)
+
     def validate(self, value: T) -> None:
         """
         Raise a ValidationError if the value is invalid
@@ -308,7 +477,52 @@ class Fidget(QWidget, Generic[T], TemplateLike[T]):
         :inheritors: always call super().validate
         """
         if self.validation_func:
-            self.validation_func(value)
+            if is_process_safe(self.validation_func):
+                self.offloaded(self.validation_func, value)
+            else:
+                self.validation_func(value)
+
+    def offloaded(self, func: Callable[[Any], T], arg) -> T:
+        """
+        run a process-safe function in the process pool, without blocking the GUI thread. The widget's value is
+         re-processed once the function is done, and the call is then repeated to get the result. Outside the GUI
+         thread (such as in asynchronous validation), the function's result is waited for.
+        :param func: the function to run
+        :param arg: the argument to call it with
+        :return: the function's result, if it is done
+        :raises ValidationPending: if the function is still running
+        """
+        if threading.current_thread() is not threading.main_thread():
+            return offload(func, arg)
+        call = self._offloaded_calls.get(func)
+        if call is not None and _same_argument(call[0], arg):
+            future = call[1]
+        else:
+            try:
+                future = submit(func, arg)
+            except EXECUTOR_ERRORS:
+                future = run_inline(func, arg)
+            else:
+                dispatcher().when_done(future, partial(self._offloaded_done, func))
+            self._offloaded_calls[func] = arg, future
+        if not future.done():
+            raise ValidationPending('waiting for a worker process')
+        try:
+            return future.result()
+        except EXECUTOR_ERRORS:
+            # the worker process died (and the pool was discarded), the call is repeated in this process, rather than
+            #  raising an error that is neither a parse nor a validation error
+            future = run_inline(func, arg)
+            self._offloaded_calls[func] = arg, future
+            return future.result()
+
+    def _offloaded_done(self, func, future: Future):
+        """
+        called in the GUI thread when an offloaded call is done, re-processing the value if the call is still current
+        """
+        call = self._offloaded_calls.get(func)
+        if call is not None and call[1] is future:
+            self.change_value()
 
     @classmethod
     def cls_plaintext_printers(cls) -> Iterable[PlaintextPrinter[T]]:
@@ -360,15 +574,49 @@ class Fidget(QWidget, Generic[T], TemplateLike[T]):
         if call_on_exit:
             self.change_value()
 
+    @contextmanager
+    def bulk_update(self):
+        """
+        A context manager, while called, changes to the widget and all its descendants are only marked, without
+        updating indicators, emitting on_change or re-parsing parents. When exited, every changed widget is
+        re-evaluated once, deepest first, and the widget emits on_change at most once.
+        >>> with matrix.bulk_update():
+        ...     for inner, v in zip(cells, values):
+        ...         inner.fill_value(v)
+        """
+        self._bulk_depth += 1
+        Fidget._deferring_widgets += 1
+        try:
+            yield self
+        finally:
+            try:
+                if self._bulk_depth == 1:
+                    # the widget itself is re-evaluated even if no descendant reported a change
+                    self.change_value()
+                    if self._deferring_root() is self:
+                        self.flush_changes()
+            finally:
+                self._bulk_depth -= 1
+                Fidget._deferring_widgets -= 1
+
     @property
     def joined_plaintext_parser(self):
         """
         :return: A joining of the widget's plaintext parsers
         """
         if not self._joined_plaintext_parser:
-            self._joined_plaintext_parser = join_parsers(self.plaintext_parsers)
+            self._joined_plaintext_parser = join_parsers(self.plaintext_parsers, self._parser_stats)
         return self._joined_plaintext_parser
 
+    def share_parser_stats(self, stats: Optional[ParserStats]):
+        """
+        have the widget's joined plaintext parser learn which parsers succeed together with other widgets that share
+         the stats, such as the other cells of a column
+        :param stats: the stats to share, or None for the joined parser to have its own
+        """
+        self._parser_stats = stats
+        self._joined_plaintext_parser = None
+
     @property
     def joined_plaintext_printer(self):
         """
@@ -379,30 +627,47 @@ class Fidget(QWidget, Generic[T], TemplateLike[T]):
         return self._joined_plaintext_printer
 
     def implicit_plaintext_parsers(self):
-        for parser, priority in sort_adapters(self.plaintext_parsers()):
-            if priority < 0:
-                return
-            yield parser
+        if self._implicit_plaintext_parsers is None:
+            self._implicit_plaintext_parsers = resolve_adapters(self.plaintext_parsers())
+        return iter(self._implicit_plaintext_parsers)
 
     def implicit_plaintext_printers(self):
-        for printer, priority in sort_adapters(self.plaintext_printers()):
-            if priority < 0:
-                return
-            yield printer
+        if self._implicit_plaintext_printers is None:
+            self._implicit_plaintext_printers = resolve_adapters(self.plaintext_printers())
+        return iter(self._implicit_plaintext_printers)
 
     @classmethod
     def implicit_cls_plaintext_parsers(cls):
-        for parser, priority in sort_adapters(cls.cls_plaintext_parsers()):
-            if priority < 0:
-                return
-            yield parser
+        ret = cls.__dict__.get('_implicit_cls_plaintext_parsers')
+        if ret is None:
+            ret = resolve_adapters(cls.cls_plaintext_parsers())
+            cls._implicit_cls_plaintext_parsers = ret
+        return iter(ret)
 
     @classmethod
     def implicit_cls_plaintext_printers(cls):
-        for printer, priority in sort_adapters(cls.cls_plaintext_printers()):
-            if priority < 0:
-                return
-            yield printer
+        ret = cls.__dict__.get('_implicit_cls_plaintext_printers')
+        if ret is None:
+            ret = resolve_adapters(cls.cls_plaintext_printers())
+            cls._implicit_cls_plaintext_printers = ret
+        return iter(ret)
+
+    def invalidate_plaintext_adapters(self):
+        """
+        Discard the widget's resolved plaintext adapters, and those of all widgets that derive their adapters from it.
+        Call this whenever the adapters the widget generates change.
+        """
+        self._joined_plaintext_parser = self._joined_plaintext_printer = None
+        self._implicit_plaintext_parsers = self._implicit_plaintext_printers = None
+        for dependent in list(self._plaintext_dependents):
+            dependent.invalidate_plaintext_adapters()
+
+    def depend_on_plaintext_adapters(self, other: Fidget):
+        """
+        Declare that the widget's plaintext adapters are derived from another widget's adapters, so that the widget's
+        resolved adapters are invalidated along with the other's.
+        """
+        other._plaintext_dependents.add(self)
 
     def provided_pre(self, exclude=()):
         """
@@ -448,13 +713,46 @@ class Fidget(QWidget, Generic[T], TemplateLike[T]):
 
     # region call_me_from_outside
     def maybe_parse(self):
-        if self._value is None or not self._value.is_ok():
+        """
+        parse the widget, reusing the cached value or parse error if there is one
+        """
+        if self._value is None:
             return self.parse()
-        return self._value.value
+        if self._value.is_ok():
+            return self._value.value
+        if self._value.parsed_value is not ...:
+            return self._value.parsed_value
+        raise self._value.exception.with_traceback(None)
+
+    def maybe_parse_result(self) -> Result[T]:
+        """
+        parse the widget like maybe_parse, but return the error rather than raise it
+        """
+        if self._value is None:
+            return self.parse_result()
+        if self._value.is_ok():
+            return Ok(self._value.value)
+        if self._value.parsed_value is not ...:
+            return Ok(self._value.parsed_value)
+        return self._value.fail
 
     def maybe_validate(self, v):
+        """
+        validate a value parsed by maybe_parse, reusing the cached validation error if there is one
+        """
         if self._value is None:
-            self.validate(v)
+            self._validate_cached(v, self._validation_key(v))
+        elif not self._value.is_ok() and self._value.parsed_value is not ...:
+            raise self._value.exception.with_traceback(None)
+
+    def invalidate_validation_cache(self):
+        """
+        forget all the remembered validation outcomes, and re-process the current value. Call this when an outside
+        state that validation depends on (such as the file system) changes.
+        """
+        if self._validation_cache is not None:
+            self._validation_cache.clear()
+        self.change_value()
 
     def fill_from_text(self, s: str):
         """
@@ -469,6 +767,10 @@ class Fidget(QWidget, Generic[T], TemplateLike[T]):
         """
         :return: the current value of the widget
         """
+        root = self._deferring_root()
+        # values requested during the root's deferred pass are already up to date
+        if root is not None and root._dirty and not root._flushing:
+            root.flush_changes()
         if self._value is None:
             self._reload_value()
         return self._value
@@ -478,9 +780,37 @@ class Fidget(QWidget, Generic[T], TemplateLike[T]):
         a slot to refresh the value of the widget
         """
         self._invalidate_value()
+        root = self._deferring_root()
+        if root is not None:
+            root._mark_dirty(self)
+            return
+        if self._value_unchanged():
+            return
         self._update_indicator()
         self.on_change.emit()
 
+    def flush_changes(self):
+        """
+        Process all the changes pending in the widget's deferred propagation immediately. Each dirty widget is
+        re-evaluated once, deepest first, before emitting its on_change.
+        """
+        root = self._deferring_root() or self
+        if root._flushing:
+            return
+        root._flush_scheduled = False
+        root._flushing = True
+        try:
+            while root._dirty_queue:
+                _, _, fidget = heappop(root._dirty_queue)
+                root._dirty.discard(fidget)
+                if fidget._value_unchanged():
+                    continue
+                fidget._update_indicator()
+                # ancestors listening to on_change are marked dirty and handled later in this same loop
+                fidget.on_change.emit()
+        finally:
+            root._flushing = False
+
     _template_class: Type[FidgetTemplate[T]] = FidgetTemplate
 
     @classmethod
@@ -517,19 +847,33 @@ class Fidget(QWidget, Generic[T], TemplateLike[T]):
             return super().__str__()
 
     def fill_value(self, *args, **kwargs):
-        with self.suppress_update():
+        with self.bulk_update():
             return self.fill(*args, **kwargs)
 
+    def snapshot(self) -> Optional[Callable[[], None]]:
+        """
+        :return: a callable that returns the widget to its current state, or None if the state cannot be restored.
+            The state is recorded as the raw parsed value, without validating it.
+        :inheritors: override this if the state can be restored even when the widget cannot be parsed
+        """
+        if not self.fill:
+            return None
+        parsed = self.parse_result()
+        if not parsed:
+            return None
+        return partial(self.fill_value, parsed.value)
+
     def add_plaintext_printers_delegate(self, delegate: Callable[[], Iterable[PlaintextPrinter[T]]]):
         self._plaintext_printer_delegates.append(delegate)
-        self._joined_plaintext_printer = None
+        self.invalidate_plaintext_adapters()
 
     def add_plaintext_parsers_delegate(self, delegate: Callable[[], Iterable[PlaintextParser[T]]]):
         self._plaintext_parser_delegates.append(delegate)
-        self._joined_plaintext_parser = None
+        self.invalidate_plaintext_adapters()
 
     def add_plaintext_delegates(self, clone: Union[Fidget, Type[Fidget]]):
         if isinstance(clone, Fidget):
+            self.depend_on_plaintext_adapters(clone)
             self.add_plaintext_parsers_delegate(clone.plaintext_parsers)
             self.add_plaintext_printers_delegate(clone.plaintext_printers)
         elif isinstance(clone, type) and issubclass(clone, Fidget):
@@ -540,11 +884,108 @@ class Fidget(QWidget, Generic[T], TemplateLike[T]):
 
     # endregion
 
+    @staticmethod
+    def _deferring_widget_destroyed(*args):
+        """
+        a slot for when a widget with defer_changes is destroyed
+        """
+        Fidget._deferring_widgets -= 1
+
+    def _deferring_root(self) -> Optional[Fidget]:
+        """
+        :return: the outermost widget in this widget's window that defers changes, or None if there is none
+        """
+        if not Fidget._deferring_widgets:
+            return None
+        ret = None
+        w = self
+        while w is not None:
+            if isinstance(w, Fidget) and (w.defer_changes or w._bulk_depth):
+                ret = w
+            if w.isWindow():
+                break
+            w = w.parentWidget()
+        return ret
+
+    def _forget_dirty(self, fidget: Fidget):
+        """
+        drop a descendant widget, and its own descendants, from the next deferred pass, such as when it is removed
+        """
+        if not self._dirty:
+            return
+        self._dirty_queue = [e for e in self._dirty_queue if not (e[2] is fidget or fidget.isAncestorOf(e[2]))]
+        heapify(self._dirty_queue)
+        self._dirty = {e[2] for e in self._dirty_queue}
+
+    def _forget_cached(self):
+        """
+        forget the values cached from the widget's previous states, such as when it is returned to a template's pool
+        :inheritors: extend this to forget caches of parsed values, calling super
+        """
+        self._invalidate_value()
+        self._published_value = None
+        self._offloaded_calls.clear()
+
+    def _mark_dirty(self, fidget: Fidget):
+        """
+        mark a descendant widget for re-evaluation in the next deferred pass
+        """
+        if fidget in self._dirty:
+            return
+        depth = 0
+        w = fidget.parentWidget()
+        while w is not None:
+            depth += 1
+            w = w.parentWidget()
+        self._dirty.add(fidget)
+        heappush(self._dirty_queue, (-depth, next(self._dirty_order), fidget))
+        if not (self._flushing or self._flush_scheduled or self._bulk_depth):
+            # a bulk update flushes its changes when it is exited
+            self._flush_scheduled = True
+            QTimer.singleShot(0, self.flush_changes)
+
+    def _value_unchanged(self) -> bool:
+        """
+        Check whether the widget's value is equal to the value listeners were last notified of, in which case there
+        is no need to notify them again. The current value is remembered as notified otherwise.
+        """
+        if not self.compare_values or self._suppress_update:
+            # while updates are suppressed, the value is not processed at all
+            return False
+        if not self._indication_visible():
+            # the value of a widget that can't be seen is only processed when requested
+            self._published_value = None
+            return False
+        prev = self._published_value
+        new = self._published_value = self.value()
+        if prev is None or not (prev.is_ok() and new.is_ok()):
+            return False
+        return self._values_equal(prev.value, new.value)
+
+    def _values_equal(self, a: T, b: T) -> bool:
+        """
+        :return: whether two parsed values are equal, by their fingerprints if the widget has a fingerprint function
+        """
+        if a is b:
+            return True
+        try:
+            if self.value_fingerprint:
+                return bool(self.value_fingerprint(a) == self.value_fingerprint(b))
+            # equal values of different types (like 1 and True) are printed differently
+            return type(a) is type(b) and bool(a == b)
+        except (TypeError, ValueError):
+            # values with undefined equality (like arrays) are never equal
+            return False
+
     def _invalidate_value(self):
         """
         Mark the cached value is invalid, forcing it to be re-processed when needed next
         """
         self._value = None
+        if self._validation_future is not None:
+            # the value being validated is stale, there is no need to start validating it
+            self._validation_future.cancel()
+            self._validation_future = None
 
     def _auto_btn_click(self, click_args):
         """
@@ -568,22 +1009,40 @@ class Fidget(QWidget, Generic[T], TemplateLike[T]):
 
     def _update_indicator(self, *args):
         """
-        update whatever indicators need updating when the value is changed
+        update whatever indicators need updating when the value is changed. If the widget can't be seen, the update is
+        deferred until it is shown, enabled, or scrolled into view.
         """
         if self._suppress_update:
             return
 
+        if not self._indication_visible():
+            self._mark_indication_stale()
+            return
+
+        self._refresh_indication()
+
+    def _refresh_indication(self):
+        """
+        update the indicators to the widget's current value
+        """
+        if self._indication_stale:
+            self._indication_stale = False
+            self._stale_in.discard(self)
+            self._stale_in = None
+
         value = self.value()
 
         if self.indicator_label and self.indicator_label.parent():
             if value.is_ok():
                 text = "<a href='...'>OK</a>"
+            elif value.is_pending():
+                text = "<a href='...'>...</a>"
             else:
                 text = "<a href='...'>ERR</a>"
-            tooltip = value.short_details
 
             self.indicator_label.setText(text)
-            self.indicator_label.setToolTip(tooltip)
+            # the tooltip is only rendered when requested, see eventFilter
+            self.indicator_label.indicated_value = value
 
         if self.plaintext_button:
             self.plaintext_button.setEnabled(value.is_ok() or any(self.plaintext_parsers()))
@@ -595,18 +1054,108 @@ class Fidget(QWidget, Generic[T], TemplateLike[T]):
         reload the cached value
         """
         assert self._value is None, '_reload called when a value is cached'
+        result = self.parse_result()
+        if not result:
+            if issubclass(result.exc_type, ValidationPending):
+                self._value = PendingValue()
+            else:
+                self._value = BadValue.from_error(result)
+            return
+        value = result.value
+
+        key = self._validation_key(value)
+        if self.async_validation and (key is ... or key not in self._validation_cache):
+            self._value = PendingValue(value)
+            self._validation_future = thread_pool().submit(self.validate, value)
+            dispatcher().when_done(self._validation_future, partial(self._async_validated, self._value, key))
+            return
+
         try:
-            value = self.parse()
-            self.validate(value)
+            self._validate_cached(value, key)
         except (ValidationError, ParseError) as e:
-            self._value = BadValue.from_error(e)
+            self._value = BadValue.from_error(e, value)
+            return
+        except ValidationPending:
+            self._value = PendingValue(value)
+            return
+
+        self._value = GoodValue(value, partial(self._value_details, value))
+
+    def _async_validated(self, pending: PendingValue[T], key, future: Future):
+        """
+        called in the GUI thread when an asynchronous validation is done
+        :param pending: the pending value that was being validated
+        :param key: the key of the value in the validation cache, or ... if it is not cached
+        :param future: the future of the validation
+        """
+        if self._value is not pending or future.cancelled():
+            # the value has changed since, the result is stale
             return
+        self._validation_future = None
+        value = pending.parsed_value
+        e = future.exception()
+        if e is None:
+            if key is not ...:
+                self._validation_cache[key] = None
+            self._value = GoodValue(value, partial(self._value_details, value))
+        elif isinstance(e, (ValidationError, ParseError)):
+            if key is not ... and isinstance(e, ValidationError):
+                self._validation_cache[key] = e
+            self._value = BadValue.from_error(e, value)
+        elif isinstance(e, ValidationPending):
+            # an inner widget is still pending, its change will trigger another validation
+            return
+        else:
+            raise e
 
+        self._published_value = self._value
+        self._update_indicator()
+        self.on_change.emit()
+
+    def _validation_key(self, value: T):
+        """
+        :return: the key of a parsed value in the validation cache, or ... if it should not be cached
+        """
+        if self._validation_cache is None:
+            return ...
+        try:
+            if self.validation_cache_key:
+                key = self.validation_cache_key(value)
+            else:
+                # the type is part of the key, so that equal values of different types (like 1 and True) are distinct
+                key = (type(value), value)
+            hash(key)
+        except TypeError:
+            return ...
+        return key
+
+    def _validate_cached(self, value: T, key):
+        """
+        validate a value, reusing a remembered outcome for its key if there is one
+        :param key: the key of the value in the validation cache, or ... if it is not cached
+        """
+        if key is ...:
+            self.validate(value)
+            return
+        outcome = self._validation_cache.get(key, ...)
+        if outcome is ...:
+            try:
+                self.validate(value)
+            except ValidationError as e:
+                self._validation_cache[key] = e
+                raise
+            self._validation_cache[key] = None
+        elif outcome is not None:
+            raise outcome.with_traceback(None)
+
+    def _value_details(self, value: T) -> str:
+        """
+        print the details of a value, called lazily when a value's details are first needed
+        """
         try:
-            details = self.joined_plaintext_printer(value)
+            return self.joined_plaintext_printer(value)
         except PlaintextPrintError as e:
-            details = 'details could not be loaded because of a parser error:\n' + error_details(e)
-        self._value = GoodValue(value, details)
+            return 'details could not be loaded because of a parser error:\n' + error_details(e)
 
     def _detail_button_clicked(self, event):
         """
@@ -621,6 +1170,92 @@ class Fidget(QWidget, Generic[T], TemplateLike[T]):
             if offender:
                 offender.setFocus()
 
+    def _indication_visible(self) -> bool:
+        """
+        :return: whether any of the widget's indication can currently be seen
+        """
+        if self.indicator_label is not None and self.indicator_label.isVisible():
+            target = self.indicator_label
+        elif self.isVisible() and self.isEnabled():
+            target = self
+        else:
+            return False
+        return not target.visibleRegion().isEmpty()
+
+    def _mark_indication_stale(self):
+        """
+        defer the widget's indicator update until it can be seen
+        """
+        self._indication_stale = True
+        viewport = self.parentWidget()
+        while viewport is not None and not isinstance(viewport, QScrollArea):
+            viewport = viewport.parentWidget()
+        if viewport is None:
+            viewport = self.window()
+        stale = Fidget._stale_indications.get(viewport)
+        if stale is None:
+            stale = Fidget._stale_indications[viewport] = WeakSet()
+        if self._stale_in is not stale:
+            # the widget might have been moved since it was last marked
+            if self._stale_in is not None:
+                self._stale_in.discard(self)
+            stale.add(self)
+            self._stale_in = stale
+
+    def _track_scroll_area(self, scroll_area: QScrollArea):
+        """
+        refresh deferred indications of widgets that are scrolled into view in a scroll area
+        """
+        refresh = partial(Fidget._refresh_stale_indications, scroll_area)
+        for bar in (scroll_area.verticalScrollBar(), scroll_area.horizontalScrollBar()):
+            bar.valueChanged.connect(refresh)
+            bar.rangeChanged.connect(refresh)
+
+    @staticmethod
+    def _refresh_stale_indications(scroll_area: QScrollArea, *args):
+        """
+        refresh the deferred indications of widgets in a scroll area (including scroll areas nested in it) that came
+        into view
+        """
+        for viewport, stale in list(Fidget._stale_indications.items()):
+            try:
+                if viewport is not scroll_area and not scroll_area.isAncestorOf(viewport):
+                    continue
+            except RuntimeError:
+                # the viewport was deleted
+                del Fidget._stale_indications[viewport]
+                continue
+            for fidget in list(stale):
+                try:
+                    visible = fidget._indication_visible()
+                except RuntimeError:
+                    # the widget was deleted
+                    stale.discard(fidget)
+                    continue
+                if visible:
+                    fidget._refresh_indication()
+            if not stale:
+                Fidget._stale_indications.pop(viewport, None)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._indication_stale:
+            self._refresh_indication()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.EnabledChange and self._indication_stale and self.isEnabled():
+            self._refresh_indication()
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.ToolTip and watched is self.indicator_label:
+            if self._indication_stale:
+                self._refresh_indication()
+            value = getattr(watched, 'indicated_value', None)
+            if value is not None:
+                watched.setToolTip(value.short_details)
+        return super().eventFilter(watched, event)
+
     def _help_clicked(self, event):
         """
         show help message
@@ -653,6 +1288,7 @@ class Fidget(QWidget, Generic[T], TemplateLike[T]):
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
         cls.on_change = pyqtSignal()
+        complete_result_method(cls, 'parse', Fidget.parse_result)
 
         inner_printers = []
         inner_parsers = []
@@ -694,6 +1330,9 @@ class Fidget(QWidget, Generic[T], TemplateLike[T]):
 
             cls._inner_cls_plaintext_parsers = classmethod(inner_cls_parsers_func)
 
+        if profiling.active_profiler() is not None:
+            profiling.instrument(cls)
+
 
 class DoNotFill(Exception):
     """
@@ -734,6 +1373,7 @@ class PlaintextEditWidget(Generic[T], Fidget[T]):
         self.print_widget: QWidget = None
         self.print_edit: QPlainTextEdit = None
         self.print_combo: QComboBox = None
+        self.print_cancel_button: QPushButton = None
         self.ok_button: QPushButton = None
         self.apply_button: QPushButton = None
 
@@ -745,6 +1385,8 @@ class PlaintextEditWidget(Generic[T], Fidget[T]):
         self.parse_combo: QComboBox = None
 
         self.owner: Fidget = kwargs.get('parent')
+        # the script of the current printer, if it is still running
+        self._script_run: Optional[ScriptRun] = None
 
         self.init_ui()
 
@@ -771,6 +1413,10 @@ class PlaintextEditWidget(Generic[T], Fidget[T]):
         file_button.clicked.connect(self.save_file)
         print_extras_layout.addWidget(file_button, 0, 0)
         print_extras_layout.addWidget(self.print_combo, 1, 0)
+        self.print_cancel_button = QPushButton('cancel script')
+        self.print_cancel_button.clicked.connect(self._cancel_script)
+        self.print_cancel_button.setVisible(False)
+        print_extras_layout.addWidget(self.print_cancel_button, 2, 0)
 
         print_layout.addLayout(print_extras_layout)
 
@@ -826,15 +1472,15 @@ class PlaintextEditWidget(Generic[T], Fidget[T]):
 
         return master_layout
 
-    def parse(self):
+    def parse_result(self):
         parser: PlaintextParser = self.parse_combo.currentData()
         if not parser:
-            raise ParseError('no parser configured', offender=self.parse_combo)
+            return Fail(ParseError, 'no parser configured', offender=self.parse_combo)
 
-        try:
-            return parser(self.parse_edit.toPlainText())
-        except PlaintextParseError as e:
-            raise ParseError(offender=self.parse_edit) from e
+        result = try_parse(parser, self.parse_edit.toPlainText())
+        if not result:
+            return Fail(ParseError, offender=self.parse_edit, cause=result)
+        return result
 
     def load_file(self, *args):
         filename, _ = QFileDialog.getOpenFileName(self, 'open file', filter='text files (*.txt *.csv);;all files (*.*)')
@@ -859,6 +1505,7 @@ class PlaintextEditWidget(Generic[T], Fidget[T]):
             QMessageBox.critical(self, 'could not write to file', str(e))
 
     def update_print(self, *args):
+        self._discard_script()
         if self.current_value is self.NO_CURRENT_VALUE:
             text = '<no current value>'
         else:
@@ -866,13 +1513,52 @@ class PlaintextEditWidget(Generic[T], Fidget[T]):
             if not printer:
                 text = '<no printer configured>'
             else:
+                # printers that run user scripts are started here, and deliver their result once the script is done
+                start = getattr(printer, 'start', None)
                 try:
-                    text = printer(self.current_value)
+                    if start:
+                        self._script_run = start(self.current_value)
+                    else:
+                        text = printer(self.current_value)
                 except PlaintextPrintError as e:
                     text = f'<printer error>\n{error_details(e)}'
+                else:
+                    if start:
+                        text = '<running script...>'
+                        self.print_cancel_button.setVisible(True)
+                        dispatcher().when_done(self._script_run.future, partial(self._script_done, self._script_run))
 
         self.print_edit.setPlainText(text)
 
+    def _script_done(self, run: ScriptRun, future: Future[str]):
+        if run is not self._script_run:
+            # the run was replaced by another print
+            return
+        self._script_run = None
+        self.print_cancel_button.setVisible(False)
+        try:
+            text = future.result()
+        except PlaintextPrintError as e:
+            text = f'<printer error>\n{error_details(e)}'
+        self.print_edit.setPlainText(text)
+
+    def _cancel_script(self, *args):
+        if self._script_run:
+            self._script_run.cancel()
+
+    def _discard_script(self):
+        """
+        cancel the script still running, without reporting it
+        """
+        if self._script_run:
+            run, self._script_run = self._script_run, None
+            run.cancel()
+            self.print_cancel_button.setVisible(False)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._discard_script()
+
     def prep_for_show(self, clear_parse=True, clear_print=True):
         """
         prepare a dialog with a new owner and value.
@@ -962,7 +1648,7 @@ class PlaintextEditWidget(Generic[T], Fidget[T]):
         if not value.is_ok():
             QMessageBox.critical(self, 'error parsing plaintext', value.details)
         else:
-            self.owner.fill(value.value)
+            self.owner.fill_value(value.value)
             self.close()
 
     def apply_parse(self):
@@ -970,7 +1656,7 @@ class PlaintextEditWidget(Generic[T], Fidget[T]):
         if not value.is_ok():
             QMessageBox.critical(self, 'error parsing plaintext', value.details)
         else:
-            self.owner.fill(value.value)
+            self.owner.fill_value(value.value)
             self.prep_for_show(clear_parse=False, clear_print=False)
             self.parse_edit.setFocus()
 
@@ -1026,3 +1712,6 @@ class PlaintextEditWidget(Generic[T], Fidget[T]):
             self.close()
         else:
             super().keyPressEvent(event)
+
+
+profiling.profile_from_env()
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from functools import partial
+from typing import Generic, TypeVar, Union, Callable, TYPE_CHECKING
 
-from fidget.backend.QtWidgets import QWidget
 from fidget.core.__util__ import error_details, shorten
+from fidget.core.result import Fail
+
+if TYPE_CHECKING:
+    from fidget.backend.QtWidgets import QWidget
 
 T = TypeVar('T')
 
@@ -33,25 +37,54 @@ class ValidationError(ChildWidgetError, Generic[T]):
     pass
 
 
+class ValidationPending(ChildWidgetError):
+    """
+    raised when a value cannot be validated yet, because its validation (or that of a child) is still running
+    """
+    pass
+
+
 class FidgetValue(ABC):
     """
     A value of a Fidget, representing either a valid processed value or an error
     """
     SHORT_WIDTH = 50
 
-    def __init__(self, type_details: str, details: str, short_details: str = ...):
+    def __init__(self, type_details: str, details: Union[str, Callable[[], str]],
+                 short_details: Union[str, Callable[[], str]] = ...):
         """
         :param type_details: a description of the type of the value's state, either an error name or a type name
-        :param details: a detailed description of the value
-        :param short_details: a short description of the value
+        :param details: a detailed description of the value, or a callable to create it when it is first needed
+        :param short_details: a short description of the value, or a callable to create it when it is first needed
         """
-        self.details = details
-        if short_details is ...:
-            short_details = self.details
-        short_details = shorten(short_details, self.SHORT_WIDTH)
-        self.short_details = short_details
+        self._details = details
+        self._short_details = short_details
+        self._shortened_details: str = None
         self.type_details = type_details
 
+    @property
+    def details(self) -> str:
+        """
+        a detailed description of the value, computed on first access
+        """
+        if callable(self._details):
+            self._details = self._details()
+        return self._details
+
+    @property
+    def short_details(self) -> str:
+        """
+        a shortened description of the value, computed on first access
+        """
+        if self._shortened_details is None:
+            short_details = self._short_details
+            if short_details is ...:
+                short_details = self.details
+            elif callable(short_details):
+                short_details = short_details()
+            self._shortened_details = shorten(short_details, self.SHORT_WIDTH)
+        return self._shortened_details
+
     @abstractmethod
     def is_ok(self) -> bool:
         """
@@ -59,6 +92,12 @@ class FidgetValue(ABC):
         """
         pass
 
+    def is_pending(self) -> bool:
+        """
+        :return: whether the value is still being validated
+        """
+        return False
+
     def __str__(self):
         return f'{type(self).__name__}: {self.details}'
 
@@ -68,8 +107,8 @@ class GoodValue(Generic[T], FidgetValue):
     A processed value
     """
 
-    def __init__(self, value, details):
-        super().__init__(type(value).__name__, details, str(value))
+    def __init__(self, value, details: Union[str, Callable[[], str]]):
+        super().__init__(type(value).__name__, details, partial(str, value))
         self.value = value
 
     def is_ok(self):
@@ -87,22 +126,36 @@ class BadValue(Generic[ET], FidgetValue):
     An error during processing
     """
 
-    def __init__(self, exc: ET):
-        details = error_details(exc)
-        short = details.splitlines(keepends=False)[0]
-        super().__init__(type(exc).__name__, details, short)
-        self.exception = exc
+    def __init__(self, exc: Union[ET, Fail], parsed_value=...):
+        """
+        :param exc: the error, or a failure whose error is only created when it is first needed
+        :param parsed_value: the value that was parsed before the error was raised, if any
+        """
+        self.fail = exc if isinstance(exc, Fail) else Fail.of(exc)
+        super().__init__(self.fail.exc_type.__name__, self._error_details, self._first_line)
+        self.parsed_value = parsed_value
+
+    @property
+    def exception(self) -> ET:
+        return self.fail.exception
+
+    def _error_details(self):
+        return error_details(self.exception)
+
+    def _first_line(self):
+        return self.details.splitlines(keepends=False)[0]
 
     def is_ok(self):
         return False
 
     @staticmethod
-    def from_error(exc):
-        if isinstance(exc, ParseError):
-            return Unparseable(exc)
-        if isinstance(exc, ValidationError):
-            return Invalid(exc)
-        raise TypeError(f'bad exception type {type(exc)}')
+    def from_error(exc: Union[Exception, Fail], parsed_value=...):
+        exc_type = exc.exc_type if isinstance(exc, Fail) else type(exc)
+        if issubclass(exc_type, ParseError):
+            return Unparseable(exc, parsed_value)
+        if issubclass(exc_type, ValidationError):
+            return Invalid(exc, parsed_value)
+        raise TypeError(f'bad exception type {exc_type}')
 
 
 class Unparseable(BadValue[ParseError]):
@@ -111,3 +164,27 @@ class Unparseable(BadValue[ParseError]):
 
 class Invalid(BadValue[ValidationError]):
     pass
+
+
+class PendingValue(Generic[T], FidgetValue):
+    """
+    A value that is still being validated asynchronously
+    """
+
+    def __init__(self, parsed_value: T = ...):
+        """
+        :param parsed_value: the parsed value being validated, if it is known
+        """
+        super().__init__('pending', 'validation is still running')
+        self.parsed_value = parsed_value
+        self.fail = Fail(ValidationPending, 'validation is still running')
+
+    @property
+    def exception(self) -> ValidationPending:
+        return self.fail.exception
+
+    def is_ok(self):
+        return False
+
+    def is_pending(self):
+        return True
@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+from typing import Callable, Optional, TypeVar, NamedTuple, Tuple
+from concurrent.futures import ProcessPoolExecutor, Future, BrokenExecutor, CancelledError
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from array import array
+import sys
+
+T = TypeVar('T')
+
+MAX_WORKERS: Optional[int] = None
+"""the maximum number of worker processes, None to use the number of processors"""
+SHARED_MEMORY_THRESHOLD = 1 << 20
+"""buffers of at least this many bytes are passed to and from worker processes through shared memory"""
+INLINE = False
+"""run offloaded functions in the calling process, set in processes that are themselves workers"""
+
+EXECUTOR_ERRORS = (BrokenExecutor, CancelledError)
+"""errors of the process pool rather than of an offloaded function, after which the function can be run in-process"""
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def process_safe(func: Callable[..., T]) -> Callable[..., T]:
+    """
+    mark a validation or conversion function as safe to run in a worker process. The function must be picklable (a
+    module-level function), must not touch any widgets, and its arguments, results and errors must be picklable.
+    """
+    func.__process_safe__ = True
+    return func
+
+
+def is_process_safe(func) -> bool:
+    """
+    :return: whether a function was marked with process_safe
+    """
+    return getattr(func, '__process_safe__', False)
+
+
+def process_pool() -> ProcessPoolExecutor:
+    """
+    :return: the shared process pool for offloaded work, created on first use
+    """
+    global _process_pool
+    if _process_pool is None:
+        # spawned workers don't inherit the (possibly threaded) Qt state of the GUI process
+        _process_pool = ProcessPoolExecutor(max_workers=MAX_WORKERS, mp_context=get_context('spawn'),
+                                            initializer=_init_worker, initargs=(_loaded_backend(),))
+    return _process_pool
+
+
+def _loaded_backend() -> Optional[str]:
+    """
+    :return: the name of the Qt backend loaded in this process, or None if none was loaded
+    """
+    # offloading work should not load a backend by itself
+    preference = sys.modules.get('fidget.backend.preference')
+    loaded = preference and preference.loaded
+    return loaded and loaded.__name__
+
+
+def _init_worker(backend: Optional[str]):
+    """
+    set up a worker process to try the backend of the process that started it first, should it load one
+    """
+    if backend:
+        from fidget.backend import preference
+        preference.priority = preference.backends[backend]
+
+
+def _discard_pool(pool: ProcessPoolExecutor):
+    """
+    shut down a broken pool, so that the next offloaded call starts a new one
+    """
+    global _process_pool
+    if _process_pool is pool:
+        _process_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+class _SharedBuffer(NamedTuple):
+    """
+    a picklable reference to a buffer that was placed in shared memory
+    """
+    name: str
+    size: int
+    kind: str
+    meta: Tuple
+
+
+def _numpy():
+    # numpy is optional, if it was never imported, no value can be an ndarray
+    return sys.modules.get('numpy')
+
+
+def _pack(value, threshold):
+    """
+    place a value in shared memory if it is a large enough buffer
+    :param threshold: the minimum size of a buffer to place in shared memory
+    :return: the value to pickle in place of the original, and the shared memory block, if one was created
+    """
+    np = _numpy()
+    if isinstance(value, (bytes, bytearray)):
+        kind, meta, data = type(value).__name__, (), value
+    elif isinstance(value, array):
+        kind, meta, data = 'array', (value.typecode,), value
+    elif np is not None and type(value) is np.ndarray and not value.dtype.hasobject:
+        kind, meta, data = 'ndarray', (value.dtype.str, value.shape), np.ascontiguousarray(value)
+    else:
+        return value, None
+
+    view = memoryview(data).cast('B')
+    if view.nbytes < threshold:
+        return value, None
+    shm = SharedMemory(create=True, size=view.nbytes)
+    shm.buf[:view.nbytes] = view
+    return _SharedBuffer(shm.name, view.nbytes, kind, meta), shm
+
+
+def _unpack(value, unlink: bool):
+    """
+    copy a value out of shared memory, if it was packed there
+    :param unlink: whether the receiver owns the block, and should free it
+    """
+    if not isinstance(value, _SharedBuffer):
+        return value
+    shm = SharedMemory(name=value.name)
+    try:
+        buf = shm.buf[:value.size]
+        if value.kind == 'bytes':
+            ret = bytes(buf)
+        elif value.kind == 'bytearray':
+            ret = bytearray(buf)
+        elif value.kind == 'array':
+            ret = array(value.meta[0])
+            ret.frombytes(buf)
+        elif value.kind == 'ndarray':
+            np = _numpy()
+            if np is None:
+                import numpy as np
+            dtype, shape = value.meta
+            ret = np.frombuffer(buf, dtype=dtype).reshape(shape).copy()
+        else:
+            raise TypeError(f'unknown shared buffer kind: {value.kind}')
+        del buf
+    finally:
+        shm.close()
+        if unlink:
+            shm.unlink()
+    return ret
+
+
+def _run(threshold, func: Callable[..., T], *args):
+    # runs in the worker process, the threshold is that of the submitting process
+    args = [_unpack(a, unlink=False) for a in args]
+    ret = func(*args)
+    packed, shm = _pack(ret, threshold)
+    if shm is not None:
+        # the block must outlive this call, the receiving process will unlink it. Worker processes share the resource
+        # tracker of the process that spawned them, so the unlink there balances the registration here.
+        shm.close()
+    return packed
+
+
+def submit(func: Callable[..., T], *args) -> Future[T]:
+    """
+    run a function in the shared process pool, passing large buffers through shared memory
+    :param func: the function to run, must be picklable
+    :param args: the arguments to call the function with
+    :return: a future of the function's result
+    """
+    if INLINE:
+        return run_inline(func, *args)
+
+    threshold = SHARED_MEMORY_THRESHOLD
+    packed = [_pack(a, threshold) for a in args]
+    blocks = [shm for _, shm in packed if shm is not None]
+    pool = process_pool()
+    try:
+        inner = pool.submit(_run, threshold, func, *(a for a, _ in packed))
+    except BrokenExecutor:
+        # a worker of the pool died since the last call, the call is submitted to a new pool
+        _discard_pool(pool)
+        pool = process_pool()
+        inner = pool.submit(_run, threshold, func, *(a for a, _ in packed))
+    ret = Future()
+
+    def done(f: Future):
+        # the worker has either copied the arguments or never will, either way they are no longer needed
+        for shm in blocks:
+            shm.close()
+            shm.unlink()
+        if f.cancelled():
+            ret.cancel()
+            ret.set_running_or_notify_cancel()
+            return
+        exc = f.exception()
+        if isinstance(exc, BrokenExecutor):
+            _discard_pool(pool)
+        if exc is not None:
+            # the pool chains the remote traceback as the cause, which would clutter the error's details
+            exc.__cause__ = None
+            ret.set_exception(exc)
+            return
+        try:
+            result = _unpack(f.result(), unlink=True)
+        except Exception as e:
+            ret.set_exception(e)
+        else:
+            ret.set_result(result)
+
+    inner.add_done_callback(done)
+    return ret
+
+
+def run_inline(func: Callable[..., T], *args) -> Future[T]:
+    """
+    run a function in this process
+    :return: a done future of the function's result or error
+    """
+    ret = Future()
+    try:
+        result = func(*args)
+    except Exception as e:
+        ret.set_exception(e)
+    else:
+        ret.set_result(result)
+    return ret
+
+
+def offload(func: Callable[..., T], *args) -> T:
+    """
+    run a function in the shared process pool and wait for its result, errors raised by the function are re-raised. If
+     the pool fails (such as when a worker process dies), the function is run in this process instead.
+    """
+    try:
+        return submit(func, *args).result()
+    except EXECUTOR_ERRORS:
+        return func(*args)
@@ -1,16 +1,20 @@
-from typing import TypeVar, Union, Pattern, Callable, Any, Match, Iterable, Tuple, Type, Dict, List
+from typing import TypeVar, Union, Pattern, Callable, Any, Match, Iterable, Tuple, Type, Dict, List, Optional
 
 import re
 import json
+import threading
+import ctypes
+from concurrent.futures import Future
 from functools import wraps, lru_cache, partial
 from textwrap import indent
-from enum import IntEnum
+from enum import IntEnum, Enum
+from decimal import Decimal
+from fractions import Fraction
+import sys
+from weakref import WeakKeyDictionary
 
-from fidget.backend.QtWidgets import QDialog, QApplication
-
-from fidget.core.primitive_questions import FormatSpecQuestion, FormattedStringQuestion, ExecStringQuestion, \
-    EvalStringQuestion
 from fidget.core.__util__ import exc_wrap, update
+from fidget.core.result import Ok, Fail, Result
 
 T = TypeVar('T')
 
@@ -35,35 +39,178 @@ class PlaintextPrintError(Exception):
     pass
 
 
+def result_parser(func: Callable[[str], Union[T, Fail]]) -> PlaintextParser[T]:
+    """
+    A wrapper for a function that returns a Fail rather than raising a PlaintextParseError. The function returns the
+     parsed value itself when it succeeds, so that a success costs no more than in any other parser. The wrapped parser
+     raises as usual, but joined parsers and try_parse call the function directly, so that its failures are never
+     raised. The function may still raise PlaintextParseError.
+    """
+
+    @wraps(func)
+    def ret(s: str, *args, **kwargs):
+        ret = func(s, *args, **kwargs)
+        if isinstance(ret, Fail):
+            ret.unwrap()
+        return ret
+
+    # functools.wraps copies this attribute to wrappers, that might not fail the same way, so the parser is stored
+    # along with the function, see _result_func
+    ret.__result_parser__ = ret, func
+    return ret
+
+
+def _result_func(parser: PlaintextParser[T]) -> Optional[Callable[[str], Union[T, Fail]]]:
+    """
+    :return: the failure-returning function of a parser wrapped with result_parser, or None if the parser only raises
+    """
+    pair = getattr(parser, '__result_parser__', None)
+    if pair is None or pair[0] is not parser:
+        return None
+    return pair[1]
+
+
+def try_parse(parser: PlaintextParser[T], s: str) -> Result[T]:
+    """
+    parse a plaintext, returning the outcome rather than raising it. Parsers wrapped with result_parser (such as joined
+     parsers) are called without raising, any other parser is adapted by catching its PlaintextParseError.
+    :param parser: the parser to use
+    :param s: the plaintext to parse
+    :return: an Ok of the parsed value, or a Fail of the PlaintextParseError
+    """
+    func = _result_func(parser)
+    try:
+        ret = parser(s) if func is None else func(s)
+    except PlaintextParseError as e:
+        return Fail.of(e)
+    return ret if isinstance(ret, Fail) else Ok(ret)
+
+
 def regex_parser(*patterns: Union[Pattern[str], str]) \
         -> Callable[[Callable[[Match[str]], Any]], PlaintextParser]:
     """
     A wrapper for a function that accepts a regex match object. The function will accept only a plaintext that fully
      matches one of the regular expression pattern, and forward that match to the function.
+    Multiple patterns are combined into a single alternation where possible, so that a plaintext is scanned once to
+     find the first pattern it matches, or that it matches none. Only that pattern is then matched again, so that the
+     function receives the same match it would if that pattern were the only one.
     :param patterns: the patterns to match against.
     """
     patterns = [
         (re.compile(p) if isinstance(p, str) else p) for p in patterns
     ]
+    combined = _combine_patterns(patterns)
 
     def ret(func):
-        @wraps(func)
-        def ret(s: str):
-            for p in patterns:
-                m = p.fullmatch(s)
-                if m:
-                    return func(m)
-            raise PlaintextParseError('string did not match pattern')
+        if combined is None:
+            @result_parser
+            @wraps(func)
+            def ret(s: str):
+                for p in patterns:
+                    m = p.fullmatch(s)
+                    if m:
+                        return func(m)
+                return Fail(PlaintextParseError, 'string did not match pattern')
+        else:
+            @result_parser
+            @wraps(func)
+            def ret(s: str):
+                m = combined.fullmatch(s)
+                if not m:
+                    return Fail(PlaintextParseError, 'string did not match pattern')
+                # the only groups of the combined pattern are around each alternative
+                return func(patterns[m.lastindex - 1].fullmatch(s))
 
         return ret
 
     return ret
 
 
+_global_flags = re.compile(r'\(\?[aiLmsux]+\)')
+
+
+def _uncaptured(pattern: str) -> Optional[str]:
+    """
+    :return: a pattern with all its groups made non-capturing, or None if the pattern refers to its groups (and so
+     cannot be changed this way)
+    """
+    ret = []
+    i = 0
+    in_class = False
+    while i < len(pattern):
+        c = pattern[i]
+        if c == '\\':
+            escaped = pattern[i + 1:i + 2]
+            if escaped.isdigit() and escaped != '0':
+                # a backreference (or an octal escape in a character class, which we needn't tell apart)
+                return None
+            ret.append(pattern[i:i + 2])
+            i += 2
+            continue
+        if in_class:
+            if c == ']':
+                in_class = False
+        elif c == '[':
+            in_class = True
+            # a closing bracket right after the opening one (or its negation) is literal
+            end = i + 1
+            if pattern[end:end + 1] == '^':
+                end += 1
+            if pattern[end:end + 1] == ']':
+                end += 1
+            ret.append(pattern[i:end])
+            i = end
+            continue
+        elif c == '(':
+            if pattern.startswith('(?P<', i):
+                i = pattern.index('>', i) + 1
+                ret.append('(?:')
+                continue
+            if pattern.startswith(('(?P=', '(?('), i) or _global_flags.match(pattern, i):
+                # references to groups, and flags that apply to the entire pattern
+                return None
+            if not pattern.startswith('(?', i):
+                ret.append('(?:')
+                i += 1
+                continue
+        ret.append(c)
+        i += 1
+    return ''.join(ret)
+
+
+def _combine_patterns(patterns: List[Pattern[str]]) -> Optional[Pattern[str]]:
+    """
+    :return: a pattern that matches any of the patterns, whose only groups are around each pattern, in order. None if
+     there are not multiple patterns, or if they cannot be combined without changing their meaning.
+    """
+    if len(patterns) < 2:
+        return None
+    flags = {p.flags for p in patterns}
+    if len(flags) != 1 or any(not isinstance(p.pattern, str) for p in patterns):
+        return None
+    flags, = flags
+    if flags & re.VERBOSE:
+        # comments and whitespace would have to be told apart from the pattern itself
+        return None
+    branches = []
+    for p in patterns:
+        branch = _uncaptured(p.pattern)
+        if branch is None:
+            return None
+        branches.append('(' + branch + ')')
+    try:
+        return re.compile('|'.join(branches), flags)
+    except re.error:
+        # for example, global inline flags that are not at the start of the combined pattern
+        return None
+
+
 def json_parser(acceptable_type: Union[Type, Tuple[Type, ...]] = object):
     """
     A wrapper for a function that accepts an object. The function will accept only a plaintext that parses as JSON, and
      forwards that object to the function.
+    Within a joined parser, the plaintext is decoded once and the same object is forwarded to every JSON parser, so the
+     function must not modify it.
     :param acceptable_type: The wrapper will only accept objects of this type(s)
     """
 
@@ -81,6 +228,54 @@ def json_printer(func):
     return ret
 
 
+def _json_decode(s: str):
+    """
+    :return: the decoded object, or a Fail
+    """
+    try:
+        return json.loads(s)
+    except json.JSONDecodeError as e:
+        return Fail(PlaintextParseError, cursor_pos=e.pos, cause=e)
+
+
+class _JsonDecodeScope(threading.local):
+    """
+    The plaintext a joined parser is currently parsing, and its JSON decoding, so that all the JSON parsers the joined
+     parser tries share a single decoding. Thread-local, since joined parsers may run in worker threads.
+    """
+    _undecoded = object()
+
+    def __init__(self):
+        self.text = None
+        self.decoded = self._undecoded
+
+    def enter(self, text: str):
+        """
+        start sharing the decoding of a plaintext
+        :return: the previous state, to pass to exit
+        """
+        ret = self.text, self.decoded
+        self.text = text
+        self.decoded = self._undecoded
+        return ret
+
+    def exit(self, previous):
+        self.text, self.decoded = previous
+
+    def decode(self, s: str):
+        """
+        :return: the decoded object, or a Fail
+        """
+        if s is not self.text:
+            return _json_decode(s)
+        if self.decoded is self._undecoded:
+            self.decoded = _json_decode(s)
+        return self.decoded
+
+
+_json_decode_scope = _JsonDecodeScope()
+
+
 class JsonParser:
     def __init__(self, inner_func, acceptable_type):
         self.__func__ = inner_func
@@ -92,65 +287,267 @@ class JsonParser:
 
         @wraps(func)
         def ret(s: str, *args, **kwargs):
-            try:
-                json_obj = json.loads(s)
-            except json.JSONDecodeError as e:
-                raise PlaintextParseError(cursor_pos=e.pos) from e
-            else:
-                if not isinstance(json_obj, self.acceptable_type):
-                    raise PlaintextParseError(
-                        f'object is not of an acceptable type (expected {self.acceptable_type}, got {type(json_obj)})')
-                return func(json_obj, *args, **kwargs)
-
+            json_obj = _json_decode_scope.decode(s)
+            if isinstance(json_obj, Fail):
+                return json_obj
+            if not isinstance(json_obj, self.acceptable_type):
+                return Fail(PlaintextParseError, f'object is not of an acceptable type '
+                                                 f'(expected {self.acceptable_type}, got {type(json_obj)})')
+            return func(json_obj, *args, **kwargs)
+
+        ret = result_parser(ret)
+        ret.__json_parser__ = True
+        # markers applied to the descriptor itself (such as explicit or overlapping) apply to its bound parsers
+        for k, v in vars(self).items():
+            if k not in ('__func__', '__name__', 'acceptable_type'):
+                setattr(ret, k, v)
         return ret
 
     def __call__(self, *args, **kwargs):
         return self.__func__.__get__(*args, **kwargs)
 
 
-def join_parsers(parsers: Callable[[], Iterable[PlaintextParser]]):
+class ParserStats:
+    """
+    Statistics of a joined parser. Also remembers which parser of each priority tier last succeeded, so that it is
+     tried first in its tier next time. A stats object can be shared between the joined parsers of widgets with the
+     same parsers (such as the cells of a column), so that they learn together.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        """the number of texts parsed"""
+        self.attempts = 0
+        """the number of parsers called"""
+        self.hits = 0
+        """the number of texts parsed by the first parser tried"""
+        self.preferred: Dict[AdapterPriority, int] = {}
+        """the index (within its tier) of the parser to try first, by tier"""
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        :return: the fraction of texts that were parsed by the first parser tried
+        """
+        return self.hits / self.calls if self.calls else 0.0
+
+    @property
+    def attempts_per_call(self) -> float:
+        return self.attempts / self.calls if self.calls else 0.0
+
+    def reset(self):
+        self.calls = self.attempts = self.hits = 0
+        self.preferred.clear()
+
+    def __repr__(self):
+        return f'{type(self).__name__}(calls={self.calls}, hit_rate={self.hit_rate:.2f}, ' \
+               f'attempts_per_call={self.attempts_per_call:.2f})'
+
+
+def join_parsers(parsers: Callable[[], Iterable[PlaintextParser]], stats: ParserStats = None):
     """
     joins parsers together, returning the first value that is processed without errors. skips explicit parsers.
-    :param parsers: a callable to generate parsers.
+    Parsers are tried by priority, and within each priority tier the parser that last succeeded is tried first, so that
+     parsing many texts of the same form pays for about one parser each. Parsers of a tier are assumed to accept
+     different texts, so that the result does not depend on the order they are tried in. A parser that might accept
+     texts that the parsers before it in its tier accept as well should be marked as overlapping, its result is then only
+     returned if those parsers reject the text.
+    :param parsers: a callable to generate parsers. Called once, the parsers are resolved on first use and kept until
+     the joined parser's invalidate method is called.
+    :param stats: the ParserStats to learn from and update, by default the joined parser has its own. Available as the
+     joined parser's stats attribute.
+    The joined parser is a result_parser, so parsers that fail without raising are joined without raising, use
+     try_parse to parse without raising at all.
     """
+    stats = stats or ParserStats()
+    tiers = None
+    share_json = False
 
     def ret(s):
-        seen = set()
-        first_error = None
-        for p, prio in sort_adapters(parsers()):
-            if p in seen:
-                continue
-            if prio < 0:
-                break
+        # the common case is inlined, rather than wrapping try_ret with result_parser
+        result = parse(s) if tiers is not None and not share_json else try_ret(s)
+        if isinstance(result, Fail):
+            result.unwrap()
+        return result
+
+    def try_ret(s):
+        nonlocal tiers, share_json
+        if tiers is None:
+            tiers = _resolve_tiers(parsers())
+            # sharing the decoding is only worthwhile if multiple parsers would decode the same text
+            share_json = sum(getattr(p, '__json_parser__', False) for _, tier, _, _ in tiers for p, _ in tier) > 1
+        if not share_json:
+            return parse(s)
+        previous = _json_decode_scope.enter(s)
+        try:
+            return parse(s)
+        finally:
+            _json_decode_scope.exit(previous)
+
+    def attempt(tier, i, s):
+        parser, func = tier[i]
+        try:
+            return parser(s) if func is None else func(s)
+        except PlaintextParseError as e:
+            return Fail.of(e)
+
+    def parse(s):
+        stats.calls += 1
+        error = None
+        attempts = 0
+        for tier_num, (priority, tier, orders, rechecks) in enumerate(tiers):
+            # the preferred index might be out of range if the stats are shared with parsers that aren't the same
+            first = stats.preferred.get(priority, 0) % len(tier)
+            for i in orders[first]:
+                attempts += 1
+                result = attempt(tier, i, s)
+                if isinstance(result, Fail):
+                    # report the error of the first parser by static order, regardless of the order they were tried in
+                    if error is None or (tier_num == 0 and i == 0):
+                        error = result
+                    continue
+                winner = i
+                if i == first:
+                    # an overlapping preferred parser only wins if the parsers before it in the tier reject the text, so
+                    #  the result is the one of the static order, regardless of the texts parsed before
+                    for j in rechecks[i]:
+                        attempts += 1
+                        earlier = attempt(tier, j, s)
+                        if not isinstance(earlier, Fail):
+                            result, winner = earlier, j
+                            break
+                stats.attempts += attempts
+                if winner == first:
+                    stats.hits += 1
+                stats.preferred[priority] = winner
+                return result
+        stats.attempts += attempts
+        return error if error is not None else Fail(PlaintextParseError, 'no parsers')
+
+    def invalidate():
+        nonlocal tiers
+        tiers = None
 
-            seen.add(p)
+    ret.__name__ = '<all>'
+    ret.__result_parser__ = ret, try_ret
+    ret.invalidate = invalidate
+    ret.stats = stats
+    return ret
 
-            try:
-                return p(s)
-            except PlaintextParseError as e:
-                first_error = first_error or e
-        raise first_error or PlaintextParseError('no parsers')
 
-    ret.__name__ = '<all>'
+def _resolve_tiers(it: Iterable[PlaintextParser]):
+    """
+    :return: the non-explicit parsers of an iterable in tiers of equal priority, by descending priority, each along with
+     its result-returning function (or None). Each tier also has the order to try its parsers in, for each parser that
+     might be tried first, and the parsers to check again when each parser succeeds first (those before it, if it is
+     overlapping).
+    """
+    tiers: Dict[AdapterPriority, List[PlaintextParser]] = {}
+    for p, priority in sort_adapters(it):
+        if priority < 0:
+            break
+        tiers.setdefault(priority, []).append(p)
+    ret = []
+    for priority, tier in tiers.items():
+        indices = range(len(tier))
+        orders = tuple((first, *(i for i in indices if i != first)) for first in indices)
+        rechecks = tuple(range(i) if getattr(p, '__overlapping__', False) else () for i, p in enumerate(tier))
+        ret.append((priority, tuple((p, _result_func(p)) for p in tier), orders, rechecks))
     return ret
 
 
+IMMUTABLE_TYPES = (str, bytes, int, float, complex, bool, type(None), Decimal, Fraction, Enum)
+"""the types of parsed values a ParseMemo can return for every occurrence of a text, as well as tuples of them"""
+
+
+def _is_immutable(v) -> bool:
+    if isinstance(v, tuple):
+        return all(_is_immutable(e) for e in v)
+    return isinstance(v, IMMUTABLE_TYPES)
+
+
+class ParseMemo:
+    """
+    A bounded memo of parsed plaintexts, for bulk imports of texts that repeat (such as codes and categories). Since
+     every occurrence of a text gets the same value, only immutable values are kept, and repeated strings are shared.
+    """
+
+    def __init__(self, maxsize: int):
+        """
+        :param maxsize: the maximum number of texts to remember for each key, the earliest are forgotten first
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.uncached = 0
+        """the number of texts parsed into values that could not be kept"""
+        self._values: Dict[Any, Dict[str, Any]] = {}
+        # texts remembered by their parser are forgotten along with it
+        self._parser_values: WeakKeyDictionary[PlaintextParser, Dict[str, Any]] = WeakKeyDictionary()
+
+    @property
+    def hit_rate(self) -> float:
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+    def memoized(self, parser: PlaintextParser[T], key: Any = None) -> PlaintextParser[T]:
+        """
+        :param parser: the parser to parse texts that are not remembered with
+        :param key: identifies the parser, texts parsed with different keys are remembered apart. Only parsers that
+         would parse texts the same way regardless of the state of their widgets should share a key. By default, the
+         parser itself.
+        :return: a parser that returns the remembered value of a text, if there is one
+        """
+        if key is None:
+            values = self._parser_values.setdefault(parser, {})
+        else:
+            values = self._values.setdefault(key, {})
+
+        def ret(s: str):
+            try:
+                v = values[s]
+            except KeyError:
+                pass
+            else:
+                self.hits += 1
+                return v
+
+            self.misses += 1
+            v = parser(s)
+            if type(v) is str:
+                v = sys.intern(v)
+            if not _is_immutable(v):
+                self.uncached += 1
+                return v
+            if len(values) >= self.maxsize:
+                del values[next(iter(values))]
+            values[s] = v
+            return v
+
+        return ret
+
+    def clear(self):
+        self._values.clear()
+        self._parser_values.clear()
+
+    def __repr__(self):
+        return f'{type(self).__name__}(hits={self.hits}, misses={self.misses}, uncached={self.uncached})'
+
+
 def join_printers(printers: Callable[[], Iterable[PlaintextPrinter]]):
     """
     joins printers together, returning the first value that is processed without errors. skips explicit printers.
-    :param printers: a callable to generate parsers.
+    :param printers: a callable to generate printers. Called once, the printers are resolved on first use and kept
+     until the joined printer's invalidate method is called.
     """
+    resolved = None
 
     def ret(s):
-        seen = set()
+        nonlocal resolved
+        if resolved is None:
+            resolved = resolve_adapters(printers())
         first_error = None
-        for p, prio in sort_adapters(printers()):
-            if p in seen:
-                continue
-            if prio < 0:
-                break
-            seen.add(p)
-
+        for p in resolved:
             try:
                 ret = p(s)
             except PlaintextPrintError as e:
@@ -159,7 +556,12 @@ def join_printers(printers: Callable[[], Iterable[PlaintextPrinter]]):
                 return ret
         raise first_error or PlaintextPrintError('no printers')
 
+    def invalidate():
+        nonlocal resolved
+        resolved = None
+
     ret.__name__ = '<all>'
+    ret.invalidate = invalidate
     return ret
 
 
@@ -179,7 +581,26 @@ def inner_plaintext_printer(func):
     return func
 
 
-wrap_plaintext_parser = exc_wrap(PlaintextParseError)
+def wrap_plaintext_parser(exc_cls: Union[Type[Exception], Tuple[Type[Exception], ...]], func: Callable = None):
+    """
+    wraps a function so it catches all exceptions of a type and fails with a PlaintextParseError instead
+    """
+
+    def ret(func):
+        @result_parser
+        @wraps(func)
+        def ret(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except exc_cls as e:
+                return Fail(PlaintextParseError, cause=e)
+
+        return ret
+
+    if func:
+        return ret(func)
+    return ret
+
 
 wrap_plaintext_printer = exc_wrap(PlaintextPrintError)
 
@@ -220,6 +641,8 @@ explicit = update(__explicit__=AdapterPriority.explicit)
 low_priority = update(__priority__=AdapterPriority.low)
 high_priority = update(__priority__=AdapterPriority.high)
 mid_priority = update(__priority__=AdapterPriority.mid)
+# a parser that might accept texts that parsers before it (of the same priority) accept as well, see join_parsers
+overlapping = update(__overlapping__=True)
 
 
 def sort_adapters(it: Iterable[T]):
@@ -251,14 +674,37 @@ def sort_adapters(it: Iterable[T]):
             yield i, priority
 
 
+def resolve_adapters(it: Iterable[T]) -> Tuple[T, ...]:
+    """
+    :return: the non-explicit elements of an iterable, without duplicates, in the order they should be tried
+    """
+    ret = []
+    for i, priority in sort_adapters(it):
+        if priority < 0:
+            break
+        ret.append(i)
+    return tuple(ret)
+
+
+def _ask(question_name: str, cancel_message: str) -> str:
+    """
+    ask the user for a string in a primitive question dialog. Qt is only imported here, so that adapters can be used
+     headless.
+    :param question_name: the name of the question class in fidget.core.primitive_questions
+    :param cancel_message: the message of the error to raise if the user cancels
+    """
+    from fidget.backend.QtWidgets import QDialog
+    from fidget.core import primitive_questions
+
+    instance = getattr(primitive_questions, question_name).instance()
+    if instance.exec_() == QDialog.Rejected:
+        raise PlaintextPrintError(cancel_message)
+    return instance.ret
+
+
 @explicit
 def format_spec_input_printer(v):
-    instance = FormatSpecQuestion.instance()
-
-    result = instance.exec_()
-    if result == QDialog.Rejected:
-        raise PlaintextPrintError("format spec cancelled")
-    format_spec = instance.ret
+    format_spec = _ask('FormatSpecQuestion', "format spec cancelled")
 
     try:
         return format(v, format_spec)
@@ -271,11 +717,7 @@ format_spec_input_printer.__name__ = 'format(...)'
 
 @explicit
 def formatted_string_input_printer(v):
-    instance = FormattedStringQuestion.instance()
-
-    if instance.exec_() == QDialog.Rejected:
-        raise PlaintextPrintError("formatted string cancelled")
-    formatted_string = instance.ret
+    formatted_string = _ask('FormattedStringQuestion', "formatted string cancelled")
 
     try:
         return formatted_string.format(v)
@@ -286,16 +728,99 @@ def formatted_string_input_printer(v):
 formatted_string_input_printer.__name__ = 'formatted_string(...)'
 
 
-@explicit
-def exec_printer(v):
-    instance = ExecStringQuestion.instance()
-    if instance.exec_() == QDialog.Rejected:
-        raise PlaintextPrintError('exec cancelled')
-    script = instance.ret
-    script = """def main(value):\n""" + indent(script, '\t')
+SCRIPT_TIMEOUT: Optional[float] = 30
+"""the number of seconds an exec or eval printer's script may run before it is stopped, None for no limit"""
+SCRIPT_CACHE_SIZE = 64
+"""the number of compiled exec and eval printer scripts to keep, by their source"""
+
+
+class _ScriptInterrupt(BaseException):
+    """
+    raised in a script's thread to stop it, once its run was cancelled. Like KeyboardInterrupt, it is not an Exception,
+     so that a script's "except Exception" does not catch it.
+    """
+    pass
+
+
+class ScriptRun:
+    """
+    A user script, run in a thread of its own. The thread is a daemon, so that a script that never ends does not keep
+     the process alive. A run can be cancelled, and is cancelled once it runs longer than its timeout. Either way, its
+     future is resolved with a PlaintextPrintError, and the script is interrupted when it next runs python code.
+    """
+
+    def __init__(self, func: Callable[[], str], timeout: Optional[float] = None):
+        """
+        :param func: the function to run
+        :param timeout: the number of seconds after which to cancel the run, None for no limit
+        """
+        self.future: Future[str] = Future()
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, args=(func,), name='fidget-script', daemon=True)
+        self._timer = None
+        if timeout is not None:
+            self._timer = threading.Timer(timeout, self.cancel,
+                                          kwargs={'message': f'script timed out after {timeout} seconds'})
+            self._timer.daemon = True
+        self._thread.start()
+        if self._timer:
+            self._timer.start()
+
+    def _run(self, func):
+        try:
+            try:
+                ret = func()
+            except Exception as e:
+                self._resolve(self.future.set_exception, e)
+            else:
+                self._resolve(self.future.set_result, ret)
+        except _ScriptInterrupt:
+            # the run was already resolved by cancel
+            pass
+
+    def _resolve(self, setter, arg) -> bool:
+        with self._lock:
+            if self.future.done():
+                return False
+            setter(arg)
+        if self._timer:
+            self._timer.cancel()
+        return True
+
+    def cancel(self, message='script cancelled'):
+        """
+        stop the run, if it is not already done
+        """
+        if self._resolve(self.future.set_exception, PlaintextPrintError(message)) and self._thread.is_alive():
+            # a thread can only be stopped by raising an exception in it, which CPython can do
+            set_async_exc = getattr(getattr(ctypes, 'pythonapi', None), 'PyThreadState_SetAsyncExc', None)
+            if set_async_exc:
+                set_async_exc(ctypes.c_ulong(self._thread.ident), ctypes.py_object(_ScriptInterrupt))
+
+
+def _script_runner(func: Callable[[Any], ScriptRun]):
+    """
+    make a printer of a function that starts a ScriptRun, and waits for its result. The dialog of plaintext edit
+     widgets calls the start attribute of the printer instead, and so does not wait.
+    """
+
+    @wraps(func)
+    def ret(v):
+        return func(v).future.result()
+
+    ret.start = func
+    return ret
+
+
+@lru_cache(SCRIPT_CACHE_SIZE)
+def _compile_script(source: str, mode: str):
+    return compile(source, f'<{mode} printer>', mode)
+
+
+def _exec_script(script: str, v):
     try:
         globs = {}
-        exec(script, globs)
+        exec(_compile_script("""def main(value):\n""" + indent(script, '\t'), 'exec'), globs)
     except Exception as e:
         raise PlaintextPrintError from e
 
@@ -310,22 +835,30 @@ def exec_printer(v):
     return str(ret)
 
 
-exec_printer.__name__ = "exec"
-
-
-@explicit
-def eval_printer(v):
-    instance = EvalStringQuestion.instance()
-    if instance.exec_() == QDialog.Rejected:
-        raise PlaintextPrintError('eval cancelled')
-    script = instance.ret
-
+def _eval_script(script: str, v):
     try:
-        ret = eval(script, {'value': v})
+        ret = eval(_compile_script(script, 'eval'), {'value': v})
     except Exception as e:
         raise PlaintextPrintError from e
 
     return str(ret)
 
 
+@explicit
+@_script_runner
+def exec_printer(v):
+    script = _ask('ExecStringQuestion', 'exec cancelled')
+    return ScriptRun(partial(_exec_script, script, v), SCRIPT_TIMEOUT)
+
+
+exec_printer.__name__ = "exec"
+
+
+@explicit
+@_script_runner
+def eval_printer(v):
+    script = _ask('EvalStringQuestion', 'eval cancelled')
+    return ScriptRun(partial(_eval_script, script, v), SCRIPT_TIMEOUT)
+
+
 eval_printer.__name__ = "eval"
@@ -0,0 +1,302 @@
+from __future__ import annotations
+
+from typing import Dict, Tuple, Optional, List, Iterator
+from contextlib import contextmanager
+from functools import wraps
+from threading import Lock, local
+from time import perf_counter
+from types import FunctionType
+import atexit
+import json
+import os
+import sys
+
+PROFILED_ATTRIBUTES = ('parse', 'parse_result', 'convert_result', 'validate', 'fill', '_fill', '_update_indicator',
+                       'joined_plaintext_parser', 'joined_plaintext_printer')
+"""the attributes of Fidget classes that are profiled, properties are profiled by calls to the callables they return"""
+
+ENV_VAR = 'FIDGET_PROFILE'
+
+_active: Optional[Profiler] = None
+
+
+class ProfileRecord:
+    """
+    The timings of a single method of a single widget
+    """
+    __slots__ = 'calls', 'cumulative', 'self_time'
+
+    def __init__(self):
+        self.calls = 0
+        self.cumulative = 0.0
+        self.self_time = 0.0
+
+
+class _Frame:
+    __slots__ = 'key', 'children_time'
+
+    def __init__(self, key):
+        self.key = key
+        self.children_time = 0.0
+
+
+class Profiler:
+    """
+    Records call counts, cumulative time and self time of Fidget methods, keyed by widget path, defining class and
+    method name
+    """
+
+    def __init__(self):
+        self.records: Dict[Tuple[str, str, str], ProfileRecord] = {}
+        self._lock = Lock()
+        self._local = local()
+
+    def _stack(self) -> List[_Frame]:
+        # asynchronous validation runs in worker threads, each thread times its own calls
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = []
+            return self._local.stack
+
+    def call(self, key: Tuple[str, str, str], func, *args, **kwargs):
+        """
+        call a function, recording its time under a key
+        """
+        stack = self._stack()
+        frame = _Frame(key)
+        stack.append(frame)
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = perf_counter() - start
+            stack.pop()
+            if stack:
+                stack[-1].children_time += elapsed
+            # in recursive calls, only the outermost call is counted toward the cumulative time
+            outermost = not any(f.key == key for f in stack)
+            with self._lock:
+                record = self.records.get(key)
+                if record is None:
+                    record = self.records[key] = ProfileRecord()
+                record.calls += 1
+                record.self_time += elapsed - frame.children_time
+                if outermost:
+                    record.cumulative += elapsed
+
+    def clear(self):
+        with self._lock:
+            self.records.clear()
+
+    def rows(self, sort_by: str = 'cumulative') -> List[dict]:
+        """
+        :param sort_by: the field to sort by, descending, one of calls, cumulative or self_time
+        :return: the records, as dicts
+        """
+        with self._lock:
+            ret = [
+                {'path': path, 'class': cls_name, 'method': method,
+                 'calls': r.calls, 'cumulative': r.cumulative, 'self_time': r.self_time}
+                for (path, cls_name, method), r in self.records.items()
+            ]
+        ret.sort(key=lambda r: r[sort_by], reverse=True)
+        return ret
+
+    def table(self, sort_by: str = 'cumulative', limit: Optional[int] = None) -> str:
+        """
+        :param sort_by: the field to sort by, descending, one of calls, cumulative or self_time
+        :param limit: the maximum number of rows to show
+        :return: the records, as a printable table
+        """
+        rows = self.rows(sort_by)[:limit]
+        headers = ('calls', 'cumulative', 'self', 'method', 'path')
+        lines = [
+            (str(r['calls']), f'{r["cumulative"]:.6f}', f'{r["self_time"]:.6f}', f'{r["class"]}.{r["method"]}',
+             r['path'])
+            for r in rows
+        ]
+        widths = [max([len(h)] + [len(line[i]) for line in lines]) for i, h in enumerate(headers)]
+        ret = []
+        for line in [headers] + lines:
+            ret.append('  '.join(
+                (e.rjust(w) if i < 3 else e.ljust(w)) for i, (e, w) in enumerate(zip(line, widths))
+            ).rstrip())
+        return '\n'.join(ret)
+
+    def to_json(self, sort_by: str = 'cumulative', **kwargs) -> str:
+        """
+        :param sort_by: the field to sort by, descending, one of calls, cumulative or self_time
+        :param kwargs: forwarded to json.dumps
+        :return: the records, as a JSON list
+        """
+        return json.dumps(self.rows(sort_by), **kwargs)
+
+
+def widget_path(widget) -> str:
+    """
+    :return: the titles of the Fidgets from the widget's window down to the widget, separated by slashes
+    """
+    from fidget.core.fidget import Fidget
+
+    parts = []
+    w = widget
+    while w is not None:
+        if isinstance(w, Fidget):
+            parts.append(w.title or type(w).__name__)
+        w = w.parentWidget()
+    return '/'.join(reversed(parts))
+
+
+def _profiled_method(cls, name, func):
+    key_suffix = (cls.__qualname__, name)
+
+    @wraps(func)
+    def ret(self, *args, **kwargs):
+        profiler = _active
+        if profiler is None:
+            return func(self, *args, **kwargs)
+        return profiler.call((widget_path(self),) + key_suffix, func, self, *args, **kwargs)
+
+    ret.__profiled__ = func
+    return ret
+
+
+def _profiled_property(cls, name, prop: property):
+    key_suffix = (cls.__qualname__, name)
+
+    def fget(self):
+        v = prop.fget(self)
+        if not callable(v):
+            return v
+
+        @wraps(v)
+        def ret(*args, **kwargs):
+            profiler = _active
+            if profiler is None:
+                return v(*args, **kwargs)
+            return profiler.call((widget_path(self),) + key_suffix, v, *args, **kwargs)
+
+        return ret
+
+    ret = property(fget, prop.fset, prop.fdel, prop.__doc__)
+    fget.__profiled__ = prop
+    return ret
+
+
+def instrument(cls):
+    """
+    wrap the profiled attributes defined in a Fidget class, so they are timed by the active profiler
+    """
+    for name in PROFILED_ATTRIBUTES:
+        attr = cls.__dict__.get(name)
+        if attr is None:
+            continue
+        if isinstance(attr, property):
+            if getattr(attr.fget, '__profiled__', None) is None:
+                setattr(cls, name, _profiled_property(cls, name, attr))
+        elif isinstance(attr, FunctionType):
+            if getattr(attr, '__profiled__', None) is None:
+                setattr(cls, name, _profiled_method(cls, name, attr))
+
+
+def uninstrument(cls):
+    """
+    restore the profiled attributes of a Fidget class
+    """
+    for name in PROFILED_ATTRIBUTES:
+        attr = cls.__dict__.get(name)
+        if isinstance(attr, property):
+            attr = attr.fget
+        original = getattr(attr, '__profiled__', None)
+        if original is not None:
+            setattr(cls, name, original)
+
+
+def _fidget_classes() -> Iterator[type]:
+    from fidget.core.fidget import Fidget
+
+    seen = set()
+    stack = [Fidget]
+    while stack:
+        cls = stack.pop()
+        if cls in seen:
+            continue
+        seen.add(cls)
+        yield cls
+        stack.extend(cls.__subclasses__())
+
+
+def active_profiler() -> Optional[Profiler]:
+    """
+    :return: the active profiler, or None if profiling is off
+    """
+    return _active
+
+
+def start(profiler: Profiler = None) -> Profiler:
+    """
+    start profiling all Fidget classes, including ones declared while profiling
+    :param profiler: the profiler to record to, a new one by default
+    :return: the active profiler
+    """
+    global _active
+    if _active is not None:
+        raise RuntimeError('a profiler is already active')
+    _active = profiler or Profiler()
+    for cls in _fidget_classes():
+        instrument(cls)
+    return _active
+
+
+def stop() -> Optional[Profiler]:
+    """
+    stop profiling, restoring all Fidget classes
+    :return: the profiler that was active
+    """
+    global _active
+    ret = _active
+    _active = None
+    for cls in _fidget_classes():
+        uninstrument(cls)
+    return ret
+
+
+@contextmanager
+def profile(profiler: Profiler = None):
+    """
+    a context manager to profile all Fidgets within it. When profiling is off, Fidget classes are not instrumented at
+    all.
+    >>> with profile() as p:
+    ...     w.fill_value(v)
+    >>> print(p.table())
+    :param profiler: the profiler to record to, a new one by default
+    """
+    ret = start(profiler)
+    try:
+        yield ret
+    finally:
+        stop()
+
+
+def _dump_env_profile(profiler: Profiler, dest: str):
+    if dest.lower() in ('1', 'true', 'yes', 'stderr'):
+        print(profiler.table(), file=sys.stderr)
+    elif dest.lower().endswith('.json'):
+        with open(dest, 'w') as f:
+            f.write(profiler.to_json(indent=1))
+    else:
+        with open(dest, 'w') as f:
+            f.write(profiler.table())
+
+
+def profile_from_env():
+    """
+    start profiling if the FIDGET_PROFILE environment variable is set, and dump the report on exit. The variable is
+    either 1 (to print a table to stderr), or a file path (with a .json suffix to write JSON, or a table otherwise).
+    """
+    dest = os.environ.get(ENV_VAR)
+    if not dest or dest == '0' or _active is not None:
+        return
+    profiler = start()
+    atexit.register(_dump_env_profile, profiler, dest)
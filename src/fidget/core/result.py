@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from typing import Generic, TypeVar, Union, Type, Optional, Callable
+
+T = TypeVar('T')
+
+
+class Ok(Generic[T]):
+    """
+    A successful outcome of parsing, holding the parsed value
+    """
+    __slots__ = 'value',
+
+    def __init__(self, value: T):
+        self.value = value
+
+    def __bool__(self):
+        return True
+
+    def unwrap(self) -> T:
+        """
+        :return: the value
+        """
+        return self.value
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.value!r})'
+
+
+class Fail:
+    """
+    A failed outcome of parsing. The exception describing the failure is only created when it is first needed, so that
+     failures that are discarded (such as those of parsers that were tried before one that succeeded) cost no more
+     than creating this object.
+    """
+    __slots__ = 'exc_type', '_args', '_kwargs', '_cause', '_exception'
+
+    def __init__(self, exc_type: Type[Exception], *args, cause: Union[Fail, BaseException, None] = None, **kwargs):
+        """
+        :param exc_type: the type of the exception
+        :param args: forwarded to the exception's constructor
+        :param cause: the failure (or exception) that caused this one, becomes the exception's __cause__
+        :param kwargs: forwarded to the exception's constructor
+        """
+        self.exc_type = exc_type
+        self._args = args
+        self._kwargs = kwargs
+        self._cause = cause
+        self._exception: Optional[Exception] = None
+
+    @classmethod
+    def of(cls, exc: Exception) -> Fail:
+        """
+        :return: a failure of an existing exception
+        """
+        ret = cls(type(exc))
+        ret._exception = exc
+        return ret
+
+    def __bool__(self):
+        return False
+
+    @property
+    def exception(self) -> Exception:
+        """
+        the exception describing the failure, created (along with those of its causes) on first access
+        """
+        if self._exception is None:
+            ret = self.exc_type(*self._args, **self._kwargs)
+            cause = self._cause
+            if isinstance(cause, Fail):
+                cause = cause.exception
+            if cause is not None:
+                ret.__cause__ = cause
+            self._exception = ret
+            self._args = self._kwargs = self._cause = None
+        return self._exception
+
+    def unwrap(self):
+        """
+        raise the failure's exception
+        """
+        raise self.exception.with_traceback(None)
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.exc_type.__name__})'
+
+
+Result = Union[Ok[T], Fail]
+
+
+def complete_result_method(cls: type, name: str, default: Callable):
+    """
+    make a method of a class and its result-returning counterpart (such as parse and parse_result) agree, called when
+     a subclass is created. The first class in the MRO to define either of them decides: if it only defines the
+     counterpart, the class gets a method that unwraps it, and if it only defines the method, the class gets the
+     default counterpart, that calls the method, rather than the counterpart of a class later in the MRO.
+    :param cls: the class being created
+    :param name: the name of the method, the counterpart's name is suffixed with _result
+    :param default: the counterpart to use for classes that only define the method
+    """
+    result_name = name + '_result'
+    for klass in cls.__mro__:
+        own = vars(klass)
+        # the methods this function set on a class do not count as definitions
+        completed = own.get('_completed_result_methods', ())
+        defines_method = name in own and name not in completed
+        defines_result = result_name in own and result_name not in completed
+        if defines_method or defines_result:
+            break
+    else:
+        return
+
+    if defines_result and not defines_method:
+        result_func = own[result_name]
+        if getattr(getattr(cls, name, None), '__result_func__', None) is result_func:
+            return
+
+        # the counterpart is called directly, so that a subclass that overrides only the method can call super's
+        def ret(self, *args, **kwargs):
+            return result_func(self, *args, **kwargs).unwrap()
+
+        ret.__name__ = name
+        ret.__qualname__ = f'{cls.__qualname__}.{name}'
+        ret.__doc__ = result_func.__doc__
+        ret.__result_func__ = result_func
+        completed_name, completed_value = name, ret
+    elif defines_method and not defines_result:
+        if getattr(cls, result_name, None) is default:
+            return
+        completed_name, completed_value = result_name, default
+    else:
+        return
+    setattr(cls, completed_name, completed_value)
+    cls._completed_result_methods = frozenset(vars(cls).get('_completed_result_methods', ())) | {completed_name}
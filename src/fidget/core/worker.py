@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from typing import Callable, Optional, TypeVar
+from concurrent.futures import ThreadPoolExecutor, Future
+from functools import partial
+
+from fidget.backend.QtCore import QObject, pyqtSignal
+
+T = TypeVar('T')
+
+MAX_WORKERS: Optional[int] = None
+
+_thread_pool: Optional[ThreadPoolExecutor] = None
+_dispatcher: Optional[FutureDispatcher] = None
+
+
+def thread_pool() -> ThreadPoolExecutor:
+    """
+    :return: the shared worker pool for background work such as asynchronous validation, created on first use
+    """
+    global _thread_pool
+    if _thread_pool is None:
+        _thread_pool = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix='fidget-worker')
+    return _thread_pool
+
+
+class FutureDispatcher(QObject):
+    """
+    A QObject that calls the callbacks of futures in the thread it lives in (usually the GUI thread), regardless of
+    the thread the future was resolved in
+    """
+    resolved = pyqtSignal(object, object)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.resolved.connect(self._call)
+
+    def when_done(self, future: Future[T], callback: Callable[[Future[T]], None]):
+        """
+        call a callback with a future, once it is done
+        :param future: the future to wait for
+        :param callback: the callback, called in the dispatcher's thread
+        """
+        future.add_done_callback(partial(self.resolved.emit, callback))
+
+    def _call(self, callback, future):
+        callback(future)
+
+
+def dispatcher() -> FutureDispatcher:
+    """
+    :return: the shared dispatcher, must first be called from the GUI thread
+    """
+    global _dispatcher
+    if _dispatcher is None:
+        _dispatcher = FutureDispatcher()
+    return _dispatcher
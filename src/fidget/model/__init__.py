@@ -0,0 +1,7 @@
+from fidget.model.model import Model
+from fidget.model.primitives import RawStringModel, LabelModel, OptionsModel, CheckBoxModel, DiscreteSpinModel, \
+    ConstModel, SpinModel, SimpleEditModel, IntModel, FloatModel, ComplexModel
+from fidget.model.wrappers import ConverterModel, OptionalModel, StackedModel
+from fidget.model.compound import CompoundModel, DictModel, TupleModel
+from fidget.model.matrix import GridModel, MatrixModel, TableModel
+from fidget.model.templates import model_of
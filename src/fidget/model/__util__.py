@@ -0,0 +1,411 @@
+from __future__ import annotations
+
+from typing import TypeVar, Optional, Tuple, Iterable, List, Callable, Dict, Hashable, Sequence, Mapping, Any
+
+from collections import Counter
+from io import StringIO
+import csv
+
+from fidget.core.plaintext_adapter import PlaintextParseError, PlaintextPrintError, PlaintextParser, PlaintextPrinter
+
+T = TypeVar('T')
+
+
+def repeat_last(iterable):
+    i = iter(iterable)
+    last = None
+    while True:
+        try:
+            last = next(i)
+        except StopIteration:
+            break
+        yield last
+    while True:
+        yield last
+
+
+class CountBounds:
+    def __init__(self, initial: int, min: int = None, max: Optional[int] = None):
+        self.initial = initial
+        self.max = max
+        self.min = min
+
+    def in_bounds(self, num):
+        if num < self.min:
+            return False
+        if self.max is not None and num >= self.max:
+            return False
+        return True
+
+    def __class_getitem__(cls, item):
+        if isinstance(item, int):
+            return cls(item, item, item + 1)
+        if isinstance(item, slice):
+            initial = item.start or 1
+            min = item.stop or 1
+            max = item.step
+            return cls(initial, min, max)
+        if isinstance(item, cls):
+            return item
+        return cls(*item)
+
+    @property
+    def is_const(self):
+        return self.max is not None and self.max - self.min == 1
+
+
+def parse_int(s):
+    if isinstance(s, int):
+        return s
+    return int(s, base=0)
+
+
+parse_int.__name__ = 'int'
+
+
+class PrintCache:
+    """
+    The printed strings of a grid's cells, so that printing the grid again only re-prints the cells that changed. Each
+     cell is identified by a key, that the grid discards when the cell changes or is removed. The widths of the
+     strings in each column are kept as they are printed, for table_printer.
+    """
+
+    def __init__(self):
+        # key: (value, printer, printed string, column)
+        self._entries: Dict[Hashable, Tuple[object, Callable[[object], str], str, int]] = {}
+        self._column_lengths: Dict[int, Counter] = {}  # column: the number of strings of each length
+
+    def printed(self, key: Hashable, column: int, value, printer: Callable[[object], str]) -> str:
+        """
+        :param key: identifies the cell
+        :param column: the column the cell is in
+        :param value: the value to print
+        :param printer: prints the value, only called if the cell changed, or if the value or printer are not the ones
+         last printed with
+        :return: the printed value
+        """
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] is value and entry[1] is printer:
+            ret = entry[2]
+            if entry[3] == column:
+                return ret
+        else:
+            ret = printer(value)
+        if entry is not None:
+            self._forget_length(entry)
+        self._entries[key] = value, printer, ret, column
+        self._column_lengths.setdefault(column, Counter())[len(ret)] += 1
+        return ret
+
+    def discard(self, key: Hashable):
+        """
+        forget the printed string of a cell, to be called when the cell changes or is removed
+        """
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._forget_length(entry)
+
+    def _forget_length(self, entry):
+        _, _, s, column = entry
+        lengths = self._column_lengths[column]
+        lengths[len(s)] -= 1
+        if not lengths[len(s)]:
+            del lengths[len(s)]
+
+    def covers(self, strings: Sequence[Sequence[str]]) -> bool:
+        """
+        :param strings: a matrix of strings, all printed through this cache
+        :return: whether the strings are all of the cache's strings, so that column_widths describes them
+        """
+        return len(self._entries) == sum(len(row) for row in strings)
+
+    def column_widths(self, column_count: int) -> List[int]:
+        """
+        :return: the length of the longest string in each column
+        """
+        return [max(self._column_lengths.get(c, ()), default=0) for c in range(column_count)]
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def table_printer(row_binders: Tuple[Iterable[str], Iterable[str], Iterable[str]], col_sep: str, row_sep: str,
+                  header_row: Callable[[object], Iterable[str]] = None):
+    first_binder, mid_binder, last_binder = row_binders
+
+    def ret(self, v: List[List[T]]):
+        strings = self.string_matrix(v)
+        print_cache: Optional[PrintCache] = getattr(self, 'print_cache', None)
+        # the cache keeps the widths of the cells as they are re-printed, so they need not be measured again
+        cached_widths = print_cache is not None and print_cache.covers(strings)
+        if cached_widths:
+            max_lens = print_cache.column_widths(len(strings[0]))
+        else:
+            max_lens = [0 for _ in range(len(strings[0]))]
+        if header_row:
+            strings.insert(0, header_row(self))
+        elements = []
+        binders = []
+        for row_num, row in enumerate(strings):
+            if row_num == 0:
+                binder = first_binder
+            elif row_num == len(v) - 1:
+                binder = last_binder
+            else:
+                binder = mid_binder
+            binders.append(binder)
+            if not cached_widths or (header_row and row_num == 0):
+                for col_num, e in enumerate(row):
+                    max_lens[col_num] = max(max_lens[col_num], len(e))
+            elements.append(row)
+        if header_row:
+            header_elements = ['-' * ml for ml in max_lens]
+            binders.insert(1, mid_binder)
+            elements.insert(1, header_elements)
+
+        ret = []
+        for (opener, closer), row in zip(binders, elements):
+            row_str = []
+            for length, element in zip(max_lens, row):
+                row_str.append(element.rjust(length))
+            row_str = opener + col_sep.join(row_str) + closer
+            ret.append(row_str)
+        return row_sep.join(ret)
+
+    return ret
+
+
+def to_identifier(s: str):
+    if s.isidentifier():
+        return s
+
+    s = s.strip().replace(' ', '_')
+    if s.isidentifier():
+        return s
+
+    if not s[0].isidentifier():
+        s = '_' + s
+    s = ''.join(c for c in s if c.isalnum() or c == '_')
+    if not s.isidentifier():
+        return s
+
+    return '_'
+
+
+# region shared plaintext adapters
+# these are used by both the widgets and their models, the inners passed to them can be either
+
+
+def rec_iter(iterable):
+    """
+    :return: an iterator of the non-string leaves of a nested iterable, in order
+    """
+    for i in iterable:
+        if isinstance(i, Iterable) and not isinstance(i, str):
+            yield from rec_iter(i)
+        else:
+            yield i
+
+
+def parse_json_mapping(inners: Mapping[str, Any], d, exact=True) -> dict:
+    """
+    parse a json object of strings, with the plaintext parser of the inner of each key
+    :param inners: a mapping of keys to widgets or models
+    :param d: the json object
+    :param exact: whether all keys, and only the inners' keys, must be present
+    """
+    if not isinstance(d, dict):
+        raise PlaintextParseError(f'expected dict, got {type(d).__name__}')
+
+    not_seen = dict(inners)
+    ret = {}
+    for k, v in d.items():
+        inner = not_seen.pop(k, None)
+        if not inner:
+            if exact:
+                raise PlaintextParseError(f'key {k} has no appropriate inner')
+            continue
+        if not isinstance(v, str):
+            # todo if you get a non-str value, just json-encode it and pass it on?
+            raise PlaintextParseError(f'in key: {k}, value must be str, got {type(v).__name__}')
+        try:
+            parsed = inner.joined_plaintext_parser(v)
+        except PlaintextParseError as e:
+            raise PlaintextParseError(f'error parsing {k}') from e
+        ret[k] = parsed
+
+    if exact and not_seen:
+        k, _ = not_seen.popitem()
+        raise PlaintextParseError(f'key not found: {k}') from KeyError(k)
+    return ret
+
+
+def print_json_mapping(inners: Mapping[str, Any], d: Mapping[str, object]) -> Dict[str, str]:
+    """
+    print a mapping to a json object of strings, with the plaintext printer of the inner of each key
+    """
+    if not isinstance(d, Mapping):
+        raise PlaintextPrintError from TypeError('can only accept dict')
+    ret = {}
+    for k, inner in inners.items():
+        if k not in d:
+            raise PlaintextPrintError(f'{k} missing')
+        try:
+            s = inner.joined_plaintext_printer(d[k])
+        except PlaintextPrintError as e:
+            raise PlaintextPrintError(f'error printing {k}') from e
+        ret[k] = s
+    return ret
+
+
+def parse_json_sequence(inners: Sequence[Any], d, exact=True) -> tuple:
+    """
+    parse a json list of strings, with the plaintext parser of the inner in the same position
+    :param inners: a sequence of widgets or models
+    :param d: the json list
+    :param exact: whether the list must have exactly one string for each inner
+    """
+    if not isinstance(d, list):
+        raise PlaintextParseError from TypeError('expected list, got ' + type(d).__name__)
+    if exact and len(d) != len(inners):
+        raise PlaintextParseError(f'value number mismatch (expected {len(inners)}, got {len(d)})')
+
+    ret = []
+    for inner, v in zip(inners, d):
+        if not isinstance(v, str):
+            raise PlaintextParseError(f'in {inner.title}:, value must be str, got {type(v).__name__}')
+        try:
+            parsed = inner.joined_plaintext_parser(v)
+        except PlaintextParseError as e:
+            raise PlaintextParseError(f'error parsing {inner.title}') from e
+        ret.append(parsed)
+    return tuple(ret)
+
+
+def print_json_sequence(inners: Sequence[Any], d: tuple) -> List[str]:
+    """
+    print a tuple to a json list of strings, with the plaintext printer of the inner in the same position
+    """
+    if not isinstance(d, tuple):
+        raise PlaintextPrintError('can only print tuples')
+    ret = []
+    for inner, v in zip(inners, d):
+        try:
+            s = inner.joined_plaintext_printer(v)
+        except PlaintextPrintError as e:
+            raise PlaintextPrintError(f'error printing {inner.title}') from e
+        ret.append(s)
+    return ret
+
+
+def check_row_count(v: list, row_bounds: CountBounds) -> int:
+    """
+    :return: the number of columns in the first row of a list of rows
+    :raises PlaintextParseError: if the number of rows is out of bounds
+    """
+    row_count = len(v)
+    if not row_count:
+        raise PlaintextParseError('list must have at least one row')
+    if not row_bounds.in_bounds(row_count):
+        raise PlaintextParseError(f'row number {row_count} is out of bounds')
+    return len(v[0])
+
+
+def parse_rows(v: list, parser_rows: Iterable[Sequence[PlaintextParser]], col_count: int) -> List[list]:
+    """
+    parse a list of rows of strings
+    :param v: the rows
+    :param parser_rows: the parsers of each row, the last row of parsers is used for all the rows after it
+    :param col_count: the number of strings in each row
+    """
+    ret = []
+    for row_num, (row, parsers_row) in enumerate(zip(v, repeat_last(parser_rows))):
+        ret_row = []
+        if not isinstance(row, list):
+            raise PlaintextParseError(f'element in index {row_num} is not a list')
+        if len(row) != col_count:
+            raise PlaintextParseError(f'{col_count} column in row 0, but {len(row)} in row {row_num}')
+        try:
+            for e, parser in zip(row, parsers_row):
+                ret_row.append(parser(e))
+        except PlaintextParseError as exc:
+            raise PlaintextParseError(f'error parsing {row_num, len(ret_row)}') from exc
+        ret.append(ret_row)
+    return ret
+
+
+def parse_reshaped(v, row_count: int, col_count: int, parser_rows: Iterable[Sequence[PlaintextParser]]) -> List[list]:
+    """
+    parse a nested list of strings of any shape into rows, by the order of its strings
+    :param v: the nested list
+    :param row_count: the number of rows to parse into
+    :param col_count: the number of strings in each row
+    :param parser_rows: the parsers of each row, the last row of parsers is used for all the rows after it
+    """
+    size = row_count * col_count
+    i = rec_iter(v)
+    ret = []
+    for row_num, parsers_row in zip(range(row_count), repeat_last(parser_rows)):
+        ret_row = []
+        for col_num, parser in enumerate(parsers_row):
+            try:
+                e = next(i)
+            except StopIteration as exc:
+                raise PlaintextParseError(f'too few elements, expected {size}') from exc
+
+            try:
+                s = parser(e)
+            except PlaintextParseError as exc:
+                raise PlaintextParseError(f'error parsing {row_num, col_num}') from exc
+
+            ret_row.append(s)
+        ret.append(ret_row)
+
+    try:
+        next(i)
+    except StopIteration:
+        pass
+    else:
+        raise PlaintextParseError(f'too many elements, expected {size}')
+    return ret
+
+
+def print_rows(v: Iterable[Iterable], printer_rows: Iterable[Iterable[PlaintextPrinter]]) -> List[List[str]]:
+    """
+    print rows of values to rows of strings
+    :param v: the rows
+    :param printer_rows: the printers of each row, zipped with the rows and their values
+    """
+    ret = []
+    for row_num, (row, printers_row) in enumerate(zip(v, printer_rows)):
+        ret_row = []
+        for col_num, (e, printer) in enumerate(zip(row, printers_row)):
+            try:
+                s = printer(e)
+            except PlaintextPrintError as exc:
+                raise PlaintextPrintError(f'error printing {row_num, col_num}') from exc
+
+            ret_row.append(s)
+        ret.append(ret_row)
+    return ret
+
+
+# todo allow csv dialects
+def read_csv(s: str) -> List[List[str]]:
+    """
+    :return: the rows of strings of a csv
+    """
+    return list(csv.reader(StringIO(s, newline='')))
+
+
+def write_csv(rows: Iterable[Iterable[str]]) -> str:
+    """
+    :return: a csv of rows of strings
+    """
+    ret = StringIO(newline='')
+    writer = csv.writer(ret)
+    for row in rows:
+        writer.writerow(row)
+    return ret.getvalue()
+
+# endregion
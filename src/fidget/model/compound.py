@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from typing import TypeVar, Generic, Iterable, Mapping, Dict, List, Tuple, Any, Type, NamedTuple
+
+from abc import abstractmethod
+from collections import namedtuple
+
+from fidget.core.plaintext_adapter import json_parser, json_printer, explicit, high_priority
+from fidget.core.fidget_value import ParseError, ValidationError
+from fidget.core.result import Ok, Fail
+
+from fidget.model.model import Model
+from fidget.model.__util__ import to_identifier, parse_json_mapping, print_json_mapping, parse_json_sequence, \
+    print_json_sequence
+
+T = TypeVar('T', bound=Iterable)
+
+
+class CompoundModel(Generic[T], Model[T]):
+    """
+    A model of multiple inner models, the counterpart of FidgetCompound
+    """
+
+    def __init__(self, title, **kwargs):
+        super().__init__(title, **kwargs)
+        self.inners = None
+
+    @abstractmethod
+    def inners_items(self) -> Iterable[Tuple[Any, Model]]:
+        pass
+
+    @abstractmethod
+    def result_zip_inner(self, res) -> Iterable[Tuple[Tuple[Any, Any], Model]]:
+        pass
+
+    @abstractmethod
+    def make_result(self, items: Iterable[Tuple[Any, Any]]) -> T:
+        pass
+
+    def parse_result(self):
+        items = []
+        for key, inner in self.inners_items():
+            result = inner.parse_result()
+            if not result:
+                if not issubclass(result.exc_type, ParseError):
+                    return result
+                return Fail(ParseError, 'error parsing ' + inner.title, offender=inner, cause=result)
+            items.append((key, result.value))
+        return Ok(self.make_result(items))
+
+    def validate(self, d):
+        super().validate(d)
+        for (k, v), inner in self.result_zip_inner(d):
+            try:
+                inner.validate(v)
+            except ValidationError as e:
+                raise ValidationError('error validating ' + inner.title, offender=inner) from e
+
+    @abstractmethod
+    def _from_json(self, json_obj, exact=True):
+        pass
+
+    @abstractmethod
+    def _to_json(self, state):
+        pass
+
+    @json_parser()
+    def from_json(self, d, exact=True):
+        return self._from_json(d, exact=exact)
+
+    @explicit
+    @json_parser()
+    def from_json_wildcard(self, v):
+        return self._from_json(v, exact=False)
+
+    @high_priority
+    @json_printer
+    def to_json(self, d):
+        return self._to_json(d)
+
+    def plaintext_parsers(self):
+        yield self.from_json
+        yield self.from_json_wildcard
+        yield from super().plaintext_parsers()
+
+    def plaintext_printers(self):
+        yield self.to_json
+        yield from super().plaintext_printers()
+
+    def _fill(self, res):
+        for (k, v), inner in self.result_zip_inner(res):
+            inner.fill(v)
+
+    @property
+    def fill(self):
+        if not all(inner.fill for _, inner in self.inners_items()):
+            return None
+        return self._fill
+
+
+class DictModel(CompoundModel[Mapping]):
+    """
+    A model of named inner models, the counterpart of FidgetDict and FidgetTabs
+    """
+
+    def __init__(self, title, inners: Mapping[str, Model], **kwargs):
+        """
+        :param title: the title
+        :param inners: a mapping of names to inner models
+        :param kwargs: forwarded to Model
+        """
+        super().__init__(title, **kwargs)
+        self.inners: Dict[str, Model] = dict(inners)
+        if not self.inners:
+            raise ValueError('at least one inner model must be provided')
+
+    def inners_items(self):
+        return self.inners.items()
+
+    def result_zip_inner(self, res):
+        for k, v in res.items():
+            yield (k, v), self.inners.get(k)
+
+    def make_result(self, items):
+        return dict(items)
+
+    def _from_json(self, d: dict, exact=True):
+        return parse_json_mapping(self.inners, d, exact)
+
+    def _to_json(self, d: Mapping[str, object]):
+        return print_json_mapping(self.inners, d)
+
+
+class TupleModel(CompoundModel[tuple]):
+    """
+    A model of inner models, whose values are gathered into a namedtuple, the counterpart of FidgetTuple
+    """
+
+    def __init__(self, title, inners: Iterable[Model], **kwargs):
+        """
+        :param title: the title
+        :param inners: an iterable of inner models
+        :param kwargs: forwarded to Model
+        """
+        super().__init__(title, **kwargs)
+        self.inners: List[Model] = list(inners)
+        if not self.inners:
+            raise ValueError('at least one inner model must be provided')
+        self.value_type: Type[NamedTuple] = namedtuple(to_identifier(self.title),
+                                                       (to_identifier(i.title) for i in self.inners), rename=True)
+
+    def inners_items(self):
+        return enumerate(self.inners)
+
+    def result_zip_inner(self, res):
+        return zip(enumerate(res), self.inners)
+
+    def make_result(self, items):
+        return self.value_type._make(v for _, v in items)
+
+    def _from_json(self, d: list, exact=True):
+        return parse_json_sequence(self.inners, d, exact)
+
+    def _to_json(self, d: Tuple):
+        return print_json_sequence(self.inners, d)
@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+from typing import TypeVar, Generic, List, Iterator, Callable, Sequence, Type, NamedTuple, Optional
+
+from collections import namedtuple
+from itertools import islice
+
+from fidget.core.plaintext_adapter import PlaintextParseError, json_parser, json_printer, high_priority, overlapping, \
+    ParserStats, ParseMemo, PlaintextParser
+from fidget.core.fidget_value import ParseError, ValidationError
+from fidget.core.result import Ok, Fail, Result
+from fidget.core.__util__ import mask, update
+
+from fidget.model.model import Model
+from fidget.model.__util__ import CountBounds, repeat_last, table_printer, to_identifier, check_row_count, parse_rows, \
+    parse_reshaped, print_rows, read_csv, write_csv
+
+T = TypeVar('T')
+
+
+class GridModel(Generic[T], Model[List[T]]):
+    """
+    A model of a grid of cells, each a model of its own
+    """
+
+    def __init__(self, title, rows: CountBounds = 1, parse_memo_size: int = 0, **kwargs):
+        """
+        :param title: the title
+        :param rows: the bounds of the number of rows
+        :param parse_memo_size: the number of cell texts to remember the values of in plaintext parsing, 0 to parse
+         every cell
+        :param kwargs: forwarded to Model
+        """
+        super().__init__(title, **kwargs)
+        self.parse_memo: Optional[ParseMemo] = ParseMemo(parse_memo_size) if parse_memo_size else None
+        self.row_bounds = CountBounds[rows]
+        self.inners: List[List[Model[T]]] = []
+        self._column_parser_stats: List[ParserStats] = []
+
+    @property
+    def row_count(self):
+        return len(self.inners)
+
+    @property
+    def column_count(self):
+        raise NotImplementedError
+
+    def _make_inner(self, column_number) -> Model[T]:
+        raise NotImplementedError
+
+    def _new_inner(self, column_number) -> Model[T]:
+        # the cells of each column share their parser stats, so a bulk import learns the form of each column once
+        while len(self._column_parser_stats) <= column_number:
+            self._column_parser_stats.append(ParserStats())
+        ret = self._make_inner(column_number)
+        ret.share_parser_stats(self._column_parser_stats[column_number])
+        return ret
+
+    def _row_parsers(self, column_count: int = None) -> Iterator[List[PlaintextParser[T]]]:
+        """
+        :param column_count: the number of parsers in each row, repeating the last cell's parser, by default one for
+         each cell
+        :return: the parsers of each row of cells, for plaintext imports. With a parse memo, each cell's parser is
+         memoized apart, since cells of the same template might parse texts differently (such as stacked cells on
+         different pages).
+        """
+        for inners_row in self.inners:
+            parsers = (inner.joined_plaintext_parser for inner in inners_row)
+            if self.parse_memo is not None:
+                parsers = (self.parse_memo.memoized(parser) for parser in parsers)
+            yield list(islice(repeat_last(parsers), column_count or len(inners_row)))
+
+    def _cell_name(self, row_num, col_num):
+        return str((row_num, col_num))
+
+    def resize(self, rows: int, columns: int):
+        """
+        set the dimensions of the grid, keeping existing cells
+        """
+        del self.inners[rows:]
+        for row in self.inners:
+            del row[columns:]
+            row.extend(self._new_inner(j) for j in range(len(row), columns))
+        while len(self.inners) < rows:
+            self.inners.append([self._new_inner(j) for j in range(columns)])
+
+    def parse_cells_result(self) -> Result[List[List[T]]]:
+        """
+        :return: the parsed values of the cells, or a Fail of the error of the first cell that failed
+        """
+        ret = []
+        for i, inner_row in enumerate(self.inners):
+            row = []
+            for j, inner in enumerate(inner_row):
+                result = inner.parse_result()
+                if not result:
+                    if not issubclass(result.exc_type, ParseError):
+                        return result
+                    return Fail(ParseError, f'error parsing {self._cell_name(i, j)}', offender=inner, cause=result)
+                row.append(result.value)
+            ret.append(row)
+        return Ok(ret)
+
+    def validate(self, value):
+        super().validate(value)
+        for i, (inner_row, v_row) in enumerate(zip(self.inners, value)):
+            for j, (inner, v) in enumerate(zip(inner_row, v_row)):
+                try:
+                    inner.validate(v)
+                except ValidationError as e:
+                    raise ValidationError(f'error validating {self._cell_name(i, j)}', offender=inner) from e
+
+    def fill(self, v):
+        self.resize(len(v), self._fill_column_count(v))
+        for row, inners_row in zip(v, self.inners):
+            for e, inner in zip(row, inners_row):
+                inner.fill_value(e)
+
+    def _fill_column_count(self, v):
+        return self.column_count
+
+    def _check_dimensions(self, v):
+        return check_row_count(v, self.row_bounds)
+
+    def _parse_rows(self, v):
+        """
+        parse a list of rows of strings, with the plaintext parsers of the cells
+        """
+        col_count = self._check_dimensions(v)
+        return parse_rows(v, self._row_parsers(col_count), col_count)
+
+    def from_csv(self, v):
+        return self._parse_rows(read_csv(v))
+
+    def to_csv(self, v):
+        return write_csv(self.string_matrix(v))
+
+    to_csv.__name__ = 'csv'
+
+    @high_priority
+    @json_printer
+    def to_json(self, v):
+        return self.string_matrix(v)
+
+    @overlapping
+    @json_parser(list)
+    def from_json(self, v):
+        return self._parse_rows(v)
+
+    @overlapping
+    @json_parser(list)
+    def from_json_reshape(self, v):
+        return parse_reshaped(v, self.row_count, self.column_count, self._row_parsers())
+
+    def string_matrix(self, v):
+        return print_rows(v, repeat_last(repeat_last(inner.joined_plaintext_printer for inner in inners_row)
+                                         for inners_row in self.inners))
+
+    @property
+    def is_constant_size(self):
+        return self.row_bounds.is_const
+
+    def plaintext_parsers(self):
+        yield self.from_csv
+        yield self.from_json
+        yield mask(self.from_json_reshape, __explicit__=not self.is_constant_size)
+        yield from super().plaintext_parsers()
+
+
+class MatrixModel(Generic[T], GridModel[T]):
+    """
+    A model of a matrix of cells of the same kind, the counterpart of FidgetMatrix
+    """
+
+    def __init__(self, inner: Callable[[], Model[T]], rows: CountBounds = 1, columns: CountBounds = 1,
+                 title: str = None, **kwargs):
+        """
+        :param inner: a callable to create the model of a single cell
+        :param rows: the bounds of the number of rows
+        :param columns: the bounds of the number of columns
+        :param title: the title, defaults to the title of the cells
+        :param kwargs: forwarded to Model
+        """
+        self.inner = inner
+        self.column_bounds = CountBounds[columns]
+        self._column_count = self.column_bounds.initial
+        if title is None:
+            title = inner().title
+        super().__init__(title, rows, **kwargs)
+        self.resize(self.row_bounds.initial, self._column_count)
+
+    @property
+    def column_count(self):
+        return self._column_count
+
+    def _make_inner(self, column_number):
+        return self.inner()
+
+    def resize(self, rows: int, columns: int):
+        self._column_count = columns
+        super().resize(rows, columns)
+
+    def parse_result(self):
+        return self.parse_cells_result()
+
+    def _fill_column_count(self, v):
+        return len(v[0])
+
+    def _check_dimensions(self, v):
+        col_count = super()._check_dimensions(v)
+        if not self.column_bounds.in_bounds(col_count):
+            raise PlaintextParseError(f'column number {col_count} is out of bounds')
+        return col_count
+
+    @property
+    def is_constant_size(self):
+        return self.row_bounds.is_const and self.column_bounds.is_const
+
+    matrix = update(__name__='matrix')(table_printer((
+        ('/', '\\'),
+        ('|', '|'),
+        ('\\', '/')
+    ), ',', '\n'))
+
+    markdown = update(__name__='markdown')(table_printer((
+        ('|', '|'),
+        ('|', '|'),
+        ('|', '|')
+    ), '|', '\n'))
+
+    def plaintext_printers(self):
+        yield self.to_csv
+        yield self.to_json
+        yield self.matrix
+        yield self.markdown
+        yield from super().plaintext_printers()
+
+
+class TableModel(Generic[T], GridModel[T]):
+    """
+    A model of rows of cells, each column of its own kind, whose rows are gathered into namedtuples. The counterpart
+    of FidgetTable
+    """
+
+    def __init__(self, title, columns: Sequence[Callable[[], Model]], rows: CountBounds = 1, **kwargs):
+        """
+        :param title: the title
+        :param columns: a callable to create the model of a cell, for each column
+        :param rows: the bounds of the number of rows
+        :param kwargs: forwarded to Model
+        """
+        super().__init__(title, rows, **kwargs)
+        self.columns = tuple(columns)
+        field_names = []
+        for i, column in enumerate(self.columns):
+            field_names.append(column().title or '_' + str(i))
+        self.value_type: Type[NamedTuple] = namedtuple(to_identifier(self.title),
+                                                       (to_identifier(f) for f in field_names), rename=True)
+        self.resize(self.row_bounds.initial, self.column_count)
+
+    @property
+    def column_count(self):
+        return len(self.columns)
+
+    def _make_inner(self, column_number):
+        return self.columns[column_number]()
+
+    def _cell_name(self, row_num, col_num):
+        return f'{row_num}[{self.value_type._fields[col_num]}]'
+
+    def parse_result(self):
+        result = self.parse_cells_result()
+        if not result:
+            return result
+        return Ok([self.value_type._make(row) for row in result.value])
+
+    def _check_dimensions(self, v):
+        col_count = super()._check_dimensions(v)
+        if col_count != self.column_count:
+            raise PlaintextParseError(f'column number mismatch {col_count} (expected {self.column_count})')
+        return col_count
+
+    markdown = update(__name__='markdown')(table_printer((
+        ('|', '|'),
+        ('|', '|'),
+        ('|', '|')
+    ), '|', '\n', header_row=lambda self: self.value_type._fields))
+
+    def plaintext_printers(self):
+        yield self.to_csv
+        yield self.to_json
+        yield self.markdown
+        yield from super().plaintext_printers()
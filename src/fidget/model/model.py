@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+from typing import TypeVar, Generic, Iterable, Union, Callable, Optional
+
+from abc import abstractmethod
+from functools import partial
+
+from fidget.core.plaintext_adapter import join_parsers, ParserStats, join_printers, resolve_adapters, PlaintextParser, \
+    PlaintextPrinter, PlaintextPrintError, try_parse
+from fidget.core.result import Ok, Fail, Result, complete_result_method
+from fidget.core.fidget_value import GoodValue, BadValue, ParseError, ValidationError
+from fidget.core.offload import is_process_safe, offload
+from fidget.core.__util__ import error_details
+
+T = TypeVar('T')
+
+
+class Model(Generic[T]):
+    """
+    A headless counterpart of a Fidget. A model holds a state instead of a UI, and parses, validates, fills and
+    converts to and from plaintext the same way its widget does, without importing Qt.
+    """
+
+    def __init__(self, title: str = None, validation_func: Callable[[T], None] = None):
+        """
+        :param title: the title of the model, used in error messages
+        :param validation_func: a validation function, run in a worker process if marked with process_safe
+        """
+        self.title = title
+        self.validation_func = validation_func
+
+        self._joined_plaintext_parser = None
+        self._parser_stats: Optional[ParserStats] = None
+        self._joined_plaintext_printer = None
+
+    @abstractmethod
+    def parse(self) -> T:
+        """
+        Parse the internal state and return a parsed value. Or raise ParseError.
+        :return: the parsed value
+        """
+        pass
+
+    def parse_result(self) -> Result[T]:
+        """
+        Parse the internal state like parse, but return the error rather than raise it.
+        :return: an Ok of the parsed value, or a Fail of the error
+        :inheritors: override either parse or parse_result, the other is completed when the class is created
+        """
+        try:
+            return Ok(self.parse())
+        except (ValidationError, ParseError) as e:
+            return Fail.of(e)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        complete_result_method(cls, 'parse', Model.parse_result)
+
+    def validate(self, value: T) -> None:
+        """
+        Raise a ValidationError if the value is invalid
+        :param value: the parsed value
+        :inheritors: always call super().validate
+        """
+        if self.validation_func:
+            if is_process_safe(self.validation_func):
+                offload(self.validation_func, value)
+            else:
+                self.validation_func(value)
+
+    fill: Optional[Callable[[T], None]] = None
+
+    def fill_value(self, v: T):
+        """
+        set the state of the model so it parses to a value
+        """
+        if not self.fill:
+            raise Exception(f'model {self} does not have its fill function implemented')
+        self.fill(v)
+
+    def fill_from_text(self, s: str):
+        """
+        fill the model from a string, by parsing it
+        :param s: the string to parse
+        """
+        self.fill_value(self.joined_plaintext_parser(s))
+
+    def value(self) -> Union[GoodValue[T], BadValue]:
+        """
+        :return: the current value of the model
+        """
+        result = self.parse_result()
+        if not result:
+            return BadValue.from_error(result)
+        value = result.value
+
+        try:
+            self.validate(value)
+        except (ValidationError, ParseError) as e:
+            return BadValue.from_error(e, value)
+
+        return GoodValue(value, partial(self._value_details, value))
+
+    def process(self, v: T) -> Union[GoodValue[T], BadValue]:
+        """
+        fill the model with a value, and return its parsed and validated value
+        """
+        self.fill_value(v)
+        return self.value()
+
+    def process_text(self, s: str) -> Union[GoodValue[T], BadValue]:
+        """
+        fill the model from plaintext, and return its parsed and validated value
+        """
+        result = try_parse(self.joined_plaintext_parser, s)
+        if not result:
+            return BadValue.from_error(Fail(ParseError, 'error parsing plaintext', offender=self, cause=result))
+        self.fill_value(result.value)
+        return self.value()
+
+    @classmethod
+    def cls_plaintext_printers(cls) -> Iterable[PlaintextPrinter[T]]:
+        yield str
+        yield repr
+
+    def plaintext_printers(self) -> Iterable[PlaintextPrinter[T]]:
+        """
+        :return: an iterator of plaintext printers for the model
+        """
+        yield from self.cls_plaintext_printers()
+
+    @classmethod
+    def cls_plaintext_parsers(cls) -> Iterable[PlaintextParser[T]]:
+        yield from ()
+
+    def plaintext_parsers(self) -> Iterable[PlaintextParser[T]]:
+        """
+        :return: an iterator of plaintext parsers for the model
+        """
+        yield from self.cls_plaintext_parsers()
+
+    @classmethod
+    def implicit_cls_plaintext_printers(cls):
+        ret = cls.__dict__.get('_implicit_cls_plaintext_printers')
+        if ret is None:
+            ret = resolve_adapters(cls.cls_plaintext_printers())
+            cls._implicit_cls_plaintext_printers = ret
+        return iter(ret)
+
+    @property
+    def joined_plaintext_parser(self):
+        """
+        :return: A joining of the model's plaintext parsers
+        """
+        if not self._joined_plaintext_parser:
+            self._joined_plaintext_parser = join_parsers(self.plaintext_parsers, self._parser_stats)
+        return self._joined_plaintext_parser
+
+    def share_parser_stats(self, stats: Optional[ParserStats]):
+        """
+        have the model's joined plaintext parser learn which parsers succeed together with other models that share
+         the stats, such as the other cells of a column
+        :param stats: the stats to share, or None for the joined parser to have its own
+        """
+        self._parser_stats = stats
+        self._joined_plaintext_parser = None
+
+    @property
+    def joined_plaintext_printer(self):
+        """
+        :return: A joining of the model's plaintext printers
+        """
+        if not self._joined_plaintext_printer:
+            self._joined_plaintext_printer = join_printers(self.plaintext_printers)
+        return self._joined_plaintext_printer
+
+    def invalidate_plaintext_adapters(self):
+        """
+        Discard the model's resolved plaintext adapters. Call this whenever the adapters the model generates change.
+        """
+        self._joined_plaintext_parser = self._joined_plaintext_printer = None
+
+    def _value_details(self, value: T) -> str:
+        try:
+            return self.joined_plaintext_printer(value)
+        except PlaintextPrintError as e:
+            return 'details could not be loaded because of a parser error:\n' + error_details(e)
+
+    def __repr__(self):
+        return f'<{type(self).__name__} {self.title!r}>'
+
+
+_trivial_printers = frozenset(Model.cls_plaintext_printers())
+
+
+def is_trivial_printer(p):
+    """
+    check if a printer is a trivial printer
+    :param p: the printer to check
+    """
+    return p in _trivial_printers
@@ -0,0 +1,446 @@
+from __future__ import annotations
+
+from typing import TypeVar, Generic, Tuple, Union, Iterable, Optional, Pattern, Container
+
+import re
+
+from fidget.core.plaintext_adapter import PlaintextParseError, PlaintextPrintError, regex_parser, format_printer, \
+    wrap_plaintext_parser, try_parse
+from fidget.core.fidget_value import ParseError, ValidationError
+from fidget.core.result import Fail
+
+from fidget.model.model import Model
+from fidget.model.wrappers import ConverterModel
+from fidget.model.__util__ import parse_int
+
+T = TypeVar('T')
+
+
+def parse_option(model, value):
+    """
+    get the names of an option
+    :param model: the model or widget whose class printers name the option
+    :param value: either a bare value or a str-value tuple
+    :return: a tuple of the option's names and its value
+    """
+    names = []
+    if isinstance(value, tuple) and len(value) == 2 and isinstance(value[0], str):
+        names.append(value[0])
+        value = value[1]
+
+    for printer in model.implicit_cls_plaintext_printers():
+        try:
+            names.append(printer(value))
+        except PlaintextPrintError:
+            pass
+
+    if not names:
+        raise Exception(f'no names for {value}')
+
+    return names, value
+
+
+class RawStringModel(Model[str]):
+    """
+    A string model, the counterpart of FidgetLine and FidgetPlainText
+    """
+
+    def __init__(self, title: str = None, pattern: Union[str, Pattern[str]] = None,
+                 allowed_characters: Container[str] = None, forbidden_characters: Container[str] = None,
+                 initial: str = '', **kwargs):
+        """
+        :param title: the title
+        :param pattern: a pattern the string must fully match
+        :param allowed_characters: if not None, the only characters the string may contain
+        :param forbidden_characters: if not None, characters the string may not contain
+        :param initial: the initial string
+        :param kwargs: forwarded to Model
+        """
+        super().__init__(title, **kwargs)
+        self.pattern: Optional[Pattern[str]] = re.compile(pattern) if isinstance(pattern, str) else pattern
+        self.allowed_characters = allowed_characters
+        self.forbidden_characters = forbidden_characters
+        self.text = initial
+
+    def parse(self):
+        return self.text
+
+    def validate(self, value):
+        super().validate(value)
+        if self.pattern and not self.pattern.fullmatch(value):
+            raise ValidationError(f'value must match pattern {self.pattern}', offender=self)
+        if self.allowed_characters is not None:
+            try:
+                i, c = next(
+                    ((i, c) for (i, c) in enumerate(value) if c not in self.allowed_characters)
+                )
+            except StopIteration:
+                pass
+            else:
+                raise ValidationError(f'character {c} (position {i}) is not allowed', offender=self)
+        if self.forbidden_characters is not None:
+            try:
+                i, c = next(
+                    ((i, c) for (i, c) in enumerate(value) if c in self.forbidden_characters)
+                )
+            except StopIteration:
+                pass
+            else:
+                raise ValidationError(f'character {c} (position {i}) is forbidden', offender=self)
+
+    def fill(self, v: str = ''):
+        self.text = v
+
+    @staticmethod
+    def raw_text(v):
+        return v
+
+    @classmethod
+    def cls_plaintext_parsers(cls):
+        yield cls.raw_text
+        yield from super().cls_plaintext_parsers()
+
+
+class LabelModel(Model[T]):
+    """
+    A model that immutably contains a single value, the counterpart of FidgetLabel
+    """
+
+    def __init__(self, title: str = None, **kwargs):
+        super().__init__(title, **kwargs)
+        self.names = ()
+        self._value = None
+
+    def parse(self):
+        return self._value
+
+    def fill(self, key):
+        self.names, self._value = parse_option(self, key)
+
+    def singleton(self, v):
+        if v in self.names:
+            return self._value
+        raise PlaintextParseError(f'can only parse {self.names}')
+
+    def plaintext_parsers(self):
+        yield self.singleton
+        yield RawStringModel.raw_text
+        yield from super().plaintext_parsers()
+
+
+class OptionsModel(Generic[T], Model[T]):
+    """
+    A model of a choice between discrete options, the counterpart of FidgetCombo
+    """
+
+    def __init__(self, title: str = None, options: Iterable[Union[T, Tuple[str, T]]] = (),
+                 initial_index: int = -1, initial_value=..., **kwargs):
+        """
+        :param title: the title
+        :param options: an iterable of options: either bare values or str-value tuples
+        :param initial_index: the index of the initial option, -1 for none
+        :param initial_value: the initial option, takes precedence over initial_index if found
+        :param kwargs: forwarded to Model
+        """
+        super().__init__(title, **kwargs)
+        self.options = [parse_option(self, o) for o in options]
+        self.name_lookup = {}
+        for i, (names, o) in enumerate(self.options):
+            for name in names:
+                v = (i, o)
+                if self.name_lookup.setdefault(name, v) != v:
+                    raise ValueError('duplicate name: ' + name)
+
+        self.index = -1
+        for i, (_, o) in enumerate(self.options):
+            if o == initial_value:
+                self.fill_index(i)
+                break
+        else:
+            self.fill_index(initial_index)
+
+    def parse(self):
+        if self.index == -1:
+            raise ParseError('value is unset', offender=self)
+        return self.options[self.index][1]
+
+    def fill_index(self, index):
+        if not -1 <= index < len(self.options):
+            # mirrors a combo box, which ignores out-of-range indices
+            return
+        self.index = index
+
+    def fill(self, key: Union[T, int, str]):
+        # try by value equation
+        for i, (_, option) in enumerate(self.options):
+            if option == key:
+                self.fill_index(i)
+                return
+
+        # try by name
+        if isinstance(key, str):
+            for i, (names, _) in enumerate(self.options):
+                if key in names:
+                    self.fill_index(i)
+                    return
+
+        # try by index
+        if isinstance(key, int):
+            self.fill_index(key)
+            return
+
+        raise ValueError('value is not a valid fill value')
+
+    def from_values(self, text):
+        try:
+            return self.name_lookup[text][1]
+        except KeyError as e:
+            raise PlaintextParseError(e)
+
+    def name(self, v):
+        for names, o in self.options:
+            if o == v:
+                return names[0]
+        raise PlaintextPrintError('no values matched')
+
+    def plaintext_parsers(self):
+        yield self.from_values
+        yield from super().plaintext_parsers()
+
+    def plaintext_printers(self):
+        yield self.name
+        yield from super().plaintext_printers()
+
+
+class CheckBoxModel(Generic[T], OptionsModel[T]):
+    """
+    A model that contains one of two values, the counterpart of FidgetCheckBox
+    """
+
+    def __init__(self, title: str = None, options: Iterable[Union[T, Tuple[str, T]]] = (False, True), **kwargs):
+        super().__init__(title, options, **kwargs)
+        if len(self.options) != 2:
+            raise ValueError('CheckBoxModel must have exactly 2 options, got ' + str(len(self.options)))
+
+    def parse(self):
+        return self.options[self.index][1]
+
+    def fill_index(self, index):
+        # a checkbox is only ever checked or unchecked
+        self.index = int(bool(index))
+
+
+class DiscreteSpinModel(Generic[T], OptionsModel[T]):
+    """
+    A model of a spin box between discrete options, the counterpart of FidgetDiscreteSpin
+    """
+
+    def __init__(self, title: str = None, options: Iterable[Union[T, Tuple[str, T]]] = (), wrap=False, **kwargs):
+        """
+        :param title: the title
+        :param options: an iterable of options: either bare values or str-value tuples
+        :param wrap: whether indices out of range wrap around the options
+        :param kwargs: forwarded to OptionsModel
+        """
+        self.wrap = wrap
+        super().__init__(title, options, **kwargs)
+
+    def parse(self):
+        return self.options[self.index % len(self.options)][1]
+
+    def fill_index(self, index):
+        if self.wrap:
+            self.index = index % len(self.options)
+        else:
+            # a spin box clamps its value to its range
+            self.index = min(max(index, 0), len(self.options) - 1)
+
+
+class ConstModel(Generic[T], OptionsModel[T]):
+    """
+    A model with a single option, the counterpart of FidgetConst
+    """
+
+    def __init__(self, title: str = None, option: Union[T, Tuple[str, T]] = None, **kwargs):
+        super().__init__(title, [option], **kwargs)
+
+    def parse(self):
+        return self.options[0][1]
+
+    def fill_index(self, index):
+        pass
+
+
+class SpinModel(Model[Union[int, float]]):
+    """
+    A numeric model bounded to a range, the counterpart of FidgetSpin
+    """
+
+    def __init__(self, title: str = None, minimum=0, maximum=99, force_float=False, decimals: int = None,
+                 initial_value=None, **kwargs):
+        """
+        :param title: the title
+        :param minimum: the minimum value
+        :param maximum: the maximum value
+        :param force_float: whether to keep float values even if the bounds are int
+        :param decimals: the number of decimals a float value is rounded to
+        :param initial_value: the initial value, defaults to the minimum
+        :param kwargs: forwarded to Model
+        """
+        super().__init__(title, **kwargs)
+        self.use_float = force_float or (decimals is not None) \
+                         or any(isinstance(i, float) for i in (minimum, maximum))
+        self.minimum = minimum
+        self.maximum = maximum
+        self.decimals = 2 if decimals is None else decimals
+        self.number = minimum
+        if initial_value is not None:
+            self.fill(initial_value)
+
+    def parse(self):
+        return self.number
+
+    def fill(self, v):
+        # a spin box clamps its value to its range
+        v = min(max(v, self.minimum), self.maximum)
+        if self.use_float:
+            v = round(float(v), self.decimals)
+        else:
+            v = int(v)
+        self.number = v
+
+    def plaintext_parsers(self):
+        yield from (FloatModel if self.use_float else IntModel).cls_plaintext_parsers()
+        yield from super().plaintext_parsers()
+
+    def plaintext_printers(self):
+        yield from (FloatModel if self.use_float else IntModel).cls_plaintext_printers()
+        yield from super().plaintext_printers()
+
+
+class SimpleEditModel(Generic[T], ConverterModel[str, T]):
+    """
+    A model of a single text edit, using the plaintext parsers to convert the value, the counterpart of
+    SimpleLineEdit and SimplePlainEdit
+    """
+
+    def __init__(self, title: str = None, adapters=None, **kwargs):
+        """
+        :param title: the title
+        :param adapters: a class whose class plaintext adapters convert the text, defaults to the model's class
+        :param kwargs: forwarded to Model
+        """
+        super().__init__(RawStringModel(title), **kwargs)
+        self.adapters = adapters or type(self)
+
+    def back_convert(self, v: T):
+        printer = self.joined_plaintext_printer
+        return printer(v)
+
+    def convert_result(self, v: str):
+        result = try_parse(self.joined_plaintext_parser, v)
+        if not result:
+            return Fail(ParseError, offender=self.inner, cause=result)
+        return result
+
+    def plaintext_parsers(self):
+        return self.adapters.cls_plaintext_parsers()
+
+    def plaintext_printers(self):
+        # the inner's printers are all trivial
+        return self.adapters.cls_plaintext_printers()
+
+
+int_parser = wrap_plaintext_parser(ValueError, parse_int)
+
+int_printers = (
+    hex,
+    bin,
+    oct,
+    format_printer('n'),
+    format_printer(','),
+    format_printer('_b'),
+    format_printer('_X'),
+)
+
+float_parser = wrap_plaintext_parser(ValueError, float)
+
+
+@regex_parser(r'([0-9]*(\.[0-9]+)?)%')
+def percentage(m):
+    try:
+        return float(m[1]) / 100
+    except ValueError as e:
+        raise PlaintextParseError() from e
+
+
+@regex_parser(r'(?P<num>[0-9]+)\s*/\s*(?P<den>[0-9]*[1-9][0-9]*)')
+def ratio(m):
+    n = m['num']
+    d = m['den']
+
+    try:
+        n = float(n)
+        d = float(d)
+    except ValueError as e:
+        raise PlaintextParseError() from e
+
+    try:
+        return n / d
+    except ValueError as e:
+        raise PlaintextParseError() from e
+
+
+float_printers = (
+    format_printer('f'),
+    format_printer('e'),
+    format_printer('g'),
+    format_printer('%'),
+)
+
+complex_parser = wrap_plaintext_parser(ValueError, complex)
+
+
+class IntModel(SimpleEditModel[int]):
+    """
+    A text model that converts the value to int, the counterpart of FidgetInt
+    """
+
+    @classmethod
+    def cls_plaintext_parsers(cls):
+        yield int_parser
+        yield from super().cls_plaintext_parsers()
+
+    @classmethod
+    def cls_plaintext_printers(cls):
+        yield from super().cls_plaintext_printers()
+        yield from int_printers
+
+
+class FloatModel(SimpleEditModel[float]):
+    """
+    A text model that converts the value to float, the counterpart of FidgetFloat
+    """
+
+    @classmethod
+    def cls_plaintext_parsers(cls):
+        yield float_parser
+        yield percentage
+        yield ratio
+        yield from super().cls_plaintext_parsers()
+
+    @classmethod
+    def cls_plaintext_printers(cls):
+        yield from super().cls_plaintext_printers()
+        yield from float_printers
+
+
+class ComplexModel(SimpleEditModel[complex]):
+    """
+    A text model that converts the value to complex, the counterpart of FidgetComplex
+    """
+
+    @classmethod
+    def cls_plaintext_parsers(cls):
+        yield complex_parser
+        yield from super().cls_plaintext_parsers()
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+from typing import Dict, Any
+
+from inspect import signature, Parameter
+from functools import partial
+
+from fidget.model.model import Model
+from fidget.model.primitives import RawStringModel, LabelModel, OptionsModel, CheckBoxModel, DiscreteSpinModel, \
+    ConstModel, SpinModel, SimpleEditModel
+from fidget.model.wrappers import ConverterModel, OptionalModel, StackedModel
+from fidget.model.compound import DictModel, TupleModel
+from fidget.model.matrix import MatrixModel, TableModel
+
+
+def _arguments(template) -> Dict[str, Any]:
+    """
+    :return: the arguments a template would construct its widget with, by name
+    """
+    params = signature(template.widget_cls.__init__).parameters
+    bound = signature(template.widget_cls.__init__).bind_partial(None, *template.args, **template.kwargs).arguments
+    ret = {}
+    for name, v in bound.items():
+        kind = params[name].kind
+        if kind == Parameter.VAR_KEYWORD:
+            ret.update(v)
+        elif kind != Parameter.VAR_POSITIONAL:
+            ret[name] = v
+    return ret
+
+
+def _setting(template, arguments, name, default=None):
+    """
+    :return: an argument of a template, falling back to the upper-case attribute of the widget class
+    """
+    ret = arguments.get(name)
+    if ret is None:
+        ret = getattr(template.widget_cls, name.upper(), None)
+    if ret is None:
+        ret = default
+    return ret
+
+
+def _named_templates(templates):
+    """
+    :return: name-template pairs of an iterable of templates or name-template tuples
+    """
+    for t in templates:
+        try:
+            template = t.template_of()
+        except AttributeError:
+            name, t = t
+            yield name, t.template_of()
+        else:
+            yield template.title, template
+
+
+_reproduced_packages = ('fidget.core.', 'fidget.widgets.')
+
+_dropped_overrides = frozenset(('parse', 'parse_result', 'validate', 'convert', 'convert_result', 'back_convert',
+                                'plaintext_parsers', 'plaintext_printers', 'cls_plaintext_parsers',
+                                'cls_plaintext_printers'))
+
+
+def _check_reproducible(cls, cls_adapters=False):
+    """
+    check that a model of a widget class would parse and validate like the widget. Only the widget classes of fidget
+     itself have model counterparts, so a subclass elsewhere may not override their parsing or validation.
+    :param cls: the widget class
+    :param cls_adapters: whether the model carries over the class plaintext adapters of the widget class
+    :raises TypeError: if a subclass overrides a method that the model would not carry over
+    """
+    for klass in cls.__mro__:
+        if klass.__module__.startswith(_reproduced_packages):
+            break
+        for name, v in vars(klass).items():
+            if getattr(v, '__plaintext_parser__', False) or getattr(v, '__plaintext_printer__', False):
+                if cls_adapters and (getattr(v, '__is_cls__', False) or isinstance(v, (classmethod, staticmethod))):
+                    continue
+            elif name not in _dropped_overrides \
+                    or (cls_adapters and name in ('cls_plaintext_parsers', 'cls_plaintext_printers')):
+                continue
+            raise TypeError(f'cannot model {cls.__name__}, {klass.__name__}.{name} changes how it parses or validates,'
+                            f' pass validation_func instead')
+
+
+def model_of(template_like) -> Model:
+    """
+    create a headless model from a widget template
+    :param template_like: a FidgetTemplate, or a Fidget class
+    :return: a Model that parses, validates and fills like the template's widget
+    :raises TypeError: if the widget has no model counterpart, or if its class overrides the parsing, validation or
+     plaintext adapters of a widget class of fidget
+    """
+    # the widget classes are only needed if a template exists, so Qt is already loaded
+    from fidget.widgets import FidgetConverter, FidgetTransparentConverter, FidgetOptional, FidgetStacked, \
+        FidgetTuple, FidgetMatrix, FidgetTable, FidgetCheckBox, FidgetCombo, FidgetConst, FidgetDiscreteSpin, \
+        FidgetSpin, FidgetLabel, FidgetEditCombo, FidgetMinimal, SimpleLineEdit, SimplePlainEdit, FidgetMatrixView, \
+        FidgetTableView
+    from fidget.widgets.mapping import FidgetMapping
+    from fidget.widgets.rawstring import FidgetRawString
+
+    template = template_like.template_of()
+    cls = template.widget_cls
+    arguments = _arguments(template)
+    title = arguments.get('title')
+    model_args = {'validation_func': arguments.get('validation_func')}
+
+    def inner(name):
+        return model_of(_setting(template, arguments, name))
+
+    is_simple_edit = issubclass(cls, (SimpleLineEdit, SimplePlainEdit))
+    _check_reproducible(cls, cls_adapters=is_simple_edit)
+
+    if is_simple_edit:
+        return SimpleEditModel(title, adapters=cls, **model_args)
+    if issubclass(cls, (FidgetTransparentConverter, FidgetMinimal)):
+        # a minimal widget holds its inner's value, but validates it with its own validation_func as well
+        return ConverterModel(inner('inner_template'), converter_func=lambda v: v, back_converter_func=lambda v: v,
+                              **model_args)
+    if issubclass(cls, FidgetConverter):
+        return ConverterModel(inner('inner_template'), converter_func=arguments.get('converter_func'),
+                              back_converter_func=arguments.get('back_converter_func'), **model_args)
+    if issubclass(cls, FidgetOptional):
+        return OptionalModel(inner('inner_template'), default_state=arguments.get('default_state', False),
+                             none_value=arguments.get('none_value'), **model_args)
+    if issubclass(cls, FidgetStacked):
+        inners = {name: model_of(t) for name, t in _named_templates(_setting(template, arguments, 'inner_templates'))}
+        return StackedModel(title, inners, **model_args)
+    if issubclass(cls, FidgetMapping):
+        inners = {}
+        for name, t in _named_templates(_setting(template, arguments, 'inner_templates')):
+            if name in inners:
+                raise TypeError(f'duplicate inner name: {name}')
+            inners[name] = model_of(t)
+        return DictModel(title, inners, **model_args)
+    if issubclass(cls, FidgetTuple):
+        inners = [model_of(t) for t in _setting(template, arguments, 'inner_templates')]
+        return TupleModel(title, inners, **model_args)
+    if issubclass(cls, (FidgetMatrix, FidgetMatrixView)):
+        return MatrixModel(partial(model_of, _setting(template, arguments, 'inner_template')),
+                           rows=_setting(template, arguments, 'rows'), columns=_setting(template, arguments, 'columns'),
+                           parse_memo_size=_setting(template, arguments, 'parse_memo_size'), **model_args)
+    if issubclass(cls, (FidgetTable, FidgetTableView)):
+        columns = [partial(model_of, t) for t in _setting(template, arguments, 'inner_templates')]
+        return TableModel(title, columns, rows=_setting(template, arguments, 'rows'),
+                          parse_memo_size=_setting(template, arguments, 'parse_memo_size'), **model_args)
+
+    if issubclass(cls, (FidgetCheckBox, FidgetCombo, FidgetConst, FidgetDiscreteSpin)):
+        if issubclass(cls, FidgetConst):
+            option = arguments.get('option')
+            if option is not None:
+                arguments['options'] = [option]
+        option_args = dict(
+            options=_setting(template, arguments, 'options'),
+            initial_index=_setting(template, arguments, 'initial_index'),
+            initial_value=_setting(template, arguments, 'initial_value'),
+            **model_args
+        )
+        if issubclass(cls, FidgetCheckBox):
+            return CheckBoxModel(title, **option_args)
+        if issubclass(cls, FidgetConst):
+            return ConstModel(title, option_args.pop('options')[0], **option_args)
+        if issubclass(cls, FidgetDiscreteSpin):
+            return DiscreteSpinModel(title, wrap=_setting(template, arguments, 'wrap'), **option_args)
+        return OptionsModel(title, **option_args)
+    if issubclass(cls, FidgetSpin):
+        # a spin box only applies truthy bounds over its defaults
+        return SpinModel(title,
+                         minimum=_setting(template, arguments, 'minimum') or 0,
+                         maximum=_setting(template, arguments, 'maximum') or 99,
+                         force_float=_setting(template, arguments, 'force_float'),
+                         decimals=_setting(template, arguments, 'decimals'),
+                         initial_value=_setting(template, arguments, 'initial_value') or None, **model_args)
+    if issubclass(cls, FidgetLabel):
+        return LabelModel(title, **model_args)
+    if issubclass(cls, FidgetRawString) and not issubclass(cls, FidgetEditCombo):
+        return RawStringModel(title, pattern=_setting(template, arguments, 'pattern'),
+                              allowed_characters=_setting(template, arguments, 'allowed_characters'),
+                              forbidden_characters=_setting(template, arguments, 'forbidden_characters'),
+                              initial=_setting(template, arguments, 'initial', ''), **model_args)
+
+    raise TypeError(f'no model for widget class {cls.__name__}')
@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+from typing import TypeVar, Generic, Callable, Optional, Union, Mapping, Dict
+
+from collections import namedtuple
+from functools import wraps, partial, update_wrapper
+
+from fidget.core.plaintext_adapter import PlaintextParseError, PlaintextPrintError, high_priority
+from fidget.core.fidget_value import ParseError, ValidationError
+from fidget.core.result import Ok, Fail, Result, complete_result_method
+from fidget.core.offload import is_process_safe, offload
+
+from fidget.model.model import Model, is_trivial_printer
+
+T = TypeVar('T')
+F = TypeVar('F')
+C = TypeVar('C')
+
+
+class ConverterModel(Generic[F, T], Model[T]):
+    """
+    A model wrapper that only converts the value to another type, the counterpart of FidgetConverter
+    """
+
+    def __init__(self, inner: Model[F], converter_func: Callable[[F], T] = None,
+                 back_converter_func: Optional[Callable[[T], F]] = None, title: str = None, **kwargs):
+        """
+        :param inner: the model to wrap
+        :param converter_func: a conversion function, run in a worker process if marked with process_safe
+        :param back_converter_func: a backwards conversion function, run in a worker process if marked with
+            process_safe
+        :param title: the title, defaults to the inner's title
+        :param kwargs: forwarded to Model
+        """
+        super().__init__(title if title is not None else inner.title, **kwargs)
+        self.inner = inner
+        self.converter_func = converter_func
+        self.back_converter_func = back_converter_func
+
+    def parse_result(self):
+        result = self.inner.parse_result()
+        if not result:
+            return result
+        return self.convert_result(result.value)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        complete_result_method(cls, 'convert', ConverterModel.convert_result)
+
+    def validate(self, value: T):
+        if self.back_convert:
+            bc = self.back_convert(value)
+            self.inner.validate(bc)
+        super().validate(value)
+
+    def convert(self, v: F) -> T:
+        if not self.converter_func:
+            raise Exception('a converter function must be provided')
+        if is_process_safe(self.converter_func):
+            return offload(self.converter_func, v)
+        return self.converter_func(v)
+
+    def convert_result(self, v: F) -> Result[T]:
+        """
+        convert a value like convert, but return the error rather than raise it
+        :inheritors: override either convert or convert_result, the other is completed when the class is created
+        """
+        try:
+            return Ok(self.convert(v))
+        except (ParseError, ValidationError) as e:
+            return Fail.of(e)
+
+    @property
+    def back_convert(self):
+        if self.back_converter_func and is_process_safe(self.back_converter_func):
+            return partial(offload, self.back_converter_func)
+        return self.back_converter_func
+
+    def plaintext_parsers(self):
+        def wrap_parser(parser):
+            @wraps(parser)
+            def p(*args, **kwargs):
+                f = parser(*args, **kwargs)
+                try:
+                    return self.convert(f)
+                except ParseError as e:
+                    raise PlaintextParseError from e
+
+            return p
+
+        yield from super().plaintext_parsers()
+        for parser in self.inner.plaintext_parsers():
+            yield wrap_parser(parser)
+
+    def plaintext_printers(self):
+        def wrap_printer(printer):
+            @wraps(printer)
+            def p(*args, **kwargs):
+                f = self.back_convert(*args, **kwargs)
+                return printer(f)
+
+            return p
+
+        yield from super().plaintext_printers()
+        if self.back_convert:
+            for printer in self.inner.plaintext_printers():
+                if is_trivial_printer(printer):
+                    continue
+
+                yield wrap_printer(printer)
+
+    def _fill(self, v: T):
+        self.inner.fill(self.back_convert(v))
+
+    @property
+    def fill(self):
+        return (self.inner.fill and self.back_convert) and self._fill
+
+
+class OptionalModel(Generic[T, C], Model[Union[T, C]]):
+    """
+    A model wrapper that can be disabled, setting the value to None or another singleton, the counterpart of
+    FidgetOptional
+    """
+    singleton_names = {
+        None: frozenset(['none']),
+        NotImplemented: frozenset(['notimplemented', 'not implemented']),
+        ...: frozenset(['...', 'ellipsis']),
+        (): frozenset(['()']),
+        0: frozenset(['0']),
+        '': frozenset(['""', "''"])
+    }
+
+    def __init__(self, inner: Model[T], default_state=False, none_value: C = None, title: str = None, **kwargs):
+        """
+        :param inner: the model to wrap
+        :param default_state: whether the model starts enabled
+        :param none_value: the value of the model when it is disabled
+        :param title: the title, defaults to the inner's title
+        :param kwargs: forwarded to Model
+        """
+        super().__init__(title if title is not None else inner.title, **kwargs)
+        self.inner = inner
+        self.enabled = default_state
+        self.none_value = none_value
+
+        none_names = self.singleton_names.get(self.none_value)
+        if none_names:
+            @high_priority
+            def NoneParser(s: str):
+                if s.lower() in none_names:
+                    return self.none_value
+                raise PlaintextParseError(f'this parser only accepts {next(iter(none_names))}')
+
+            self.none_parser = NoneParser
+        else:
+            self.none_parser = None
+
+    def parse(self):
+        if self.enabled:
+            return self.inner.parse()
+        return self.none_value
+
+    def validate(self, v):
+        super().validate(v)
+        if v is not self.none_value:
+            self.inner.validate(v)
+
+    def plaintext_printers(self):
+        def printer_wrapper(ip):
+            @wraps(ip)
+            def wrapper(v):
+                if v is self.none_value:
+                    raise PlaintextPrintError(f'this printer cannot handle {v!r}')
+                return ip(v)
+
+            return wrapper
+
+        yield from super().plaintext_printers()
+        for ip in self.inner.plaintext_printers():
+            if is_trivial_printer(ip):
+                continue
+            yield printer_wrapper(ip)
+
+    def plaintext_parsers(self):
+        yield from super().plaintext_parsers()
+        yield from self.inner.plaintext_parsers()
+        if self.none_parser:
+            yield self.none_parser
+
+    def _fill(self, v):
+        if v is self.none_value:
+            self.enabled = False
+        else:
+            self.enabled = True
+            self.inner.fill(v)
+
+    @property
+    def fill(self):
+        return self.inner.fill and self._fill
+
+
+class StackedModel(Generic[T], Model[T]):
+    """
+    Models, only one of which has a value at any time, the counterpart of FidgetStacked
+    """
+    targeted_fill = namedtuple('targeted_fill', 'option_name value')
+
+    def __init__(self, title, inners: Mapping[str, Model[T]], **kwargs):
+        """
+        :param title: the title
+        :param inners: a mapping of option names to models, the first is initially selected
+        :param kwargs: forwarded to Model
+        """
+        super().__init__(title, **kwargs)
+        self.inners: Dict[str, Model[T]] = dict(inners)
+        if not self.inners:
+            raise ValueError('at least one inner model must be provided')
+        self.current_name = next(iter(self.inners))
+
+    def current_inner(self) -> Model[T]:
+        return self.inners[self.current_name]
+
+    def select(self, option_name: Union[str, int]):
+        """
+        select the current option
+        :param option_name: the name or index of the option
+        """
+        if isinstance(option_name, int):
+            option_name = list(self.inners)[option_name]
+        elif option_name not in self.inners:
+            raise KeyError(option_name)
+        if option_name != self.current_name:
+            self.current_name = option_name
+            # the printers, and the order of the parsers, are those of the current option
+            self.invalidate_plaintext_adapters()
+
+    def parse(self):
+        return self.current_inner().parse()
+
+    def validate(self, v):
+        super().validate(v)
+        self.current_inner().validate(v)
+
+    def plaintext_printers(self):
+        return self.current_inner().plaintext_printers()
+
+    def plaintext_parsers(self):
+        def parser_wrap(option_name, parser, *args, **kwargs):
+            return self.targeted_fill(option_name=option_name, value=parser(*args, **kwargs))
+
+        current = self.current_inner()
+        yield from current.plaintext_parsers()
+        for n, o in self.inners.items():
+            if o is current:
+                continue
+            for p in o.plaintext_parsers():
+                new_parser = partial(parser_wrap, n, p)
+                update_wrapper(new_parser, p)
+                new_parser.__name__ = n + ': ' + p.__name__
+                yield new_parser
+
+    def fill(self, v: Union[T, targeted_fill]):
+        if isinstance(v, self.targeted_fill):
+            self.select(v.option_name)
+            v = v.value
+        self.current_inner().fill(v)
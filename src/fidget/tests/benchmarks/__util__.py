@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from typing import Callable, Dict, List, Tuple, Optional
+from statistics import median
+from time import perf_counter
+import json
+import os
+import platform
+import sys
+
+
+def offscreen():
+    """
+    make Qt render offscreen, so benchmarks run headless. Must be called before a QApplication is created.
+    """
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+
+def measure(op: Callable[[], None], repeat: int, budget: float) -> List[float]:
+    """
+    time an operation repeatedly
+    :param op: the operation to time
+    :param repeat: the maximum number of runs
+    :param budget: stop repeating once this many seconds were spent
+    :return: the times of all the runs, in seconds
+    """
+    ret = []
+    total = 0.0
+    for _ in range(repeat):
+        start = perf_counter()
+        op()
+        elapsed = perf_counter() - start
+        ret.append(elapsed)
+        total += elapsed
+        if total >= budget:
+            break
+    return ret
+
+
+def summarize(name: str, size: int, runs: List[float]) -> dict:
+    return {
+        'benchmark': name,
+        'size': size,
+        'runs': len(runs),
+        'min': min(runs),
+        'median': median(runs),
+        'mean': sum(runs) / len(runs),
+    }
+
+
+def environment() -> dict:
+    """
+    :return: a description of the environment the benchmarks ran in, to tell apart results from different backends
+    """
+    from fidget.backend import load
+
+    backend = load()
+    return {
+        'backend': backend.__name__,
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'qpa': os.environ.get('QT_QPA_PLATFORM'),
+    }
+
+
+def dump(path: str, env: dict, results: List[dict]):
+    with open(path, 'w') as f:
+        json.dump({'environment': env, 'results': results}, f, indent=1)
+
+
+def load_results(path: str) -> Tuple[dict, Dict[Tuple[str, int], dict]]:
+    with open(path) as f:
+        d = json.load(f)
+    return d['environment'], {(r['benchmark'], r['size']): r for r in d['results']}
+
+
+def compare(baseline: Dict[Tuple[str, int], dict], results: List[dict], threshold: float,
+            out=sys.stdout) -> List[Tuple[str, int, float]]:
+    """
+    print a comparison of results against a baseline, by minimum time
+    :param threshold: the ratio of times above which a result is a regression
+    :return: the regressions, as benchmark, size and ratio
+    """
+    regressions = []
+    print(f'{"benchmark":<40} {"size":>7} {"baseline ms":>12} {"current ms":>11} {"ratio":>7}', file=out)
+    for r in results:
+        base: Optional[dict] = baseline.get((r['benchmark'], r['size']))
+        if base is None:
+            print(f'{r["benchmark"]:<40} {r["size"]:>7} {"-":>12} {r["min"] * 1000:>11.3f} {"new":>7}', file=out)
+            continue
+        ratio = r['min'] / base['min'] if base['min'] else float('inf')
+        flag = ''
+        if ratio > threshold:
+            regressions.append((r['benchmark'], r['size'], ratio))
+            flag = ' REGRESSION'
+        print(f'{r["benchmark"]:<40} {r["size"]:>7} {base["min"] * 1000:>12.3f} {r["min"] * 1000:>11.3f}'
+              f' {ratio:>7.2f}{flag}', file=out)
+    return regressions
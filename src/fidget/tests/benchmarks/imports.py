@@ -0,0 +1,74 @@
+"""
+Measure the time it takes a fresh process to import parts of fidget, as paid by every short-lived process that uses
+it.
+
+Each statement is timed in a new interpreter, so nothing is already imported, and the best of several runs is
+reported. Also reports whether a Qt backend was loaded by the statement: fidget.core and fidget.model should not load
+one, and fidget.widgets should only load one once a widget is accessed.
+
+usage: python -m fidget.tests.benchmarks.imports [--repeat N]
+"""
+from argparse import ArgumentParser
+import os
+import subprocess
+import sys
+
+statements = [
+    'import fidget.core',
+    'import fidget.model',
+    'import fidget.widgets',
+    'from fidget.widgets import FidgetInt',
+    'from fidget.widgets import FidgetMatrix',
+    'from fidget.widgets import *',
+]
+
+_timer = '''
+from time import perf_counter
+import sys
+start = perf_counter()
+exec({!r})
+elapsed = perf_counter() - start
+print(elapsed, 'fidget.backend.QtCore' in sys.modules)
+'''
+
+
+def time_import(statement: str, env=None):
+    """
+    :return: the time, in seconds, it takes a fresh interpreter to run a statement, and whether it loaded Qt
+    """
+    out = subprocess.run([sys.executable, '-c', _timer.format(statement)], env=env, check=True,
+                         stdout=subprocess.PIPE, universal_newlines=True).stdout
+    elapsed, loaded_qt = out.split()
+    return float(elapsed), loaded_qt == 'True'
+
+
+def main(args=None):
+    parser = ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(args)
+
+    env = dict(os.environ)
+    env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    cold_env = dict(env)
+    cold_env.pop('FIDGET_BACKEND', None)
+
+    print(f'{"statement":<70} {"ms":>8} {"Qt":>4}')
+    for statement in statements:
+        results = [time_import(statement, env) for _ in range(args.repeat)]
+        elapsed = min(e for e, _ in results)
+        loaded_qt = results[0][1]
+        print(f'{statement:<70} {elapsed * 1000:>8.1f} {"yes" if loaded_qt else "no":>4}')
+
+    print()
+    print('loading a backend, with and without a backend name set in the environment')
+    statement = 'from fidget.backend import load; load()'
+    backend_name = subprocess.run([sys.executable, '-c', 'from fidget.backend import load; print(load().__name__)'],
+                                  env=cold_env, check=True, stdout=subprocess.PIPE,
+                                  universal_newlines=True).stdout.strip()
+    for name, e in (('probed', cold_env), ('from environment', dict(cold_env, FIDGET_BACKEND=backend_name))):
+        elapsed = min(time_import(statement, e)[0] for _ in range(args.repeat))
+        print(f'{name:<70} {elapsed * 1000:>8.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""
+Compare running a validator inline with offloading it to a worker process, and passing large buffers to and from the
+worker through shared memory against pickling them.
+
+Offloading has a fixed cost of a round trip to the worker process (and a one-time cost of spawning it), so a single
+call only pays off when the work is heavy enough. Where offload shines is concurrent validation: several widgets with
+async validation share the GIL in worker threads, but validate in parallel in worker processes.
+
+usage: python -m fidget.tests.benchmarks.offload [--repeat N] [--concurrent N]
+"""
+from array import array
+from argparse import ArgumentParser
+from time import perf_counter
+from concurrent.futures import wait
+
+import fidget.core.offload as offload_mod
+from fidget.core.offload import offload, submit, process_pool
+from fidget.core.worker import thread_pool
+
+
+def checksum(data: bytes):
+    # a pure-python, cpu-bound stand-in for a heavy validator
+    ret = 0
+    for b in data:
+        ret = (ret * 31 + b) & 0xffffffff
+    return ret
+
+
+def echo(data):
+    return data
+
+
+def timed(func, *args, repeat):
+    start = perf_counter()
+    for _ in range(repeat):
+        func(*args)
+    return (perf_counter() - start) / repeat
+
+
+def main(args=None):
+    parser = ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--concurrent', type=int, default=4)
+    args = parser.parse_args(args)
+
+    # spawn the workers in advance, so that startup isn't counted
+    list(process_pool().map(echo, range(process_pool()._max_workers)))
+
+    print('single call: checksum over data of a given size')
+    print(f'{"size":>10} {"inline ms":>10} {"offload ms":>11} {"speedup":>8}')
+    for size in (1 << 8, 1 << 12, 1 << 16, 1 << 20):
+        data = bytes(size)
+        inline = timed(checksum, data, repeat=args.repeat)
+        off = timed(offload, checksum, data, repeat=args.repeat)
+        print(f'{size:>10} {inline * 1000:>10.2f} {off * 1000:>11.2f} {inline / off:>8.2f}')
+
+    print()
+    print(f'concurrent: {args.concurrent} checksums at once, as with async validation in worker threads or processes')
+    print(f'{"size":>10} {"thread ms":>10} {"process ms":>11} {"speedup":>8}')
+    for size in (1 << 8, 1 << 12, 1 << 16, 1 << 20):
+        data = bytes(size)
+        threaded = timed(
+            lambda: wait([thread_pool().submit(checksum, data) for _ in range(args.concurrent)]),
+            repeat=args.repeat)
+        processed = timed(
+            lambda: wait([submit(checksum, data) for _ in range(args.concurrent)]),
+            repeat=args.repeat)
+        print(f'{size:>10} {threaded * 1000:>10.2f} {processed * 1000:>11.2f} {threaded / processed:>8.2f}')
+
+    print()
+    print('transfer: round trip of an array through a worker process')
+    print(f'{"size":>10} {"pickle ms":>10} {"shared ms":>10} {"speedup":>8}')
+    threshold = offload_mod.SHARED_MEMORY_THRESHOLD
+    try:
+        for size in (1 << 16, 1 << 20, 1 << 24, 1 << 26):
+            data = array('B', bytes(size))
+            offload_mod.SHARED_MEMORY_THRESHOLD = float('inf')
+            pickled = timed(offload, echo, data, repeat=args.repeat)
+            offload_mod.SHARED_MEMORY_THRESHOLD = 0
+            shared = timed(offload, echo, data, repeat=args.repeat)
+            print(f'{size:>10} {pickled * 1000:>10.2f} {shared * 1000:>10.2f} {pickled / shared:>8.2f}')
+    finally:
+        offload_mod.SHARED_MEMORY_THRESHOLD = threshold
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,346 @@
+"""
+A headless benchmark suite for Fidget: construction time of each widget class, fill_value time, edit-to-indicator
+latency and plaintext round trips of compound widgets, across sizes (the number of inner widgets).
+
+Results can be saved as JSON and compared against a previous run (of the same or another backend), to spot
+regressions.
+
+usage: python -m fidget.tests.benchmarks.suite [--backend PySide6] [--sizes 10,100,1000,10000] [--out results.json]
+    [--compare baseline.json] [--filter edit/]
+"""
+from __future__ import annotations
+
+from typing import Callable, Dict, Iterable, List
+from argparse import ArgumentParser
+from itertools import cycle
+from functools import partial
+from math import ceil
+import sys
+
+from fidget.tests.benchmarks.__util__ import offscreen, measure, summarize, environment, dump, load_results, compare
+
+GROUP_SIZE = 10
+"""the number of leaves in each group of nested compound widgets, and the number of matrix columns"""
+
+
+def simple_constructors() -> Dict[str, Callable[[], object]]:
+    """
+    :return: a constructor for each widget class exported from fidget.widgets. Compound widgets are constructed with a
+        couple of inner widgets, COMPOUNDS benchmarks them by size.
+    """
+    import fidget.widgets as widgets
+    from fidget.core import Fidget
+
+    options = [('one', 1), ('two', 2), ('three', 3)]
+    kw = dict(make_title=True, make_indicator=True, make_plaintext=True)
+    i = widgets.FidgetInt.template
+    # the arguments of the classes that need more than a title
+    special: Dict[str, Callable[[type], object]] = {
+        'FidgetCheckBox': lambda cls: cls('b', (0, 1), **kw),
+        'FidgetCombo': lambda cls: cls('c', options=options, **kw),
+        'FidgetConfirmer': lambda cls: cls(i('i'), **kw),
+        'FidgetQuestion': lambda cls: cls(i('i'), **kw),
+        'FidgetConst': lambda cls: cls('c', ('one', 1), **kw),
+        'FidgetConverter': lambda cls: cls(widgets.FidgetLine.template('l'), converter_func=int,
+                                           back_converter_func=str, **kw),
+        'FidgetTransparentConverter': lambda cls: cls(widgets.FidgetLine.template('l'), **kw),
+        'FidgetEditCombo': lambda cls: cls('e', options, **kw),
+        'FidgetMinimal': lambda cls: cls(i('i'), initial_value=0, **kw),
+        'FidgetOptional': lambda cls: cls(i('i'), **kw),
+        'FidgetDiscreteSpin': lambda cls: cls('s', options=options, **kw),
+        'FidgetDict': lambda cls: cls('d', [i('a'), i('b')], **kw),
+        'FidgetTuple': lambda cls: cls('t', [i('a'), i('b')], **kw),
+        'FidgetTabs': lambda cls: cls('t', [i('a'), i('b')], **kw),
+        'FidgetStacked': lambda cls: cls('s', [i('a'), i('b')], **kw),
+        'FidgetMatrix': lambda cls: cls(i('m'), **kw),
+        'FidgetMatrixView': lambda cls: cls(i('m'), **kw),
+        'FidgetTable': lambda cls: cls('t', [i('a'), i('b')], **kw),
+        'FidgetTableView': lambda cls: cls('t', [i('a'), i('b')], **kw),
+    }
+
+    ret = {}
+    for name in widgets.__all__:
+        cls = getattr(widgets, name)
+        if not (isinstance(cls, type) and issubclass(cls, Fidget)):
+            continue
+        ctor = special.get(name)
+        if ctor is None:
+            ret[name] = partial(cls, name, **kw)
+        else:
+            ret[name] = partial(ctor, cls)
+    return ret
+
+
+class Compound:
+    """
+    A compound widget benchmark subject, of a given number of leaves
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+
+    def make(self):
+        """
+        :return: a new widget of the subject
+        """
+        raise NotImplementedError
+
+    def value(self, seed: int):
+        """
+        :return: a value to fill the widget with
+        """
+        raise NotImplementedError
+
+    def editor(self, widget) -> Callable[[str], None]:
+        """
+        :return: a function that edits a widget of the subject the way a user would, with a text of an int
+        """
+        return _edited_line(widget).setText
+
+
+class Matrix(Compound):
+    def __init__(self, size):
+        super().__init__(size)
+        self.columns = min(size, GROUP_SIZE)
+        self.rows = ceil(size / self.columns)
+
+    def make(self):
+        from fidget.widgets import FidgetMatrix, FidgetInt
+        return FidgetMatrix(FidgetInt.template('m'), rows=(self.rows, 1, None), columns=(self.columns, 1, None),
+                            make_title=True, make_indicator=True, make_plaintext=True, scrollable=False)
+
+    def value(self, seed):
+        return [[seed + r * self.columns + c for c in range(self.columns)] for r in range(self.rows)]
+
+
+class Table(Compound):
+    def __init__(self, size):
+        super().__init__(size)
+        self.rows = ceil(size / 2)
+
+    def make(self):
+        from fidget.widgets import FidgetTable, FidgetInt, FidgetFloat
+        return FidgetTable('t', [FidgetInt.template('i'), FidgetFloat.template('f')], rows=(self.rows, 1, None),
+                           make_title=True, make_indicator=True, make_plaintext=True, scrollable=False)
+
+    def value(self, seed):
+        return [(seed + r, (seed + r) / 2) for r in range(self.rows)]
+
+
+class MatrixView(Matrix):
+    def make(self):
+        from fidget.widgets import FidgetMatrixView, FidgetInt
+        return FidgetMatrixView(FidgetInt.template('m'), rows=(self.rows, 1, None), columns=(self.columns, 1, None),
+                                make_title=True, make_indicator=True, make_plaintext=True)
+
+    def editor(self, widget):
+        # the cells of a view are edited through a delegate, that sets the cell's parsed value
+        return lambda text: widget.set_cell(widget.row_count - 1, widget.column_count - 1, int(text))
+
+
+class TableView(Table):
+    def make(self):
+        from fidget.widgets import FidgetTableView, FidgetInt, FidgetFloat
+        return FidgetTableView('t', [FidgetInt.template('i'), FidgetFloat.template('f')], rows=(self.rows, 1, None),
+                               make_title=True, make_indicator=True, make_plaintext=True)
+
+    def editor(self, widget):
+        return lambda text: widget.set_cell(widget.row_count - 1, 0, int(text))
+
+
+class NestedDict(Compound):
+    """
+    a dict of dicts of GROUP_SIZE ints each
+    """
+    outer_cls_name = 'FidgetDict'
+
+    def __init__(self, size):
+        super().__init__(size)
+        self.groups = ceil(size / GROUP_SIZE)
+        self.group_size = min(size, GROUP_SIZE)
+
+    def make(self):
+        import fidget.widgets as widgets
+        kwargs = dict(make_title=True, make_indicator=True, make_plaintext=True)
+        groups = [
+            widgets.FidgetDict.template(f'g{g}', [widgets.FidgetInt.template(f'f{f}') for f in range(self.group_size)],
+                                        scrollable=False, **kwargs)
+            for g in range(self.groups)
+        ]
+        return getattr(widgets, self.outer_cls_name)('d', groups, **kwargs)
+
+    def value(self, seed):
+        return {f'g{g}': {f'f{f}': seed + g * self.group_size + f for f in range(self.group_size)}
+                for g in range(self.groups)}
+
+
+class NestedTabs(NestedDict):
+    """
+    tabs of dicts of GROUP_SIZE ints each
+    """
+    outer_cls_name = 'FidgetTabs'
+
+
+class Stacked(Compound):
+    """
+    a stacked widget of int options
+    """
+
+    def make(self):
+        from fidget.widgets import FidgetStacked, FidgetInt
+        return FidgetStacked('s', [FidgetInt.template(f'o{i}') for i in range(self.size)],
+                             make_title=True, make_indicator=True, make_plaintext=True)
+
+    def value(self, seed):
+        return seed
+
+
+COMPOUNDS = {
+    'FidgetMatrix': Matrix,
+    'FidgetTable': Table,
+    'FidgetMatrixView': MatrixView,
+    'FidgetTableView': TableView,
+    'FidgetDict(nested)': NestedDict,
+    'FidgetTabs(nested)': NestedTabs,
+    'FidgetStacked': Stacked,
+}
+
+
+def _edited_line(widget):
+    """
+    :return: the line edit a user would edit in a widget: the last visible one in the widget's tree
+    """
+    from fidget.backend.QtWidgets import QLineEdit
+
+    edits = [e for e in widget.findChildren(QLineEdit) if not e.isHidden()]
+    return edits[-1]
+
+
+def benchmarks(sizes: Iterable[int]):
+    """
+    :return: an iterable of benchmark name, size, and a setup function that returns the operation to time. The setup
+        function accepts a list, to which it (and the operation) should add every widget it creates.
+    """
+    from fidget.backend.QtWidgets import QApplication
+
+    for name, ctor in simple_constructors().items():
+        yield f'construct/{name}', 1, (lambda keep, ctor=ctor: lambda: keep.append(ctor()))
+
+    for size in sizes:
+        for name, subject_cls in COMPOUNDS.items():
+            subject = subject_cls(size)
+
+            yield f'construct/{name}', size, (lambda keep, subject=subject: lambda: keep.append(subject.make()))
+
+            def fill(keep, subject=subject):
+                w = subject.make()
+                keep.append(w)
+                values = cycle([subject.value(0), subject.value(1)])
+                return lambda: w.fill_value(next(values))
+
+            yield f'fill/{name}', size, fill
+
+            def edit(keep, subject=subject):
+                w = subject.make()
+                keep.append(w)
+                w.fill_value(subject.value(0))
+                w.show()
+                edit = subject.editor(w)
+                texts = cycle(['1', '2'])
+
+                def ret():
+                    edit(next(texts))
+                    QApplication.processEvents()
+                    w.value()
+
+                return ret
+
+            yield f'edit/{name}', size, edit
+
+            def plaintext(keep, subject=subject):
+                w = subject.make()
+                keep.append(w)
+                w.fill_value(subject.value(0))
+                v = w.value().value
+
+                def ret():
+                    s = w.joined_plaintext_printer(v)
+                    w.joined_plaintext_parser(s)
+
+                return ret
+
+            yield f'plaintext/{name}', size, plaintext
+
+
+def main(args=None):
+    parser = ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--backend', help='the Qt backend to use, (PySide6, PySide2, PyQt5)')
+    parser.add_argument('--sizes', default='10,100,1000,10000',
+                        help='comma separated numbers of inner widgets of compound widgets')
+    parser.add_argument('--repeat', type=int, default=5, help='the maximum number of runs of each benchmark')
+    parser.add_argument('--budget', type=float, default=1.0,
+                        help='the time in seconds after which a benchmark stops repeating')
+    parser.add_argument('--filter', default='', help='only run benchmarks whose name contains this string')
+    parser.add_argument('--out', help='a path to write the results to, as JSON')
+    parser.add_argument('--compare', help='a path of previous results to compare against')
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help='the ratio of times above which a result is considered a regression')
+    args = parser.parse_args(args)
+
+    offscreen()
+    if args.backend:
+        from fidget.backend import prefer
+        prefer(args.backend, try_all=False)
+
+    from fidget.backend.QtWidgets import QApplication
+    from fidget.backend.QtCore import QEvent
+    app = QApplication.instance() or QApplication([])
+
+    sizes = [int(s) for s in args.sizes.split(',')]
+    env = environment()
+    print(f'backend: {env["backend"]}, python: {env["python"]}', file=sys.stderr)
+
+    results: List[dict] = []
+    failures = []
+    for name, size, setup in benchmarks(sizes):
+        if args.filter not in name:
+            continue
+        keep = []
+        try:
+            op = setup(keep)
+            runs = measure(op, args.repeat, args.budget)
+        except Exception as e:
+            # a crashing benchmark should not stop the others, but it fails the run
+            failures.append((name, size))
+            print(f'{name:<40} {size:>7} failed: {type(e).__name__}: {e}')
+            continue
+        finally:
+            # widgets are deleted explicitly by Qt, rather than left for the garbage collector, which some backends
+            # do not survive. Windows the widgets left behind (such as reparented dialogs) are deleted too, so they
+            # don't weigh on later benchmarks.
+            for w in keep + app.topLevelWidgets():
+                w.deleteLater()
+            app.sendPostedEvents(None, QEvent.DeferredDelete)
+        result = summarize(name, size, runs)
+        results.append(result)
+        print(f'{name:<40} {size:>7} {result["min"] * 1000:>11.3f} ms (median {result["median"] * 1000:.3f} ms,'
+              f' {result["runs"]} runs)')
+
+    if args.out:
+        dump(args.out, env, results)
+
+    if args.compare:
+        base_env, baseline = load_results(args.compare)
+        print()
+        print(f'compared to {args.compare} (backend: {base_env["backend"]})')
+        if compare(baseline, results, args.threshold):
+            return 1
+    if failures:
+        print()
+        print(f'{len(failures)} benchmarks failed: ' + ', '.join(f'{name} ({size})' for name, size in failures))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
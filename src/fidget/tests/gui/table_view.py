@@ -0,0 +1,17 @@
+from fidget.widgets import FidgetTableView, FidgetInt, FidgetCheckBox
+
+from fidget.tests.gui.__util__ import test_as_main
+
+
+@test_as_main('sample')
+class MyTable(FidgetTableView):
+    MAKE_TITLE = True
+    MAKE_PLAINTEXT = True
+    MAKE_INDICATOR = True
+
+    INNER_TEMPLATES = [
+        FidgetInt.template('X'),
+        FidgetCheckBox.template('pos'),
+    ]
+
+    ROWS = 1000, 1, None
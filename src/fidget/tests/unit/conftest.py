@@ -0,0 +1,12 @@
+import os
+
+import pytest
+
+# widgets are created without a display
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+
+@pytest.fixture(scope='session')
+def app():
+    from fidget.backend.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
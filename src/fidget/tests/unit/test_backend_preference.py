@@ -0,0 +1,24 @@
+import os
+
+
+def test_load_does_not_change_environment(app, monkeypatch):
+    from fidget.backend import preference
+
+    monkeypatch.delenv(preference.BACKEND_ENV, raising=False)
+    loaded = preference.loaded
+    monkeypatch.setattr(preference, 'loaded', None)
+
+    assert preference.load() is loaded
+    assert preference.BACKEND_ENV not in os.environ
+
+
+def test_workers_prefer_loaded_backend(app, monkeypatch):
+    from fidget.backend import preference
+    from fidget.core import offload
+
+    name = offload._loaded_backend()
+    assert name == preference.loaded.__name__
+
+    monkeypatch.setattr(preference, 'priority', None)
+    offload._init_worker(name)
+    assert preference.priority is preference.loaded
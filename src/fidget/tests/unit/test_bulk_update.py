@@ -0,0 +1,33 @@
+ARGS = dict(make_title=True, make_indicator=True, make_plaintext=True)
+
+
+def test_fill_value_emits_once(app):
+    from fidget.widgets import FidgetInt, FidgetMatrix
+
+    m = FidgetMatrix(FidgetInt.template('i'), rows=50, columns=50, **ARGS)
+    emitted = []
+    m.on_change.connect(lambda: emitted.append(m.value().value))
+
+    value = [[i * 50 + j for j in range(50)] for i in range(50)]
+    m.fill_value(value)
+    assert emitted == [value]
+
+    # some bindings crash when a widget tree this large is left to be collected at exit
+    m.deleteLater()
+    app.processEvents()
+
+
+def test_nested_bulk_updates_emit_once(app):
+    from fidget.widgets import FidgetInt, FidgetMatrix
+
+    m = FidgetMatrix(FidgetInt.template('i'), rows=2, columns=2, **ARGS)
+    m.fill_value([[1, 2], [3, 4]])
+    emitted = []
+    m.on_change.connect(lambda: emitted.append(m.value().value))
+
+    with m.bulk_update():
+        m.inners[0][0].fill_value(5)
+        with m.bulk_update():
+            m.inners[1][1].fill_value(6)
+        assert emitted == []
+    assert emitted == [[[5, 2], [3, 6]]]
@@ -0,0 +1,47 @@
+ARGS = dict(make_title=True, make_indicator=True, make_plaintext=True)
+
+
+def matrix(**kwargs):
+    from fidget.widgets import FidgetInt, FidgetMatrix
+
+    ret = FidgetMatrix(FidgetInt.template('i'), rows=2, columns=2, **ARGS, **kwargs)
+    ret.fill_value([[1, 2], [3, 4]])
+    return ret
+
+
+def edit(m, texts):
+    for (i, j), text in texts.items():
+        m.inners[i][j].inner.edit.setText(text)
+
+
+def test_deferred_edits_emit_once_after_event_loop(app):
+    m = matrix(defer_changes=True)
+    app.processEvents()
+    emitted = []
+    m.on_change.connect(lambda: emitted.append(m.value().value))
+
+    edit(m, {(0, 0): '10', (0, 1): '20', (1, 0): '30'})
+    assert emitted == []
+
+    app.processEvents()
+    assert emitted == [[[10, 20], [30, 4]]]
+
+    app.processEvents()
+    assert len(emitted) == 1
+
+
+def test_value_flushes_pending_changes(app):
+    m = matrix(defer_changes=True)
+    app.processEvents()
+
+    edit(m, {(1, 1): '40'})
+    assert m.value().value == [[1, 2], [3, 40]]
+
+
+def test_immediate_edits_emit_each(app):
+    m = matrix()
+    emitted = []
+    m.on_change.connect(lambda: emitted.append(m.value().value))
+
+    edit(m, {(0, 0): '10', (0, 1): '20'})
+    assert emitted == [[[10, 2], [3, 4]], [[10, 20], [3, 4]]]
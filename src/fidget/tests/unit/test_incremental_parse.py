@@ -0,0 +1,44 @@
+import pytest
+
+from fidget.core.fidget_value import Unparseable
+
+ARGS = dict(make_title=True, make_indicator=True, make_plaintext=True)
+
+
+@pytest.fixture
+def parse_counts(app, monkeypatch):
+    from fidget.widgets import FidgetConverter, FidgetMatrix
+
+    counts = {'matrix': 0, 'inner': 0}
+
+    def counting(cls, key):
+        original = cls.parse_result
+
+        def parse_result(self):
+            counts[key] += 1
+            return original(self)
+
+        monkeypatch.setattr(cls, 'parse_result', parse_result)
+
+    counting(FidgetMatrix, 'matrix')
+    counting(FidgetConverter, 'inner')
+    return counts
+
+
+def test_sibling_edit_reparses_only_edited_cell(parse_counts):
+    from fidget.widgets import FidgetInt, FidgetMatrix
+
+    m = FidgetMatrix(FidgetInt.template('i'), rows=3, columns=3, **ARGS)
+    m.fill_value([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+    m.inners[0][0].inner.edit.setText('x')
+    assert isinstance(m.value(), Unparseable)
+
+    parse_counts.update(matrix=0, inner=0)
+    m.inners[2][2].inner.edit.setText('90')
+    assert isinstance(m.value(), Unparseable)
+    assert parse_counts == {'matrix': 1, 'inner': 1}
+
+    parse_counts.update(matrix=0, inner=0)
+    m.inners[0][0].inner.edit.setText('10')
+    assert m.value().value == [[10, 2, 3], [4, 5, 6], [7, 8, 90]]
+    assert parse_counts == {'matrix': 1, 'inner': 1}
@@ -0,0 +1,82 @@
+import pytest
+
+from fidget.core.plaintext_adapter import join_parsers, PlaintextParseError, ParserStats, overlapping
+
+
+def parser_of(name, accepts, calls):
+    def ret(s):
+        calls.append(name)
+        if not accepts(s):
+            raise PlaintextParseError(f'{name} rejects {s!r}')
+        return name, s
+
+    ret.__name__ = name
+    return ret
+
+
+def test_learned_parser_tried_first():
+    calls = []
+    parser = join_parsers(lambda: [parser_of('digits', str.isdigit, calls), parser_of('alpha', str.isalpha, calls)])
+    assert parser('ab') == ('alpha', 'ab')
+    assert calls == ['digits', 'alpha']
+    calls.clear()
+    assert parser('cd') == ('alpha', 'cd')
+    assert calls == ['alpha']
+    assert parser.stats.hits == 1
+
+
+def test_result_of_overlapping_does_not_depend_on_history():
+    calls = []
+    parsers = lambda: [parser_of('digits', str.isdigit, calls), overlapping(parser_of('alnum', str.isalnum, calls))]
+    fresh = join_parsers(parsers)
+    learned = join_parsers(parsers)
+    # only alnum accepts this, so it is tried first from now on
+    assert learned('ab') == ('alnum', 'ab')
+    calls.clear()
+    # the parser before alnum must still reject the text, but alnum is the preferred parser that won
+    assert learned('cd') == ('alnum', 'cd')
+    assert calls == ['alnum', 'digits']
+    assert learned.stats.hits == 1
+    # both accept this, the first by static order wins
+    assert fresh('12') == learned('12') == ('digits', '12')
+
+
+def test_shared_stats_learn_together():
+    stats = ParserStats()
+    calls = []
+    first = join_parsers(lambda: [parser_of('digits', str.isdigit, calls), parser_of('alpha', str.isalpha, calls)],
+                         stats)
+    second = join_parsers(lambda: [parser_of('digits', str.isdigit, calls), parser_of('alpha', str.isalpha, calls)],
+                          stats)
+    first('12')
+    second('34')
+    assert stats.calls == 2
+    assert stats.hits == 2
+
+
+def test_error_of_first_parser():
+    parser = join_parsers(lambda: [parser_of('digits', str.isdigit, []), parser_of('alpha', str.isalpha, [])])
+    with pytest.raises(PlaintextParseError, match='digits'):
+        parser('!')
+
+
+def test_matrix_json_import_does_not_change_csv_results(app):
+    from fidget.widgets import FidgetMatrix, FidgetLine
+
+    def matrix():
+        return FidgetMatrix(FidgetLine.template('l'), make_title=True, make_indicator=True, make_plaintext=True)
+
+    fresh = matrix()
+    learned = matrix()
+    # a json import, that can only be parsed as json
+    assert learned.joined_plaintext_parser('[["a,b"]]') == [['a,b']]
+    assert fresh.joined_plaintext_parser('[["a"]]') == [['[["a"]]']]
+    assert learned.joined_plaintext_parser('[["a"]]') == [['[["a"]]']]
+
+
+def test_explicit_json_parser_is_not_joined(app):
+    from fidget.widgets import FidgetDict, FidgetInt
+
+    d = FidgetDict('d', [FidgetInt.template('a'), FidgetInt.template('b')], make_title=True, make_indicator=True,
+                   make_plaintext=True)
+    assert [p.__name__ for p in d.implicit_plaintext_parsers()] == ['from_json']
@@ -0,0 +1,17 @@
+from fidget.core import ValidationError
+
+
+def positive(v):
+    if v <= 0:
+        raise ValidationError('not positive')
+
+
+def test_minimal_model_validates(app):
+    from fidget.model.templates import model_of
+    from fidget.widgets import FidgetInt, FidgetMinimal
+
+    model = model_of(FidgetMinimal.template(FidgetInt.template('i'), FidgetInt.template('o'),
+                                            validation_func=positive))
+    assert model.title == 'i'
+    assert model.process(3).is_ok()
+    assert not model.process(-1).is_ok()
@@ -0,0 +1,56 @@
+import multiprocessing
+import os
+from time import perf_counter, sleep
+
+from fidget.core import ValidationError
+from fidget.core.fidget import _same_argument
+from fidget.core.fidget_value import GoodValue, Invalid, PendingValue
+from fidget.core.offload import process_safe, offload
+import fidget.core.offload as offload_mod
+
+
+@process_safe
+def positive_or_die(v):
+    if multiprocessing.parent_process() is not None:
+        # a worker process that crashes
+        os._exit(1)
+    if v <= 0:
+        raise ValidationError('not positive')
+
+
+def settled_value(app, widget, timeout=60):
+    start = perf_counter()
+    value = widget.value()
+    while isinstance(value, PendingValue):
+        assert perf_counter() - start < timeout
+        # spinning on processEvents without waiting crashes some PySide versions
+        sleep(0.01)
+        app.processEvents()
+        value = widget.value()
+    return value
+
+
+def test_worker_death_runs_in_process(app):
+    from fidget.widgets import FidgetInt
+
+    widget = FidgetInt('i', validation_func=positive_or_die)
+    widget.fill(5)
+    assert isinstance(settled_value(app, widget), GoodValue)
+    broken = offload_mod._process_pool
+    # later calls are not failed by the dead pool
+    widget.fill(-1)
+    assert isinstance(settled_value(app, widget), Invalid)
+    assert offload_mod._process_pool is None or offload_mod._process_pool is not broken
+    assert offload(positive_or_die, 3) is None
+
+
+def test_same_argument():
+    class Incomparable:
+        def __eq__(self, other):
+            raise RuntimeError('cannot compare')
+
+    assert _same_argument(1, 1)
+    assert not _same_argument(1, True)
+    assert not _same_argument(Incomparable(), Incomparable())
+    a = Incomparable()
+    assert _same_argument(a, a)
@@ -0,0 +1,26 @@
+ARGS = dict(make_title=True, make_indicator=True, make_plaintext=True)
+
+
+def stacked_matrix(parse_memo_size):
+    from fidget.widgets import FidgetInt, FidgetLine, FidgetMatrix, FidgetStacked
+
+    template = FidgetStacked.template('s', [FidgetInt.template('i'), FidgetLine.template('l')], **ARGS)
+    ret = FidgetMatrix(template, rows=2, columns=1, parse_memo_size=parse_memo_size, **ARGS)
+    cell = ret.inners[1][0]
+    cell.fill_value(cell.targeted_fill(option_name='l', value='x'))
+    return ret
+
+
+def test_memo_parses_like_each_cell(app):
+    plain = stacked_matrix(0)
+    memoized = stacked_matrix(16)
+    # the second cell is on its line page, and parses the text as a string
+    assert plain.joined_plaintext_parser('1\n1') == memoized.joined_plaintext_parser('1\n1') == [[1], ['1']]
+
+
+def test_memo_remembers_texts_of_each_cell(app):
+    m = stacked_matrix(16)
+    m.joined_plaintext_parser('1\n2')
+    assert (m.parse_memo.hits, m.parse_memo.misses) == (0, 2)
+    assert m.joined_plaintext_parser('1\n2') == [[1], ['2']]
+    assert (m.parse_memo.hits, m.parse_memo.misses) == (2, 2)
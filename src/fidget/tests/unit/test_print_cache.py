@@ -0,0 +1,77 @@
+from fidget.model.__util__ import PrintCache
+
+ARGS = dict(make_title=True, make_indicator=True, make_plaintext=True)
+
+
+def counting_printer(calls):
+    def ret(v):
+        calls.append(v)
+        return str(v)
+
+    return ret
+
+
+def test_reuses_printed_strings():
+    calls = []
+    printer = counting_printer(calls)
+    cache = PrintCache()
+    value = 12345
+    assert cache.printed('a', 0, value, printer) == '12345'
+    assert cache.printed('a', 0, value, printer) == '12345'
+    assert calls == [12345]
+
+
+def test_invalidation():
+    calls = []
+    printer = counting_printer(calls)
+    cache = PrintCache()
+    value = 12345
+    cache.printed('a', 0, value, printer)
+
+    # another value, another printer, or a discarded cell are printed again
+    cache.printed('a', 0, 67890, printer)
+    cache.printed('a', 0, 67890, counting_printer(calls))
+    cache.discard('a')
+    cache.printed('a', 0, 67890, printer)
+    assert calls == [12345, 67890, 67890, 67890]
+
+
+def test_column_widths():
+    cache = PrintCache()
+    cache.printed('a', 0, 'xxx', str)
+    cache.printed('b', 0, 'x', str)
+    cache.printed('c', 1, 'xx', str)
+    assert cache.column_widths(2) == [3, 2]
+    assert cache.covers([['xxx', 'xx'], ['x']])
+
+    cache.discard('a')
+    # a cell that moved to another column
+    cache.printed('c', 0, 'xx', str)
+    assert cache.column_widths(2) == [2, 0]
+    assert not cache.covers([['xx', 'x'], ['xxx']])
+
+
+def test_matrix_prints_changed_cells(app):
+    from fidget.widgets import FidgetInt, FidgetMatrix
+
+    m = FidgetMatrix(FidgetInt.template('i'), rows=2, columns=2, **ARGS)
+    m.fill_value([[1, 2], [3, 4]])
+    printed = []
+    for row in m.inners:
+        for inner in row:
+            inner._joined_plaintext_printer = counting_printer(printed)
+
+    # validating the cells prints them as well, so only printing the matrix is counted
+    value = m.value().value
+    printed.clear()
+    first = m.joined_plaintext_printer(value)
+    assert sorted(printed) == [1, 2, 3, 4]
+    printed.clear()
+    assert m.joined_plaintext_printer(value) == first
+    assert printed == []
+
+    m.inners[1][1].fill_value(40)
+    value = m.value().value
+    printed.clear()
+    m.joined_plaintext_printer(value)
+    assert printed == [40]
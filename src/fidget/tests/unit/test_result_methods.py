@@ -0,0 +1,114 @@
+import pytest
+
+from fidget.core import ParseError
+from fidget.core.fidget_value import GoodValue, Unparseable
+from fidget.core.result import Ok, Fail
+from fidget.model import Model, LabelModel, MatrixModel
+
+
+class ParseModel(Model[int]):
+    def __init__(self, text='1'):
+        super().__init__('p')
+        self.text = text
+
+    def parse(self):
+        try:
+            return int(self.text)
+        except ValueError as e:
+            raise ParseError('not an int', offender=self) from e
+
+
+class ResultModel(ParseModel):
+    def parse_result(self):
+        if not self.text.isdigit():
+            return Fail(ParseError, 'not digits', offender=self)
+        return Ok(int(self.text))
+
+
+class FailingParse:
+    def parse(self):
+        raise ParseError('mixin rejects', offender=self)
+
+
+def test_parse_only():
+    assert ParseModel('12').parse_result().value == 12
+    result = ParseModel('x').parse_result()
+    assert isinstance(result, Fail)
+    assert issubclass(result.exc_type, ParseError)
+    assert isinstance(ParseModel('x').value(), Unparseable)
+
+
+def test_result_only():
+    model = ResultModel('12')
+    assert model.parse() == 12
+    assert isinstance(model.value(), GoodValue)
+    # the subclass's parse_result decides, rather than the parse of its superclass
+    with pytest.raises(ParseError, match='not digits'):
+        ResultModel('-1').parse()
+    assert isinstance(ResultModel('-1').value(), Unparseable)
+
+
+def test_parse_over_inherited_result():
+    class Model2(ResultModel):
+        def parse(self):
+            return 7
+
+    assert Model2('x').parse_result().value == 7
+    assert isinstance(Model2('x').value(), GoodValue)
+
+
+def test_mixin_parse_before_result():
+    class Mixed(FailingParse, LabelModel):
+        pass
+
+    model = Mixed('l')
+    model.fill_value(3)
+    assert isinstance(model.value(), Unparseable)
+
+    class MixedMatrix(FailingParse, MatrixModel):
+        pass
+
+    matrix = MixedMatrix(lambda: ParseModel())
+    assert isinstance(matrix.value(), Unparseable)
+
+
+def test_mixin_result_before_parse():
+    class FailingResult:
+        def parse_result(self):
+            return Fail(ParseError, 'mixin rejects', offender=self)
+
+    class Mixed(FailingResult, ParseModel):
+        pass
+
+    with pytest.raises(ParseError, match='mixin rejects'):
+        Mixed().parse()
+
+
+def test_widget_mixin_parse(app):
+    from fidget.widgets import FidgetMatrix, FidgetLine
+
+    class Mixed(FailingParse, FidgetMatrix):
+        pass
+
+    args = dict(make_title=True, make_indicator=True, make_plaintext=True)
+    assert isinstance(FidgetMatrix(FidgetLine.template('l'), **args).value(), GoodValue)
+    assert isinstance(Mixed(FidgetLine.template('l'), **args).value(), Unparseable)
+
+
+def test_widget_parse_only(app):
+    from fidget.widgets import FidgetLine
+
+    class Upper(FidgetLine):
+        def parse(self):
+            ret = super().parse()
+            if not ret.isupper():
+                raise ParseError('not upper', offender=self)
+            return ret
+
+    widget = Upper('u')
+    widget.fill('ab')
+    assert isinstance(widget.value(), Unparseable)
+    assert isinstance(widget.parse_result(), Fail)
+    widget.fill('AB')
+    assert widget.value().value == 'AB'
+    assert widget.parse_result().value == 'AB'
@@ -0,0 +1,58 @@
+from itertools import chain
+
+ARGS = dict(make_title=True, make_indicator=True, make_plaintext=True)
+
+
+def tab_order(m):
+    """
+    :return: the cells of a matrix in the order the focus chain visits them, starting from the first cell
+    """
+    from fidget.widgets.__util__ import last_focus_proxy
+
+    cells = {last_focus_proxy(inner): inner for inner in chain.from_iterable(m.inners)}
+    first = last_focus_proxy(m.inners[0][0])
+    ret = [cells[first]]
+    widget = first.nextInFocusChain()
+    while widget is not first:
+        if widget in cells:
+            ret.append(cells[widget])
+        widget = widget.nextInFocusChain()
+    return ret
+
+
+def matrix(rows, columns):
+    from fidget.widgets import FidgetInt, FidgetMatrix
+
+    ret = FidgetMatrix(FidgetInt.template('i'), rows=(1, 10), columns=columns, **ARGS)
+    ret.fill_value([[i * columns + j for j in range(columns)] for i in range(rows)])
+    return ret
+
+
+def test_insert_rows(app):
+    m = matrix(2, 2)
+    m.insert_rows(1, 3)
+    assert m.row_count == len(m.inners) == len(m.row_btns) == 5
+    for i, j in ((1, 0), (1, 1), (2, 0), (2, 1), (3, 0), (3, 1)):
+        m.inners[i][j].fill_value(10 + i)
+    assert m.value().value == [[0, 1], [11, 11], [12, 12], [13, 13], [2, 3]]
+    assert tab_order(m) == list(chain.from_iterable(m.inners))
+
+
+def test_delete_rows(app):
+    m = matrix(5, 2)
+    m.delete_rows(1, 3)
+    assert m.row_count == len(m.inners) == len(m.row_btns) == 2
+    assert m.value().value == [[0, 1], [8, 9]]
+    assert tab_order(m) == list(chain.from_iterable(m.inners))
+
+    m.insert_rows(2, 2)
+    assert tab_order(m) == list(chain.from_iterable(m.inners))
+
+
+def test_bulk_insert_emits_once(app):
+    m = matrix(2, 2)
+    emitted = []
+    m.on_change.connect(lambda: emitted.append(m.value()))
+    m.insert_rows(0, 4)
+    m.delete_rows(0, 4)
+    assert len(emitted) == 2
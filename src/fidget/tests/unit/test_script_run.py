@@ -0,0 +1,26 @@
+from functools import partial
+from time import sleep
+
+import pytest
+
+from fidget.core.plaintext_adapter import ScriptRun, PlaintextPrintError, _exec_script
+
+
+def test_timeout_stops_script_that_catches_exceptions():
+    script = """
+while True:
+    try:
+        sum(range(1000))
+    except Exception:
+        pass
+"""
+    run = ScriptRun(partial(_exec_script, script, None), timeout=0.2)
+    with pytest.raises(PlaintextPrintError, match='timed out'):
+        run.future.result(5)
+    run._thread.join(5)
+    assert not run._thread.is_alive()
+
+
+def test_script_result():
+    run = ScriptRun(partial(_exec_script, 'return value * 2', 21))
+    assert run.future.result(5) == '42'
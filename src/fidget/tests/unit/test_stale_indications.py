@@ -0,0 +1,39 @@
+ARGS = dict(make_title=True, make_indicator=True, make_plaintext=True)
+
+
+def scrolled_matrix(app):
+    from fidget.backend.QtWidgets import QScrollArea
+    from fidget.widgets import FidgetInt, FidgetMatrix
+
+    m = FidgetMatrix(FidgetInt.template('i', **ARGS), rows=40, columns=1, scrollable=True, **ARGS)
+    m.resize(200, 200)
+    m.show()
+    app.processEvents()
+    m.fill_value([[i] for i in range(40)])
+    return m, m.findChild(QScrollArea).verticalScrollBar()
+
+
+def test_scroll_only_checks_its_own_area(app, monkeypatch):
+    from fidget.core import Fidget
+
+    first, first_bar = scrolled_matrix(app)
+    second, second_bar = scrolled_matrix(app)
+    last = first.inners[-1][0]
+    assert last._indication_stale
+
+    checked = []
+    original = Fidget._indication_visible
+
+    def indication_visible(self):
+        checked.append(self)
+        return original(self)
+
+    monkeypatch.setattr(Fidget, '_indication_visible', indication_visible)
+    second_bar.setValue(second_bar.maximum())
+    assert checked
+    assert not any(first.isAncestorOf(w) for w in checked)
+    assert last._indication_stale
+
+    first_bar.setValue(first_bar.maximum())
+    assert not last._indication_stale
+    assert last.indicator_label.text() == "<a href='...'>OK</a>"
@@ -0,0 +1,42 @@
+import pytest
+
+
+@pytest.fixture
+def validations(app, monkeypatch):
+    from fidget.widgets.rawstring import FidgetRawString
+
+    calls = []
+    original = FidgetRawString.validate
+
+    def validate(self, value):
+        calls.append(value)
+        return original(self, value)
+
+    monkeypatch.setattr(FidgetRawString, 'validate', validate)
+    return calls
+
+
+def test_acquire_costs_no_more_than_construction(validations):
+    from fidget.widgets import FidgetInt
+
+    template = FidgetInt.template('i')
+    template()
+    constructed = len(validations)
+
+    validations.clear()
+    template.acquire()
+    assert len(validations) == constructed
+
+
+def test_invalid_initial_state_is_recycled(app):
+    from fidget.widgets import FidgetLine
+
+    template = FidgetLine.template('l', pattern='[a-z]+')
+    widget = template.acquire()
+    assert not widget.value().is_ok()
+
+    widget.fill_value('abc')
+    template.release(widget)
+    assert template.acquire() is widget
+    assert widget.edit.text() == ''
+    assert not widget.value().is_ok()
@@ -0,0 +1,36 @@
+ARGS = dict(make_title=True, make_indicator=True, make_plaintext=True)
+
+
+def test_identical_fill_emits_nothing(app):
+    from fidget.widgets import FidgetInt, FidgetMatrix
+
+    m = FidgetMatrix(FidgetInt.template('i'), rows=2, columns=2, **ARGS)
+    # the values of hidden widgets are not compared
+    m.show()
+    m.fill_value([[1, 2], [3, 4]])
+    m.value()
+    emitted = []
+    m.on_change.connect(lambda: emitted.append(m.value().value))
+
+    m.fill_value([[1, 2], [3, 4]])
+    m.inners[0][0].inner.edit.setText('1')
+    assert emitted == []
+
+    m.fill_value([[1, 2], [3, 5]])
+    assert emitted == [[[1, 2], [3, 5]]]
+
+
+def test_identical_text_emits_nothing(app):
+    from fidget.widgets import FidgetLine
+
+    line = FidgetLine('l')
+    line.show()
+    line.fill_value('abc')
+    line.value()
+    emitted = []
+    line.on_change.connect(lambda: emitted.append(line.value().value))
+
+    line.edit.setText('ab')
+    line.edit.setText('abc')
+    line.fill_value('abc')
+    assert emitted == ['ab', 'abc']
@@ -0,0 +1,59 @@
+import pytest
+
+from fidget.core import ValidationError
+from fidget.core.fidget_value import GoodValue, Invalid
+
+ARGS = dict(make_title=True, make_indicator=True, make_plaintext=True)
+
+
+@pytest.fixture
+def positive(app):
+    from fidget.widgets import FidgetInt
+
+    class Positive(FidgetInt):
+        def validate(self, v):
+            super().validate(v)
+            if v <= 0:
+                raise ValidationError('not positive', offender=self)
+
+    return Positive
+
+
+def test_view_refuses_cells_it_cannot_validate(positive):
+    from fidget.widgets import FidgetMatrix, FidgetMatrixView, FidgetTableView
+
+    matrix = FidgetMatrix(positive.template('p'), rows=2, columns=2, **ARGS)
+    matrix.fill([[1, -5], [3, 4]])
+    assert isinstance(matrix.value(), Invalid)
+
+    with pytest.raises(TypeError):
+        FidgetMatrixView(positive.template('p'), rows=2, columns=2, **ARGS)
+    with pytest.raises(TypeError):
+        FidgetTableView('t', [positive.template('p')], **ARGS)
+
+
+def test_view_validates_with_validation_func(app):
+    from fidget.widgets import FidgetInt, FidgetMatrixView
+
+    def positive(v):
+        if v <= 0:
+            raise ValidationError('not positive')
+
+    view = FidgetMatrixView(FidgetInt.template('p', validation_func=positive), rows=2, columns=2, **ARGS)
+    view.fill([[1, -5], [3, 4]])
+    assert isinstance(view.value(), Invalid)
+    view.fill([[1, 5], [3, 4]])
+    assert isinstance(view.value(), GoodValue)
+
+
+def test_matrix_view_fill_resizes_within_reset(app):
+    from fidget.widgets import FidgetInt, FidgetMatrixView
+
+    view = FidgetMatrixView(FidgetInt.template('i'), rows=(1, 1, None), columns=(1, 1, None), **ARGS)
+    model = view.cells_model
+    column_counts = []
+    model.modelAboutToBeReset.connect(lambda: column_counts.append(model.columnCount()))
+    model.modelReset.connect(lambda: column_counts.append(model.columnCount()))
+    view.fill([[1, 2, 3], [4, 5, 6]])
+    assert column_counts == [1, 3]
+    assert view.value().value == [[1, 2, 3], [4, 5, 6]]
@@ -1,26 +1,57 @@
-from fidget.widgets.checkbox import FidgetCheckBox
-from fidget.widgets.combo import FidgetCombo
-from fidget.widgets.confirmer import FidgetConfirmer, FidgetQuestion, question
-from fidget.widgets.const_label import FidgetConst
-from fidget.widgets.converter import FidgetConverter, FidgetTransparentConverter
-from fidget.widgets.dict_ import FidgetDict
-from fidget.widgets.edit_combo import FidgetEditCombo
-from fidget.widgets.file_path import FidgetFilePath
-from fidget.widgets.dir_path import FidgetDirPath
-from fidget.widgets.multi_file import FidgetFilePaths
-from fidget.widgets.idiomatic_inner import inner_fidget
-from fidget.widgets.label import FidgetLabel
-from fidget.widgets.line import FidgetLine
-from fidget.widgets.matrix import FidgetMatrix
-from fidget.widgets.minimalist import FidgetMinimal
-from fidget.widgets.optional import FidgetOptional
-from fidget.widgets.text import FidgetPlainText
-from fidget.widgets.spin import FidgetSpin, FidgetDiscreteSpin
-from fidget.widgets.stacked import FidgetStacked
-from fidget.widgets.tabbed import FidgetTabs
-from fidget.widgets.table import FidgetTable
-from fidget.widgets.tuple_ import FidgetTuple
-from fidget.widgets.user_util import FidgetInt, FidgetFloat, FidgetComplex, SimpleLineEdit, template, SimplePlainEdit
+# every widget module loads a Qt backend, so widgets are only imported when first accessed (PEP 562)
+_lazy_names = {
+    'FidgetCheckBox': 'fidget.widgets.checkbox',
+    'FidgetCombo': 'fidget.widgets.combo',
+    'FidgetConfirmer': 'fidget.widgets.confirmer',
+    'FidgetQuestion': 'fidget.widgets.confirmer',
+    'question': 'fidget.widgets.confirmer',
+    'FidgetConst': 'fidget.widgets.const_label',
+    'FidgetConverter': 'fidget.widgets.converter',
+    'FidgetTransparentConverter': 'fidget.widgets.converter',
+    'FidgetDict': 'fidget.widgets.dict_',
+    'FidgetEditCombo': 'fidget.widgets.edit_combo',
+    'FidgetFilePath': 'fidget.widgets.file_path',
+    'FidgetDirPath': 'fidget.widgets.dir_path',
+    'FidgetFilePaths': 'fidget.widgets.multi_file',
+    'inner_fidget': 'fidget.widgets.idiomatic_inner',
+    'FidgetLabel': 'fidget.widgets.label',
+    'FidgetLine': 'fidget.widgets.line',
+    'FidgetMatrix': 'fidget.widgets.matrix',
+    'FidgetMatrixView': 'fidget.widgets.view',
+    'FidgetMinimal': 'fidget.widgets.minimalist',
+    'FidgetOptional': 'fidget.widgets.optional',
+    'FidgetPlainText': 'fidget.widgets.text',
+    'FidgetSpin': 'fidget.widgets.spin',
+    'FidgetDiscreteSpin': 'fidget.widgets.spin',
+    'FidgetStacked': 'fidget.widgets.stacked',
+    'FidgetTabs': 'fidget.widgets.tabbed',
+    'FidgetTable': 'fidget.widgets.table',
+    'FidgetTableView': 'fidget.widgets.view',
+    'FidgetTuple': 'fidget.widgets.tuple_',
+    'FidgetInt': 'fidget.widgets.user_util',
+    'FidgetFloat': 'fidget.widgets.user_util',
+    'FidgetComplex': 'fidget.widgets.user_util',
+    'SimpleLineEdit': 'fidget.widgets.user_util',
+    'template': 'fidget.widgets.user_util',
+    'SimplePlainEdit': 'fidget.widgets.user_util',
+}
+
+__all__ = list(_lazy_names)
+
+
+def __getattr__(name):
+    module_name = _lazy_names.get(name)
+    if module_name is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    from importlib import import_module
+
+    ret = getattr(import_module(module_name), name)
+    globals()[name] = ret
+    return ret
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_names))
 
 # todo scrollable wrapper?
 # todo multi-file widget
@@ -35,5 +66,4 @@ from fidget.widgets.user_util import FidgetInt, FidgetFloat, FidgetComplex, Simp
 
 # todo clear button to qlineedit
 
-# todo use qtablewidget
 # todo there's a lot of repeated code here
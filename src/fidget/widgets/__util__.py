@@ -1,15 +1,21 @@
 from __future__ import annotations
 
 from typing import TypeVar, Optional, Tuple, Iterable, List, Callable, MutableMapping, Generic, Container, Dict, \
-    Iterator
+    Iterator, Sequence
 
 from pathlib import Path
+from contextlib import contextmanager
 import os
 
 from fidget.backend.QtWidgets import QWidget, QFileDialog
 
 from fidget.core import Fidget, ValidationError
 
+# these utilities are Qt-free, and are shared with fidget.model
+from fidget.model.__util__ import repeat_last, CountBounds, parse_int, table_printer, to_identifier, PrintCache, \
+    rec_iter, parse_json_mapping, print_json_mapping, parse_json_sequence, print_json_sequence, check_row_count, \
+    parse_rows, parse_reshaped, print_rows, read_csv, write_csv
+
 T = TypeVar('T')
 
 win_illegal_chars = frozenset(r'<>:"/\|?*').union(chr(i) for i in range(32))
@@ -101,17 +107,41 @@ def last_focus_proxy(seed: QWidget):
         ret = focus
 
 
-def repeat_last(iterable):
-    i = iter(iterable)
-    last = None
-    while True:
-        try:
-            last = next(i)
-        except StopIteration:
-            break
-        yield last
-    while True:
-        yield last
+def insert_tab_order(widgets: Sequence[QWidget], before: Optional[QWidget] = None, after: Optional[QWidget] = None):
+    """
+    place new widgets in the tab order, in order, without re-ordering the rest of the focus chain
+    :param widgets: the widgets to place
+    :param before: the widget the new widgets should follow, if any
+    :param after: the widget the new widgets should precede, only used if before is None
+    """
+    prev = None
+    if before is not None:
+        prev = last_focus_proxy(before)
+    elif after is not None:
+        # qt places a widget after the last focus child (or the focus proxy) of its predecessor, so skip the widgets
+        # that contain after or that are proxied elsewhere
+        after = last_focus_proxy(after)
+        prev = after.previousInFocusChain()
+        while prev is not after and (prev.isAncestorOf(after) or prev.focusProxy()):
+            prev = prev.previousInFocusChain()
+    for widget in widgets:
+        proxy = last_focus_proxy(widget)
+        if prev is not None:
+            QWidget.setTabOrder(prev, proxy)
+        prev = proxy
+
+
+@contextmanager
+def updates_disabled(widget: QWidget):
+    """
+    a context manager that disables the painting of a widget, so that many changes to its layout are shown at once
+    """
+    enabled = widget.updatesEnabled()
+    widget.setUpdatesEnabled(False)
+    try:
+        yield widget
+    finally:
+        widget.setUpdatesEnabled(enabled)
 
 
 def valid_between(min, max):
@@ -124,86 +154,6 @@ def valid_between(min, max):
     return ret
 
 
-class CountBounds:
-    def __init__(self, initial: int, min: int = None, max: Optional[int] = None):
-        self.initial = initial
-        self.max = max
-        self.min = min
-
-    def in_bounds(self, num):
-        if num < self.min:
-            return False
-        if self.max is not None and num >= self.max:
-            return False
-        return True
-
-    def __class_getitem__(cls, item):
-        if isinstance(item, int):
-            return cls(item, item, item + 1)
-        if isinstance(item, slice):
-            initial = item.start or 1
-            min = item.stop or 1
-            max = item.step
-            return cls(initial, min, max)
-        if isinstance(item, cls):
-            return item
-        return cls(*item)
-
-    @property
-    def is_const(self):
-        return self.max is not None and self.max - self.min == 1
-
-
-def parse_int(s):
-    if isinstance(s, int):
-        return s
-    return int(s, base=0)
-
-
-parse_int.__name__ = 'int'
-
-
-def table_printer(row_binders: Tuple[Iterable[str], Iterable[str], Iterable[str]], col_sep: str, row_sep: str,
-                  header_row: Callable[[object], Iterable[str]] = None):
-    first_binder, mid_binder, last_binder = row_binders
-
-    def ret(self, v: List[List[T]]):
-        strings = self.string_matrix(v)
-        if header_row:
-            strings.insert(0, header_row(self))
-        elements = []
-        binders = []
-        max_lens = [0 for _ in range(len(strings[0]))]
-        for row_num, row in enumerate(strings):
-            if row_num == 0:
-                binder = first_binder
-            elif row_num == len(v) - 1:
-                binder = last_binder
-            else:
-                binder = mid_binder
-            binders.append(binder)
-            row_str = []
-            for col_num, e in enumerate(row):
-                max_lens[col_num] = max(max_lens[col_num], len(e))
-                row_str.append(e)
-            elements.append(row_str)
-        if header_row:
-            header_elements = ['-' * ml for ml in max_lens]
-            binders.insert(1, mid_binder)
-            elements.insert(1, header_elements)
-
-        ret = []
-        for (opener, closer), row in zip(binders, elements):
-            row_str = []
-            for length, element in zip(max_lens, row):
-                row_str.append(element.rjust(length))
-            row_str = opener + col_sep.join(row_str) + closer
-            ret.append(row_str)
-        return row_sep.join(ret)
-
-    return ret
-
-
 K = TypeVar('K')
 V = TypeVar('V')
 
@@ -302,23 +252,6 @@ class PrefixTrie(Container[str]):
         return s in self.children[char]
 
 
-def to_identifier(s: str):
-    if s.isidentifier():
-        return s
-
-    s = s.strip().replace(' ', '_')
-    if s.isidentifier():
-        return s
-
-    if not s[0].isidentifier():
-        s = '_' + s
-    s = ''.join(c for c in s if c.isalnum() or c == '_')
-    if not s.isidentifier():
-        return s
-
-    return '_'
-
-
 class RememberingFileDialog(QFileDialog):
     """
     A QFileDialog that remembers its last directory
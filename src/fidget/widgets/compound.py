@@ -1,13 +1,15 @@
 from __future__ import annotations
 
-from typing import Iterable, Generic, TypeVar, Collection, Any
+from typing import Iterable, Generic, TypeVar, Collection, Any, Dict
 
 from abc import abstractmethod
+from functools import partial
 
 from fidget.core.plaintext_adapter import high_priority
 
 from fidget.core import ParseError, ValidationError, inner_plaintext_parser, inner_plaintext_printer, \
-    FidgetTemplate, explicit, json_parser, TemplateLike, json_printer
+    FidgetTemplate, explicit, json_parser, TemplateLike, json_printer, Ok, Fail
+from fidget.core.fidget_value import ValidationPending
 
 from fidget.widgets.idiomatic_inner import MultiFidgetWrapper
 from fidget.widgets.__util__ import only_valid
@@ -29,6 +31,12 @@ class FidgetCompound(Generic[T], MultiFidgetWrapper[Any, T]):
 
         self.inners = None
 
+        # the result of the last parse, with entries patched in place as inners change
+        self._parsed = None
+        self._parse_errors: Dict[Any, Fail] = {}
+        self._changed_keys = set()
+        self._key_order: Dict[Any, int] = None
+
     INNER_TEMPLATES: Iterable[TemplateLike] = None
 
     @classmethod
@@ -65,6 +73,14 @@ class FidgetCompound(Generic[T], MultiFidgetWrapper[Any, T]):
     def insert_result(cls, res, key, value):
         pass
 
+    @classmethod
+    def update_result(cls, res, key, value):
+        res[key] = value
+
+    @classmethod
+    def copy_result(cls, res):
+        return res.copy()
+
     @classmethod
     @abstractmethod
     def result_zip_subwidget(cls, res, inners):
@@ -78,8 +94,10 @@ class FidgetCompound(Generic[T], MultiFidgetWrapper[Any, T]):
         if not self.inners:
             raise ValueError('at least one inner fidget must be provided')
 
-        for inner in self.inners_values(self.inners):
-            inner.on_change.connect(self.change_value)
+        self._key_order = {}
+        for i, (key, inner) in enumerate(self.inners_items(self.inners)):
+            self._key_order[key] = i
+            inner.on_change.connect(partial(self._inner_changed, key))
 
         self.setFocusProxy(
             next(iter(self.inners_values(self.inners)))
@@ -87,15 +105,54 @@ class FidgetCompound(Generic[T], MultiFidgetWrapper[Any, T]):
 
         return self.inners
 
-    def parse(self):
-        d = self.init_result()
-        for key, subwidget in self.inners_items(self.inners):
-            try:
-                value = subwidget.maybe_parse()
-            except ParseError as e:
-                raise ParseError('error parsing ' + subwidget.title, offender=subwidget) from e
-            self.insert_result(d, key, value)
-        return d
+    def parse_result(self):
+        try:
+            if self._parsed is None:
+                res = self.init_result()
+                for key, subwidget in self.inners_items(self.inners):
+                    self.insert_result(res, key, self._parse_inner(key, subwidget))
+                self._parsed = res
+            else:
+                for key in self._changed_keys:
+                    self.update_result(self._parsed, key, self._parse_inner(key, self.inners[key]))
+        except (ValidationError, ValidationPending) as e:
+            return Fail.of(e)
+        self._changed_keys.clear()
+
+        if self._parse_errors:
+            key = min(self._parse_errors, key=self._key_order.__getitem__)
+            subwidget = self.inners[key]
+            return Fail(ParseError, 'error parsing ' + subwidget.title, offender=subwidget,
+                        cause=self._parse_errors[key])
+        return Ok(self.copy_result(self._parsed))
+
+    def _parse_inner(self, key, subwidget):
+        """
+        parse a single inner widget, recording its failure if parsing fails
+        :return: the parsed value of the inner, or None if it failed
+        :raises ValidationError, ValidationPending: if the inner raised it while parsing, aborting the parse
+        """
+        result = subwidget.maybe_parse_result()
+        if result:
+            self._parse_errors.pop(key, None)
+            return result.value
+        if not issubclass(result.exc_type, ParseError):
+            result.unwrap()
+        self._parse_errors[key] = result
+        return None
+
+    def _inner_changed(self, key, *args):
+        """
+        a slot for when an inner widget changes, marking it to be re-parsed
+        """
+        self._changed_keys.add(key)
+        self.change_value()
+
+    def _forget_cached(self):
+        super()._forget_cached()
+        self._parsed = None
+        self._parse_errors.clear()
+        self._changed_keys.clear()
 
     def validate(self, d):
         super().validate(d)
@@ -139,3 +196,15 @@ class FidgetCompound(Generic[T], MultiFidgetWrapper[Any, T]):
         if not all(sw.fill for sw in self.inners_values(self.inners)):
             return None
         return self._fill
+
+    def snapshot(self):
+        inner_snapshots = [inner.snapshot() for inner in self.inners_values(self.inners)]
+        if not all(inner_snapshots):
+            return None
+
+        def ret():
+            with self.bulk_update():
+                for inner_snapshot in inner_snapshots:
+                    inner_snapshot()
+
+        return ret
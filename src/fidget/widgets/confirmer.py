@@ -7,6 +7,7 @@ from fidget.backend.QtWidgets import QHBoxLayout, QApplication, QPushButton, QVB
 from fidget.backend.QtCore import Qt, QEventLoop
 
 from fidget.core import Fidget, FidgetTemplate, ParseError, TemplateLike, inner_plaintext_printer, PlaintextPrintError
+from fidget.core.fidget_value import ValidationPending
 from fidget.core.__util__ import first_valid
 
 from fidget.widgets.idiomatic_inner import SingleFidgetWrapper
@@ -50,6 +51,8 @@ class FidgetConfirmer(Generic[T, C], SingleFidgetWrapper[T, Union[T, C]]):
         self.cancel_value = cancel_value
         self.make_cancel = cancel_value is not self.NO_CANCEL
         self.cancel_flag = False
+        # whether ok was clicked while the inner value was still pending
+        self.confirm_when_validated = False
 
         self.close_on_confirm = first_valid(close_on_confirm=close_on_confirm, CLOSE_ON_CONFIRM=self.CLOSE_ON_CONFIRM, _self=self)
 
@@ -64,6 +67,8 @@ class FidgetConfirmer(Generic[T, C], SingleFidgetWrapper[T, Union[T, C]]):
     WINDOW_MODALITY = None
     OK_TEXT = 'OK'
     CANCEL_TEXT = 'Cancel'
+    # every confirmation is a change, even if the value is the same as before (a question's exec waits for it)
+    COMPARE_VALUES = False
 
     def init_ui(self, layout_cls=None, ok_text=None, cancel_text=None, modality=None):
         super().init_ui()
@@ -107,6 +112,8 @@ class FidgetConfirmer(Generic[T, C], SingleFidgetWrapper[T, Union[T, C]]):
                 return self.cancel_value
             raise ParseError('invalid cancel value')
         inner_value = self.inner.value()
+        if inner_value.is_pending():
+            raise ValidationPending(offender=self.inner)
         if not inner_value.is_ok():
             raise ParseError(offender=self.inner) from inner_value.exception
         return inner_value.value
@@ -119,9 +126,17 @@ class FidgetConfirmer(Generic[T, C], SingleFidgetWrapper[T, Union[T, C]]):
 
     def _inner_changed(self):
         value = self.inner.value()
-        self.ok_button.setEnabled(value.is_ok())
+        self.ok_button.setEnabled(value.is_ok() or value.is_pending())
+        if self.confirm_when_validated and not value.is_pending():
+            self.confirm_when_validated = False
+            if value.is_ok():
+                self._ok_btn_clicked()
 
     def _ok_btn_clicked(self, *a):
+        if self.inner.value().is_pending():
+            # confirm once the inner value is validated, without blocking
+            self.confirm_when_validated = True
+            return
         self.cancel_flag = False
         self.change_value()
         if self.close_on_confirm:
@@ -132,6 +147,7 @@ class FidgetConfirmer(Generic[T, C], SingleFidgetWrapper[T, Union[T, C]]):
                 QMessageBox.critical(self, 'error parsing value', value.details)
 
     def _cancel_btn_clicked(self, *a):
+        self.confirm_when_validated = False
         self.cancel_flag = True
         self.change_value()
         if self.close_on_confirm:
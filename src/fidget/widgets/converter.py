@@ -2,10 +2,13 @@ from __future__ import annotations
 
 from typing import TypeVar, Generic, Callable, Optional
 
-from functools import wraps
+from functools import wraps, partial
 from fidget.backend.QtWidgets import QHBoxLayout
 
-from fidget.core import Fidget, ParseError, PlaintextParseError, FidgetTemplate
+from fidget.core import Fidget, ParseError, ValidationError, PlaintextParseError, FidgetTemplate
+from fidget.core.fidget_value import ValidationPending
+from fidget.core.result import Ok, Fail, Result, complete_result_method
+from fidget.core.offload import is_process_safe, offload
 
 from fidget.widgets.idiomatic_inner import SingleFidgetWrapper
 from fidget.widgets.__util__ import is_trivial_printer, only_valid
@@ -26,8 +29,10 @@ class FidgetConverter(Generic[F, T], SingleFidgetWrapper[F, T]):
                  **kwargs):
         """
         :param inner_template: the template to wrap
-        :param converter_func: a conversion function
-        :param back_converter_func: a backwards conversion function
+        :param converter_func: a conversion function, run in a worker process if marked with process_safe (with the
+            value pending until it is done)
+        :param back_converter_func: a backwards conversion function, run in a worker process if marked with
+            process_safe
         :param kwargs: forwarded to either the inner template or Fidget
         """
         inner_template = only_valid(inner_template=inner_template, INNER_TEMPLATE=self.INNER_TEMPLATE, _self=self).template_of()
@@ -63,6 +68,7 @@ class FidgetConverter(Generic[F, T], SingleFidgetWrapper[F, T]):
         self.layout = layout_cls()
 
         self.inner = self.inner_template()
+        self.depend_on_plaintext_adapters(self.inner)
         self.layout.addWidget(self.inner)
         self.setMinimumSize(self.inner.minimumSize())
         self.setMaximumSize(self.inner.maximumSize())
@@ -110,12 +116,35 @@ class FidgetConverter(Generic[F, T], SingleFidgetWrapper[F, T]):
     def provided_post(self, *args, **kwargs):
         return self.inner.provided_post(*args, **kwargs)
 
-    def parse(self):
-        f = self.inner.maybe_parse()
-        return self.convert(f)
+    def parse_result(self):
+        result = self.inner.maybe_parse_result()
+        if not result:
+            return result
+        if self._offloads_conversion():
+            # the GUI waits for the worker process through a pending value, rather than blocking in convert
+            try:
+                return Ok(self.offloaded(self.converter_func, result.value))
+            except (ParseError, ValidationError, ValidationPending) as e:
+                return Fail.of(e)
+        return self.convert_result(result.value)
+
+    def _offloads_conversion(self):
+        """
+        :return: whether parsing runs the converter function in a worker process, rather than calling convert
+        """
+        cls = type(self)
+        return cls.convert is FidgetConverter.convert and cls.convert_result is FidgetConverter.convert_result \
+            and self.converter_func is not None and is_process_safe(self.converter_func)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        complete_result_method(cls, 'convert', FidgetConverter.convert_result)
 
     def validate(self, value: T):
-        if self.back_convert:
+        if self.back_converter_func and is_process_safe(self.back_converter_func):
+            bc = self.offloaded(self.back_converter_func, value)
+            self.inner.maybe_validate(bc)
+        elif self.back_convert:
             bc = self.back_convert(value)
             self.inner.maybe_validate(bc)
         super().validate(value)
@@ -123,10 +152,24 @@ class FidgetConverter(Generic[F, T], SingleFidgetWrapper[F, T]):
     def convert(self, v: F) -> T:
         if not self.converter_func:
             raise Exception('a converter function must be provided')
+        if is_process_safe(self.converter_func):
+            return offload(self.converter_func, v)
         return self.converter_func(v)
 
+    def convert_result(self, v: F) -> Result[T]:
+        """
+        convert a value like convert, but return the error rather than raise it
+        :inheritors: override either convert or convert_result, the other is completed when the class is created
+        """
+        try:
+            return Ok(self.convert(v))
+        except (ParseError, ValidationError, ValidationPending) as e:
+            return Fail.of(e)
+
     @property
     def back_convert(self):
+        if self.back_converter_func and is_process_safe(self.back_converter_func):
+            return partial(offload, self.back_converter_func)
         return self.back_converter_func
 
     def plaintext_parsers(self):
@@ -174,6 +217,10 @@ class FidgetConverter(Generic[F, T], SingleFidgetWrapper[F, T]):
     def fill(self):
         return (self.inner.fill and self.back_convert) and self._fill
 
+    def snapshot(self):
+        # the inner widget's state can often be restored even when the converted value is invalid
+        return self.inner.snapshot()
+
     def template_of(self):
         ret = super().template_of()
         template_args = {}
@@ -4,7 +4,7 @@ from typing import Mapping, Iterable, Type
 
 from fidget.backend.QtWidgets import QVBoxLayout, QFrame, QScrollArea, QWidget, QBoxLayout
 
-from fidget.core import ParseError, ValidationError
+from fidget.core import ValidationError
 from fidget.core.__util__ import first_valid
 
 from fidget.widgets.mapping import FidgetMapping, NamedTemplate
@@ -50,6 +50,7 @@ class FidgetDict(FidgetMapping):
         if scrollable:
             owner = QScrollArea(owner)
             owner.setWidgetResizable(True)
+            self._track_scroll_area(owner)
             owner_layout.addWidget(owner)
 
         master = QWidget()
@@ -74,16 +75,6 @@ class FidgetDict(FidgetMapping):
 
         return master_layout
 
-    def parse(self):
-        d = {}
-        for key, subwidget in self.inners.items():
-            try:
-                value = subwidget.maybe_parse()
-            except ParseError as e:
-                raise ParseError('error parsing ' + subwidget.title, offender=subwidget) from e
-            d[key] = value
-        return d
-
     def validate(self, d: Mapping[str, object]):
         super().validate(d)
         for k, v in d.items():
@@ -46,7 +46,9 @@ class FidgetDirPath(Fidget[Path]):
         super().init_ui()
         self.dialog = self._args_to_filedialog(first_valid(dialog=dialog, DIALOG=self.DIALOG, _self=self))
 
-        self.dialog.setFileMode(QFileDialog.DirectoryOnly)
+        # DirectoryOnly is gone in Qt 6, it was the same as Directory with ShowDirsOnly
+        self.dialog.setFileMode(QFileDialog.Directory)
+        self.dialog.setOption(QFileDialog.ShowDirsOnly, True)
 
         layout = QHBoxLayout(self)
 
@@ -6,26 +6,10 @@ from fidget.core import Fidget, inner_plaintext_parser, PlaintextPrintError, Pla
     inner_plaintext_printer
 from fidget.core.__util__ import first_valid
 
-T = TypeVar('T')
-
-
-def parse_option(fidget, value):
-    names = []
-
-    if isinstance(value, tuple) and len(value) == 2 and isinstance(value[0], str):
-        names.append(value[0])
-        value = value[1]
+# shared with the headless models
+from fidget.model.primitives import parse_option
 
-    for printer in fidget.implicit_cls_plaintext_printers():
-        try:
-            names.append(printer(value))
-        except PlaintextPrintError:
-            pass
-
-    if not names:
-        raise Exception(f'no names for {value}')
-
-    return names, value
+T = TypeVar('T')
 
 
 class FidgetDiscreteChoice(Generic[T], Fidget[T]):
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 from typing import Union, Mapping, Iterable, Tuple, TypeVar, Any
 
-from fidget.core import PlaintextPrintError, PlaintextParseError, FidgetTemplate, TemplateLike
+from fidget.core import FidgetTemplate, TemplateLike
 
 from fidget.widgets.compound import FidgetCompound
+from fidget.widgets.__util__ import parse_json_mapping, print_json_mapping
 
 T = TypeVar('T')
 NamedTemplate = Union[
@@ -56,49 +57,10 @@ class FidgetMapping(FidgetCompound[Mapping]):
             yield (k, v), sw
 
     def _from_json(self, d: dict, exact=True):
-        if not isinstance(d, dict):
-            raise PlaintextParseError(f'expected dict, got {type(d).__name__}')
-        not_seen = dict(self.inners)
-
-        ret = {}
-
-        for k, v in d.items():
-            subwidget = not_seen.pop(k, None)
-            if not subwidget:
-                if exact:
-                    raise PlaintextParseError(f'key {k} has no appropriate widget')
-                continue
-            if not isinstance(v, str):
-                # todo if you get a non-str value, just json-encode it and pass it on?
-                raise PlaintextParseError(f'in key: {k}, value must be str, got {type(v).__name__}')
-
-            try:
-                parsed = subwidget.joined_plaintext_parser(v)
-            except PlaintextParseError as e:
-                raise PlaintextParseError(f'error parsing {k}') from e
-
-            ret[k] = parsed
-
-        if exact and not_seen:
-            k, _ = not_seen.popitem()
-            raise PlaintextParseError(f'key not found: {k}') from KeyError(k)
-
-        return ret
+        return parse_json_mapping(self.inners, d, exact)
 
     def _to_json(self, d: Mapping[str, object]):
-        if not isinstance(d, Mapping):
-            raise PlaintextPrintError from TypeError('can only accept dict')
-        ret = {}
-        for k, subwidget in self.inners.items():
-            if k not in d:
-                raise PlaintextPrintError('f{k} missing')
-            v = d[k]
-            try:
-                s = subwidget.joined_plaintext_printer(v)
-            except PlaintextPrintError as e:
-                raise PlaintextPrintError(f'error printing {k}') from e
-            ret[k] = s
-        return ret
+        return print_json_mapping(self.inners, d)
 
     @staticmethod
     def _to_name_subtemplate(option: NamedTemplate) -> Tuple[str, FidgetTemplate[T]]:
@@ -1,10 +1,9 @@
-from typing import TypeVar, Generic, List, Iterable, Callable
+from typing import TypeVar, Generic, List, Iterator, Callable, Dict, Tuple, Optional
 
-from itertools import chain
-from io import StringIO
-import csv
+from itertools import chain, count, islice
+from functools import partial
 
-from fidget.core.plaintext_adapter import high_priority
+from fidget.core.plaintext_adapter import high_priority, overlapping, ParserStats, ParseMemo, PlaintextParser
 
 from fidget.backend.QtWidgets import QGridLayout, QHBoxLayout, QPushButton, QMenu, QStyle, QApplication, QVBoxLayout, \
     QScrollArea, QWidget, QSizePolicy
@@ -14,14 +13,17 @@ from fidget.backend.Resources import add_row_above_icon, add_row_below_icon, add
     del_row_icon, del_col_icon
 
 from fidget.core import TemplateLike, Fidget, FidgetTemplate, ParseError, ValidationError, \
-    inner_plaintext_printer, inner_plaintext_parser, json_parser, PlaintextPrintError, PlaintextParseError, json_printer
+    inner_plaintext_printer, inner_plaintext_parser, json_parser, PlaintextParseError, json_printer
+from fidget.core.result import Ok, Fail
+from fidget.core.fidget_value import ValidationPending
 from fidget.core.__util__ import first_valid, mask, update
 
 from fidget.widgets.idiomatic_inner import SingleFidgetWrapper
 from fidget.widgets.user_util import FidgetInt
 from fidget.widgets.confirmer import FidgetQuestion
 from fidget.widgets.__util__ import only_valid, last_focus_proxy, repeat_last, valid_between, CountBounds, \
-    table_printer
+    table_printer, PrintCache, insert_tab_order, updates_disabled, check_row_count, parse_rows, parse_reshaped, \
+    print_rows, read_csv, write_csv
 
 T = TypeVar('T')
 
@@ -38,6 +40,7 @@ class FidgetMatrix(Generic[T], SingleFidgetWrapper[T, List[List[T]]]):
                  row_button_text_func: Callable[[int], str] = None,
                  column_button_text_func: Callable[[int], str] = None,
                  scrollable=None,
+                 parse_memo_size: int = None,
                  **kwargs):
         self.row_bounds = CountBounds[first_valid(rows=rows, ROWS=self.ROWS, _self=self)]
         self.column_bounds = CountBounds[first_valid(columns=columns, COLUMNS=self.COLUMNS, _self=self)]
@@ -65,6 +68,23 @@ class FidgetMatrix(Generic[T], SingleFidgetWrapper[T, List[List[T]]]):
         self.row_count = 0
         self.column_count = 0
 
+        # the cells of the last parse, re-parsed only where inners changed, reset when the dimensions change
+        self._parsed: List[List[T]] = None
+        self._parse_errors: Dict[Tuple[int, int], Fail] = {}
+        self._changed_keys = set()
+        self._inner_keys: Dict[Fidget[T], int] = {}
+        # the listener connected to each cell's on_change, disconnected when the cell is released
+        self._inner_listeners: Dict[Fidget[T], Callable] = {}
+        self._key_positions: Dict[int, Tuple[int, int]] = {}
+        self._next_key = count()
+        # all cells share their parser stats, so a bulk import learns the form of the cells' texts once
+        self._cell_parser_stats = ParserStats()
+        # opt-in, remembers the values of cell texts parsed in plaintext imports
+        parse_memo_size = first_valid(parse_memo_size=parse_memo_size, PARSE_MEMO_SIZE=self.PARSE_MEMO_SIZE, _self=self)
+        self.parse_memo: Optional[ParseMemo] = ParseMemo(parse_memo_size) if parse_memo_size else None
+        # the printed strings of the cells, re-printed only where inners changed
+        self.print_cache = PrintCache()
+
         self.init_ui(layout_cls=layout_cls, scrollable=scrollable)
 
     INNER_TEMPLATE: FidgetTemplate[T] = None
@@ -74,6 +94,7 @@ class FidgetMatrix(Generic[T], SingleFidgetWrapper[T, List[List[T]]]):
     ROW_BUTTON_TEXT_FUNC: Callable[[int], str] = staticmethod(str)
     COLUMN_BUTTON_TEXT_FUNC: Callable[[int], str] = ...
     SCROLLABLE = True
+    PARSE_MEMO_SIZE: int = 0
 
     def init_ui(self, layout_cls=None, scrollable=None):
         super().init_ui()
@@ -88,6 +109,7 @@ class FidgetMatrix(Generic[T], SingleFidgetWrapper[T, List[List[T]]]):
         if scrollable:
             owner = QScrollArea(owner)
             owner.setWidgetResizable(True)
+            self._track_scroll_area(owner)
             owner_layout.addWidget(owner)
 
         master = QWidget()
@@ -114,65 +136,115 @@ class FidgetMatrix(Generic[T], SingleFidgetWrapper[T, List[List[T]]]):
 
         with self.setup_provided(master_layout, exclude=exclude), self.suppress_update(call_on_exit=False):
             self.grid_layout = QGridLayout()
-
-            for i in range(self.row_bounds.initial):
-                self.add_row(i)
-
-            for i in range(self.column_bounds.initial):
-                self.add_col(i)
-
             master_layout.addLayout(self.grid_layout)
 
+            self.insert_rows(0, self.row_bounds.initial)
+            self.insert_columns(0, self.column_bounds.initial)
+
         if title_in_grid and self.title_label:
             self.grid_layout.addWidget(self.title_label, 0, 0)
 
         # self.setLayout(master_layout)
-        self.apply_matrix()
+        self.change_value()
 
         return master_layout
 
+    def insert_rows(self, index, count=1):
+        """
+        insert rows of new cells, laying out the grid once
+        :param index: the index of the first new row
+        :param count: the number of rows to insert
+        """
+        if count <= 0:
+            return
+        self._parsed = None
+        with updates_disabled(self):
+            # make room, moving each cell once
+            for row_to_move in range(self.row_count - 1, index - 1, -1):
+                for col, widget in enumerate(self.inners[row_to_move]):
+                    self.grid_layout.removeWidget(widget)
+                    self.grid_layout.addWidget(widget, row_to_move + self.row_offset + count, col + self.col_offset)
+
+            # add the new rows
+            new_rows = []
+            for row in range(index, index + count):
+                new_row = []
+                for col in range(self.column_count):
+                    inner = self._make_inner()
+                    new_row.append(inner)
+                    self.grid_layout.addWidget(inner, row + self.row_offset, col + self.col_offset)
+                new_rows.append(new_row)
+            self.inners[index:index] = new_rows
+            self.row_count += count
+
+            # add the new buttons (to the last rows, buttons don't move around)
+            if not self.row_bounds.is_const:
+                for _ in range(count):
+                    new_button = self.row_btn(len(self.row_btns))
+                    self.grid_layout.addWidget(new_button, len(self.row_btns) + self.row_offset, 0)
+                    self.row_btns.append(new_button)
+
+        if self.column_count:
+            before = self.inners[index - 1][-1] if index > 0 else None
+            after = self.inners[index + count][0] if index + count < self.row_count else None
+            insert_tab_order(list(chain.from_iterable(new_rows)), before, after)
+        self._dimensions_changed()
+
+    def insert_columns(self, index, count=1):
+        """
+        insert columns of new cells, laying out the grid once
+        :param index: the index of the first new column
+        :param count: the number of columns to insert
+        """
+        if count <= 0:
+            return
+        self._parsed = None
+        with updates_disabled(self):
+            # make room, moving each cell once
+            for col_to_move in range(self.column_count - 1, index - 1, -1):
+                for row in range(self.row_count):
+                    widget = self.inners[row][col_to_move]
+                    self.grid_layout.removeWidget(widget)
+                    self.grid_layout.addWidget(widget, row + self.row_offset, col_to_move + self.col_offset + count)
+
+            for row_num, inners_row in enumerate(self.inners):
+                new_cells = [self._make_inner() for _ in range(count)]
+                for col, inner in enumerate(new_cells, index):
+                    self.grid_layout.addWidget(inner, row_num + self.row_offset, col + self.col_offset)
+                inners_row[index:index] = new_cells
+
+            self.column_count += count
+
+            # add the new buttons (to the last columns, buttons don't move around)
+            if not self.column_bounds.is_const:
+                for _ in range(count):
+                    new_button = self.col_btn(len(self.col_btns))
+                    self.grid_layout.addWidget(new_button, 0, len(self.col_btns) + self.col_offset)
+                    self.col_btns.append(new_button)
+
+        for row_num, inners_row in enumerate(self.inners):
+            if index > 0:
+                before = inners_row[index - 1]
+            else:
+                before = self.inners[row_num - 1][-1] if row_num > 0 else None
+            if index + count < self.column_count:
+                after = inners_row[index + count]
+            else:
+                after = self.inners[row_num + 1][0] if row_num + 1 < self.row_count else None
+            insert_tab_order(inners_row[index:index + count], before, after)
+        self._dimensions_changed()
+
     def add_row(self, row):
-        # make room
-        for row_to_move in range(self.row_count - 1, row - 1, -1):
-            for col, widget in enumerate(self.inners[row_to_move]):
-                self.grid_layout.removeWidget(widget)
-                self.grid_layout.addWidget(widget, row_to_move + self.row_offset + 1, col + self.col_offset)
-
-        # add the new row
-        new_row = []
-        for col in range(self.column_count):
-            inner = self._make_inner()
-            new_row.append(inner)
-            self.grid_layout.addWidget(inner, row + self.row_offset, col + self.col_offset)
-        self.inners.insert(row, new_row)
-        self.row_count += 1
-
-        # add the new button (to the last row, buttons don't move around)
-        if not self.row_bounds.is_const:
-            new_button = self.row_btn(self.row_count - 1)
-            self.grid_layout.addWidget(new_button, self.row_count + self.row_offset - 1, 0)
-            self.row_btns.append(new_button)
+        """
+        insert a single row, see insert_rows
+        """
+        self.insert_rows(row)
 
     def add_col(self, col):
-        # make room
-        for col_to_move in range(self.column_count - 1, col - 1, -1):
-            for row in range(self.row_count):
-                widget = self.inners[row][col_to_move]
-                self.grid_layout.removeWidget(widget)
-                self.grid_layout.addWidget(widget, row + self.row_offset, col_to_move + self.col_offset + 1)
-
-        for row_num in range(self.row_count):
-            inner = self._make_inner()
-            self.inners[row_num].insert(col, inner)
-            self.grid_layout.addWidget(inner, row_num + self.row_offset, col + self.col_offset)
-
-        self.column_count += 1
-
-        # add the new button (to the last column, buttons don't move around)
-        if not self.column_bounds.is_const:
-            new_button = self.col_btn(self.column_count - 1)
-            self.grid_layout.addWidget(new_button, 0, self.column_count + self.col_offset - 1)
-            self.col_btns.append(new_button)
+        """
+        insert a single column, see insert_columns
+        """
+        self.insert_columns(col)
 
     def row_btn(self, row_index):
         ret = QPushButton(self.row_button_text_func(row_index))
@@ -181,8 +253,7 @@ class FidgetMatrix(Generic[T], SingleFidgetWrapper[T, List[List[T]]]):
         menu = QMenu(ret)
 
         def add_top():
-            self.add_row(row_index)
-            self.apply_matrix()
+            self.insert_rows(row_index)
 
         def add_many_top():
             question = FidgetQuestion(
@@ -198,13 +269,10 @@ class FidgetMatrix(Generic[T], SingleFidgetWrapper[T, List[List[T]]]):
             value = response.value
             if not value:
                 return
-            for _ in range(value):
-                self.add_row(row_index)
-            self.apply_matrix()
+            self.insert_rows(row_index, value)
 
         def add_bottom():
-            self.add_row(row_index + 1)
-            self.apply_matrix()
+            self.insert_rows(row_index + 1)
 
         def add_many_bottom():
             question = FidgetQuestion(
@@ -220,23 +288,19 @@ class FidgetMatrix(Generic[T], SingleFidgetWrapper[T, List[List[T]]]):
             value = response.value
             if not value:
                 return
-            for _ in range(value):
-                self.add_row(row_index + 1)
-            self.apply_matrix()
+            self.insert_rows(row_index + 1, value)
 
         # todo delete many?
         def del_():
-            self.del_row(row_index)
-            self.apply_matrix()
+            self.delete_rows(row_index)
 
         # todo check if inner has fill
         def clone():
-            self.add_row(row_index+1)
+            self.insert_rows(row_index+1)
             for c in range(self.column_count):
                 v = self.inners[row_index][c].value()
                 if v.is_ok() and self.inners[row_index+1][c].fill is not None:
                     self.inners[row_index+1][c].fill_value(v.value)
-            self.apply_matrix()
 
         ret.add_top_action = menu.addAction(add_row_above_icon(), 'add row above', add_top)
         ret.add_top_action.setEnabled(False)
@@ -257,6 +321,11 @@ class FidgetMatrix(Generic[T], SingleFidgetWrapper[T, List[List[T]]]):
         ret.clone_action = menu.addAction('clone', clone)
         ret.clone_action.setEnabled(False)
 
+        # the actions enabled when a row can be added, all disabled until the button's state is first set
+        ret.add_actions = (ret.add_top_action, ret.add_many_top_action, ret.add_bottom_action,
+                           ret.add_many_bottom_action, ret.clone_action)
+        ret.state = (False, False)
+
         @ret.clicked.connect
         def _(a):
             menu.exec_(QCursor.pos())
@@ -270,8 +339,7 @@ class FidgetMatrix(Generic[T], SingleFidgetWrapper[T, List[List[T]]]):
         menu = QMenu(ret)
 
         def add_left():
-            self.add_col(col_index)
-            self.apply_matrix()
+            self.insert_columns(col_index)
 
         def add_many_left():
             question = FidgetQuestion(
@@ -286,13 +354,10 @@ class FidgetMatrix(Generic[T], SingleFidgetWrapper[T, List[List[T]]]):
             value = response.value
             if not value:
                 return
-            for _ in range(value):
-                self.add_col(col_index)
-            self.apply_matrix()
+            self.insert_columns(col_index, value)
 
         def add_right():
-            self.add_col(col_index + 1)
-            self.apply_matrix()
+            self.insert_columns(col_index + 1)
 
         def add_many_right():
             question = FidgetQuestion(
@@ -307,23 +372,19 @@ class FidgetMatrix(Generic[T], SingleFidgetWrapper[T, List[List[T]]]):
             value = response.value
             if not value:
                 return
-            for _ in range(value):
-                self.add_col(col_index + 1)
-            self.apply_matrix()
+            self.insert_columns(col_index + 1, value)
 
         # todo delete many?
         def del_():
-            self.del_col(col_index)
-            self.apply_matrix()
+            self.delete_columns(col_index)
 
         # todo check if inner has fill
         def clone():
-            self.add_row(col_index + 1)
+            self.insert_columns(col_index + 1)
             for r in range(self.row_count):
                 v = self.inners[r][col_index].value()
                 if v.is_ok() and self.inners[r][col_index+1].fill is not None:
                     self.inners[r][col_index+1].fill_value(v.value)
-            self.apply_matrix()
 
         ret.add_left_action = menu.addAction(add_col_left_icon(), 'add column left',
                                              add_left)
@@ -345,58 +406,105 @@ class FidgetMatrix(Generic[T], SingleFidgetWrapper[T, List[List[T]]]):
         ret.clone_action = menu.addAction('clone', clone)
         ret.clone_action.setEnabled(False)
 
+        # the actions enabled when a column can be added, all disabled until the button's state is first set
+        ret.add_actions = (ret.add_left_action, ret.add_many_left_action, ret.add_right_action,
+                           ret.add_many_right_action, ret.clone_action)
+        ret.state = (False, False)
+
         @ret.clicked.connect
         def _(a):
             menu.exec_(QCursor.pos())
 
         return ret
 
-    def del_row(self, row):
-        # clear the the row
-        for widget in self.inners[row]:
-            widget.hide()
-            self.grid_layout.removeWidget(widget)
-
-        # shift all rows above one row down, clearing the last row
-        for row_to_move in range(row + 1, self.row_count):
-            for col, widget in enumerate(self.inners[row_to_move]):
-                self.grid_layout.removeWidget(widget)
-                self.grid_layout.addWidget(widget, row_to_move + self.row_offset - 1, col + self.col_offset)
-
-        self.inners.pop(row)
-        self.row_count -= 1
+    def delete_rows(self, index, count=1):
+        """
+        delete rows of cells, laying out the grid once
+        :param index: the index of the first row to delete
+        :param count: the number of rows to delete
+        """
+        if count <= 0:
+            return
+        self._parsed = None
+        with updates_disabled(self):
+            # clear the rows
+            for row in self.inners[index:index + count]:
+                for widget in row:
+                    self.grid_layout.removeWidget(widget)
+                    self.print_cache.discard(self._inner_keys.pop(widget, None))
+                    self.inner_template.release(widget, self._inner_listeners.pop(widget))
+
+            # shift all rows below up, moving each cell once
+            for row_to_move in range(index + count, self.row_count):
+                for col, widget in enumerate(self.inners[row_to_move]):
+                    self.grid_layout.removeWidget(widget)
+                    self.grid_layout.addWidget(widget, row_to_move + self.row_offset - count, col + self.col_offset)
+
+            del self.inners[index:index + count]
+            self.row_count -= count
+
+            # delete the buttons of the last rows
+            if self.row_btns:
+                for btn in self.row_btns[-count:]:
+                    self.grid_layout.removeWidget(btn)
+                    btn.hide()
+                del self.row_btns[-count:]
+
+        self._dimensions_changed()
+
+    def delete_columns(self, index, count=1):
+        """
+        delete columns of cells, laying out the grid once
+        :param index: the index of the first column to delete
+        :param count: the number of columns to delete
+        """
+        if count <= 0:
+            return
+        self._parsed = None
+        with updates_disabled(self):
+            # clear the columns
+            for row in self.inners:
+                for widget in row[index:index + count]:
+                    self.grid_layout.removeWidget(widget)
+                    self.print_cache.discard(self._inner_keys.pop(widget, None))
+                    self.inner_template.release(widget, self._inner_listeners.pop(widget))
+
+            # shift all columns to the right left, moving each cell once
+            for col_to_move in range(index + count, self.column_count):
+                for row_num, row in enumerate(self.inners):
+                    widget = row[col_to_move]
+                    self.grid_layout.removeWidget(widget)
+                    self.grid_layout.addWidget(widget, row_num + self.row_offset, col_to_move + self.col_offset - count)
+
+            for row in self.inners:
+                del row[index:index + count]
+            self.column_count -= count
+
+            # delete the buttons of the last columns
+            if self.col_btns:
+                for btn in self.col_btns[-count:]:
+                    self.grid_layout.removeWidget(btn)
+                    btn.hide()
+                del self.col_btns[-count:]
+
+        self._dimensions_changed()
 
-        # delete the button
-        btn = self.row_btns.pop(-1)
-        self.grid_layout.removeWidget(btn)
-        btn.hide()
+    def del_row(self, row):
+        """
+        delete a single row, see delete_rows
+        """
+        self.delete_rows(row)
 
     def del_col(self, col):
-        # clear the the column
-        for row in self.inners:
-            widget = row[col]
-            widget.hide()
-            self.grid_layout.removeWidget(widget)
-
-        # shift all columns above one column down, clearing the last column
-        for col_to_move in range(col + 1, self.column_count):
-            for row_num, row in enumerate(self.inners):
-                widget = row[col_to_move]
-                self.grid_layout.removeWidget(widget)
-                self.grid_layout.addWidget(widget, row_num + self.row_offset, col_to_move + self.col_offset - 1)
-
-        for row in self.inners:
-            row.pop(col)
-        self.column_count -= 1
-
-        # delete the button
-        btn = self.col_btns.pop(-1)
-        self.grid_layout.removeWidget(btn)
-        btn.hide()
+        """
+        delete a single column, see delete_columns
+        """
+        self.delete_columns(col)
 
     def apply_matrix(self):
         """
-        Apply whatever adjustments need to be made when the table changes dimensions
+        Apply whatever adjustments need to be made when the table changes dimensions. Inserting and deleting rows and
+        columns already applies them, this re-applies the tab order of all cells.
         """
         i = (last_focus_proxy(a) for a in chain.from_iterable(self.inners))
         try:
@@ -408,45 +516,124 @@ class FidgetMatrix(Generic[T], SingleFidgetWrapper[T, List[List[T]]]):
                 self.setTabOrder(prev, inner)
                 prev = inner
 
+        self._dimensions_changed()
+
+    def _dimensions_changed(self):
+        """
+        enable the buttons' actions by whether rows and columns can be added or deleted, and refresh the value
+        """
         can_add_row = self.row_bounds.in_bounds(self.row_count + 1)
         can_del_row = self.row_bounds.in_bounds(self.row_count - 1)
         for btn in self.row_btns:
-            btn.add_top_action.setEnabled(can_add_row)
-            btn.add_many_top_action.setEnabled(can_add_row)
-            btn.add_bottom_action.setEnabled(can_add_row)
-            btn.add_many_bottom_action.setEnabled(can_add_row)
-            btn.del_action.setEnabled(can_del_row)
-            btn.clone_action.setEnabled(can_add_row)
+            self._set_btn_state(btn, can_add_row, can_del_row)
 
         can_add_col = self.column_bounds.in_bounds(self.column_count + 1)
         can_del_col = self.column_bounds.in_bounds(self.column_count - 1)
         for btn in self.col_btns:
-            btn.add_left_action.setEnabled(can_add_col)
-            btn.add_many_left_action.setEnabled(can_add_col)
-            btn.add_right_action.setEnabled(can_add_col)
-            btn.add_many_right_action.setEnabled(can_add_col)
-            btn.del_action.setEnabled(can_del_col)
-            btn.clone_action.setEnabled(can_add_col)
+            self._set_btn_state(btn, can_add_col, can_del_col)
 
         self.change_value()
 
+    @staticmethod
+    def _set_btn_state(btn, can_add, can_del):
+        """
+        enable a row or column button's actions, only touching them if their state changed
+        """
+        state = can_add, can_del
+        if btn.state == state:
+            return
+        for action in btn.add_actions:
+            action.setEnabled(can_add)
+        btn.del_action.setEnabled(can_del)
+        btn.state = state
+
     def _make_inner(self):
-        ret: Fidget[T] = self.inner_template()
-        ret.on_change.connect(self.change_value)
+        ret: Fidget[T] = self.inner_template.acquire()
+        ret.share_parser_stats(self._cell_parser_stats)
+        key = next(self._next_key)
+        self._inner_keys[ret] = key
+        listener = self._inner_listeners[ret] = partial(self._inner_changed, key)
+        ret.on_change.connect(listener)
 
         return ret
 
-    def parse(self):
-        ret = []
-        for i, inner_row in enumerate(self.inners):
-            row = []
-            for j, inner in enumerate(inner_row):
-                try:
-                    row.append(inner.maybe_parse())
-                except ParseError as e:
-                    raise ParseError(f'error parsing {i, j}', offender=inner) from e
-            ret.append(row)
-        return ret
+    def _row_parsers(self, column_count: int = None) -> Iterator[List[PlaintextParser[T]]]:
+        """
+        :param column_count: the number of parsers in each row, repeating the last cell's parser, by default one for
+         each cell
+        :return: the parsers of each row of cells, for plaintext imports. With a parse memo, each cell's parser is
+         memoized apart, since cells of the same template might parse texts differently (such as stacked cells on
+         different pages).
+        """
+        for inners_row in self.inners:
+            parsers = (inner.joined_plaintext_parser for inner in inners_row)
+            if self.parse_memo is not None:
+                parsers = (self.parse_memo.memoized(parser) for parser in parsers)
+            yield list(islice(repeat_last(parsers), column_count or len(inners_row)))
+
+    def _forget_cached(self):
+        super()._forget_cached()
+        self._parsed = None
+        self._parse_errors.clear()
+        self._changed_keys.clear()
+        self.print_cache = PrintCache()
+
+    def _inner_changed(self, key, *args):
+        """
+        a slot for when a cell changes, marking it to be re-parsed and re-printed
+        """
+        self._changed_keys.add(key)
+        self.print_cache.discard(key)
+        self.change_value()
+
+    def _parse_inner(self, i, j, inner):
+        """
+        parse a single cell, recording its failure if parsing fails
+        :return: the parsed value of the cell, or None if it failed
+        :raises ValidationError, ValidationPending: if the cell raised it while parsing, aborting the parse
+        """
+        result = inner.maybe_parse_result()
+        if result:
+            self._parse_errors.pop((i, j), None)
+            return result.value
+        if not issubclass(result.exc_type, ParseError):
+            result.unwrap()
+        self._parse_errors[i, j] = result
+        return None
+
+    def parse_result(self):
+        try:
+            if self._parsed is None:
+                self._parse_errors.clear()
+                self._key_positions.clear()
+                self._parsed = []
+                for i, inner_row in enumerate(self.inners):
+                    row = []
+                    for j, inner in enumerate(inner_row):
+                        self._key_positions[self._inner_keys[inner]] = (i, j)
+                        row.append(self._parse_inner(i, j, inner))
+                    self._parsed.append(row)
+            else:
+                copied_rows = set()
+                for key in self._changed_keys:
+                    position = self._key_positions.get(key)
+                    if position is None:
+                        # a deleted cell
+                        continue
+                    i, j = position
+                    if i not in copied_rows:
+                        # rows might be shared with previously returned values, so they are copied before a change
+                        self._parsed[i] = list(self._parsed[i])
+                        copied_rows.add(i)
+                    self._parsed[i][j] = self._parse_inner(i, j, self.inners[i][j])
+        except (ValidationError, ValidationPending) as e:
+            return Fail.of(e)
+        self._changed_keys.clear()
+
+        if self._parse_errors:
+            i, j = min(self._parse_errors)
+            return Fail(ParseError, f'error parsing {i, j}', offender=self.inners[i][j], cause=self._parse_errors[i, j])
+        return Ok(list(self._parsed))
 
     def validate(self, value: List[List[T]]):
         for i, (inner_row, v_row) in enumerate(zip(self.inners, value)):
@@ -462,71 +649,41 @@ class FidgetMatrix(Generic[T], SingleFidgetWrapper[T, List[List[T]]]):
     def fill(self, v):
         rows = len(v)
         cols = len(v[0])
-        same_dims = 0
 
         if rows < self.row_count:
-            for _ in range(self.row_count - rows):
-                self.del_row(self.row_count - 1)
+            self.delete_rows(rows, self.row_count - rows)
         elif rows > self.row_count:
-            for _ in range(rows - self.row_count):
-                self.add_row(self.row_count)
-        else:
-            same_dims += 1
+            self.insert_rows(self.row_count, rows - self.row_count)
 
         if cols < self.column_count:
-            for _ in range(self.column_count - cols):
-                self.del_col(self.column_count - 1)
+            self.delete_columns(cols, self.column_count - cols)
         elif cols > self.column_count:
-            for _ in range(cols - self.column_count):
-                self.add_col(self.column_count)
-        else:
-            same_dims += 1
+            self.insert_columns(self.column_count, cols - self.column_count)
 
         for row, inners_row in zip(v, self.inners):
             for e, inner in zip(row, inners_row):
                 inner.fill_value(e)
 
-        if same_dims < 2:
-            self.apply_matrix()
-
-    # todo allow csv dialects
-    @inner_plaintext_parser
-    def from_csv(self, v):
-        source = StringIO(v, newline='')
-        v = list(csv.reader(source))
-
-        ret = []
-        row_count = len(v)
-        if not row_count:
-            raise PlaintextParseError('list must have at least one row')
-        if not self.row_bounds.in_bounds(row_count):
-            raise PlaintextParseError(f'row number {row_count} is out of bounds')
-        col_count = len(v[0])
+    def _check_dimensions(self, v):
+        col_count = check_row_count(v, self.row_bounds)
         if not self.column_bounds.in_bounds(col_count):
             raise PlaintextParseError(f'column number {col_count} is out of bounds')
+        return col_count
 
-        for row_num, (row, inners_row) in enumerate(zip(v, repeat_last(self.inners))):
-            ret_row = []
-            if len(row) != col_count:
-                raise PlaintextParseError(f'{col_count} column in row, 0 but {len(row)} in row {row_num}')
-            for col_num, (e, inner) in enumerate(zip(row, repeat_last(inners_row))):
-                try:
-                    s = inner.joined_plaintext_parser(e)
-                except PlaintextParseError as exc:
-                    raise PlaintextParseError(f'error parsing {row_num, col_num}') from exc
-
-                ret_row.append(s)
-            ret.append(ret_row)
+    def _parse_rows(self, v):
+        """
+        parse a list of rows of strings, with the plaintext parsers of the cells
+        """
+        col_count = self._check_dimensions(v)
+        return parse_rows(v, self._row_parsers(col_count), col_count)
 
-        return ret
+    @inner_plaintext_parser
+    def from_csv(self, v):
+        return self._parse_rows(read_csv(v))
 
     @inner_plaintext_printer
     def to_csv(self, v):
-        ret = StringIO(newline='')
-        writer = csv.writer(ret)
-        for row in self.string_matrix(v):
-            writer.writerow(row)
-        return ret.getvalue()
+        return write_csv(self.string_matrix(v))
 
     to_csv.__name__ = 'csv'
 
@@ -537,70 +694,15 @@ class FidgetMatrix(Generic[T], SingleFidgetWrapper[T, List[List[T]]]):
         return self.string_matrix(v)
 
     @inner_plaintext_parser
+    @overlapping
     @json_parser(list)
     def from_json(self, v):
-        ret = []
-        row_count = len(v)
-        if not row_count:
-            raise PlaintextParseError('list must have at least one row')
-        if not self.row_bounds.in_bounds(row_count):
-            raise PlaintextParseError(f'row number {row_count} is out of bounds')
-        col_count = len(v[0])
-        if not self.column_bounds.in_bounds(col_count):
-            raise PlaintextParseError(f'column number {col_count} is out of bounds')
-
-        for row_num, (row, inners_row) in enumerate(zip(v, repeat_last(self.inners))):
-            ret_row = []
-            if not isinstance(row, list):
-                raise PlaintextParseError(f'element in index {row_num} is not a list')
-            if len(row) != col_count:
-                raise PlaintextParseError(f'{col_count} column in row 0, but {len(row)} in row {row_num}')
-            for col_num, (e, inner) in enumerate(zip(row, repeat_last(inners_row))):
-                try:
-                    s = inner.joined_plaintext_parser(e)
-                except PlaintextParseError as exc:
-                    raise PlaintextParseError(f'error parsing {row_num, col_num}') from exc
-
-                ret_row.append(s)
-            ret.append(ret_row)
-
-        return ret
+        return self._parse_rows(v)
 
+    @overlapping
     @json_parser(list)
     def from_json_reshape(self, v):
-        def rec_iter(iterable):
-            for i in iterable:
-                if isinstance(i, Iterable) and not isinstance(i, str):
-                    yield from rec_iter(i)
-                else:
-                    yield i
-
-        size = self.row_count * self.column_count
-        i = rec_iter(v)
-        ret = []
-        for row_num, inners_row in enumerate(self.inners):
-            ret_row = []
-            for col_num, inner in enumerate(inners_row):
-                try:
-                    e = next(i)
-                except StopIteration as exc:
-                    raise PlaintextParseError(f'too few elements, expected {size}') from exc
-
-                try:
-                    s = inner.joined_plaintext_parser(e)
-                except PlaintextParseError as exc:
-                    raise PlaintextParseError(f'error parsing {row_num, col_num}') from exc
-
-                ret_row.append(s)
-            ret.append(ret_row)
-
-        try:
-            next(i)
-        except StopIteration:
-            pass
-        else:
-            raise PlaintextParseError(f'too many elements, expected {size}')
-        return ret
+        return parse_reshaped(v, self.row_count, self.column_count, self._row_parsers())
 
     matrix = inner_plaintext_printer(update(__name__='matrix')(table_printer((
         ('/', '\\'),
@@ -619,19 +721,10 @@ class FidgetMatrix(Generic[T], SingleFidgetWrapper[T, List[List[T]]]):
         yield mask(self.from_json_reshape, __explicit__=not self.is_constant_size)
 
     def string_matrix(self, v):
-        ret = []
-        for row_num, (row, inners_row) in enumerate(zip(v, self.inners)):
-            ret_row = []
-            for col_num, (e, inner) in enumerate(zip(row, inners_row)):
-                try:
-                    s = inner.joined_plaintext_printer(e)
-                except PlaintextPrintError as exc:
-                    raise PlaintextPrintError(f'error printing {row_num, col_num}') from exc
-
-                ret_row.append(s)
-            ret.append(ret_row)
-
-        return ret
+        return print_rows(v, ([partial(self.print_cache.printed, self._inner_keys[inner], col_num,
+                                       printer=inner.joined_plaintext_printer)
+                               for col_num, inner in enumerate(inners_row)]
+                              for inners_row in self.inners))
 
     @property
     def is_constant_size(self):
@@ -62,6 +62,7 @@ class FidgetMinimal(Generic[T], SingleFidgetWrapper[T, T]):
             layout.addWidget(self.outer)
 
             self.question = FidgetQuestion(self.inner_template, parent=self)
+            self.depend_on_plaintext_adapters(self.question)
 
         self.outer.add_plaintext_delegates(self.question)
 
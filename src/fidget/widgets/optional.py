@@ -13,6 +13,8 @@ from fidget.backend.QtCore import QObject, QEvent, __backend__
 from fidget.core import Fidget, PlaintextPrintError, PlaintextParseError, FidgetTemplate
 from fidget.core.__util__ import first_valid
 
+from fidget.model.wrappers import OptionalModel
+
 from fidget.widgets.idiomatic_inner import SingleFidgetWrapper
 from fidget.widgets.__util__ import only_valid, is_trivial_printer
 
@@ -31,14 +33,7 @@ class FidgetOptional(Generic[T, C], SingleFidgetWrapper[T, Union[T, C]]):
     """
     A Fidget wrapper that allows an inner Fidget to be disabled, setting the value to None or another singleton
     """
-    singleton_names = {
-        None: frozenset(['none']),
-        NotImplemented: frozenset(['notimplemented', 'not implemented']),
-        ...: frozenset(['...', 'ellipsis']),
-        (): frozenset(['()']),
-        0: frozenset(['0']),
-        '': frozenset(['""', "''"])
-    }
+    singleton_names = OptionalModel.singleton_names
 
     class MouseWarden(QObject):
         """
@@ -114,6 +109,7 @@ class FidgetOptional(Generic[T, C], SingleFidgetWrapper[T, Union[T, C]]):
             layout.addWidget(self.not_none_checkbox)
 
             self.inner = self.inner_template()
+            self.depend_on_plaintext_adapters(self.inner)
             self.inner.on_change.connect(self.change_value)
             self.inner.setEnabled(False)
 
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from typing import TypeVar, Generic, Iterable, Tuple, Union, Type, List, Dict
 
-from collections import namedtuple
 from functools import partial, update_wrapper
 from abc import abstractmethod
 from itertools import chain
@@ -13,6 +12,8 @@ from fidget.backend.QtWidgets import QVBoxLayout, QStackedWidget, QComboBox, QFr
 from fidget.core import Fidget, ParseError, FidgetTemplate, TemplateLike
 from fidget.core.__util__ import first_valid
 
+from fidget.model.wrappers import StackedModel
+
 from fidget.widgets.idiomatic_inner import MultiFidgetWrapper
 from fidget.widgets.__util__ import only_valid
 
@@ -167,7 +168,8 @@ class FidgetStacked(Generic[T], MultiFidgetWrapper[T, T]):
 
     selectors = {'combo': ComboSelector, 'radio': RadioSelector, 'checkbox': CheckBoxSelector}
 
-    targeted_fill = namedtuple('targeted_fill', 'option_name value')
+    # shared with the headless model, so a targeted fill can be passed to either
+    targeted_fill = StackedModel.targeted_fill
 
     def __init__(self, title, inner_templates: Iterable[NamedTemplate[T]] = None,
                  frame_style=None, selector_cls: Union[Type[Selector], str] = None,
@@ -236,6 +238,7 @@ class FidgetStacked(Generic[T], MultiFidgetWrapper[T, T]):
 
                 self.stacked.addWidget(inner)
                 self.selector.add_option(name)
+                self.depend_on_plaintext_adapters(inner)
 
                 inner.on_change.connect(self.change_value)
 
@@ -287,6 +290,8 @@ class FidgetStacked(Generic[T], MultiFidgetWrapper[T, T]):
         if isinstance(v, self.targeted_fill):
             name = v.option_name
             self.selector.fill_value(name)
+            # the selector's on_change is deferred while in a bulk update, but the value must reach the new option
+            self.stacked.setCurrentIndex(self.selector.options[name])
             v = v.value
         self.current_subwidget().fill(v)
 
@@ -308,4 +313,6 @@ class FidgetStacked(Generic[T], MultiFidgetWrapper[T, T]):
         if not index.is_ok():
             raise index.exception
         self.stacked.setCurrentIndex(index.value)
+        # the printers, and the order of the parsers, are those of the current option
+        self.invalidate_plaintext_adapters()
         self.change_value()
@@ -30,7 +30,6 @@ class FidgetTabs(FidgetMapping):
         self.summary_layout = QVBoxLayout()
 
         for name, inner in self.make_inners().items():
-            inner.on_change.connect(self.change_value)
             self.tabbed.addTab(inner, name)
 
         with self.setup_provided(self.summary_layout):
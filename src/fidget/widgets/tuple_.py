@@ -4,9 +4,9 @@ from collections import namedtuple
 from typing import Type, Iterable, Tuple, NamedTuple
 
 from fidget.backend.QtWidgets import QVBoxLayout, QFrame, QBoxLayout
-from fidget.core import PlaintextPrintError, PlaintextParseError, TemplateLike
+from fidget.core import TemplateLike, Ok
 from fidget.core.__util__ import first_valid
-from fidget.widgets.__util__ import to_identifier
+from fidget.widgets.__util__ import to_identifier, parse_json_sequence, print_json_sequence
 from fidget.widgets.compound import FidgetCompound
 
 
@@ -90,41 +90,14 @@ class FidgetTuple(FidgetCompound[tuple]):
 
         return master_layout
 
-    def parse(self):
-        seq = super().parse()
-        return self.value_type._make(seq)
+    def parse_result(self):
+        result = super().parse_result()
+        if not result:
+            return result
+        return Ok(self.value_type._make(result.value))
 
     def _from_json(self, d: list, exact=True):
-        if not isinstance(d, list):
-            raise PlaintextParseError from TypeError('expected list, got '+type(d).__name__)
-        if exact and len(d) != len(self.inners):
-            raise PlaintextParseError(f'value number mismatch (expected {len(self.inners)}, got {len(d)})')
-
-        ret = []
-
-        for s, v in zip(self.inners, d):
-            if not isinstance(v, str):
-                raise PlaintextParseError(f'in {s.title}:, value must be str, got {type(v).__name__}')
-
-            try:
-                parsed = s.joined_plaintext_parser(v)
-            except PlaintextParseError as e:
-                raise PlaintextParseError(f'error parsing {s.title}') from e
-
-            ret.append(parsed)
-
-        return tuple(ret)
+        return parse_json_sequence(self.inners, d, exact)
 
     def _to_json(self, d: Tuple):
-        if not isinstance(d, tuple):
-            raise PlaintextPrintError('can only print tuples')
-        ret = []
-        for i, subwidget in enumerate(self.inners):
-            v = d[i]
-            try:
-                s = subwidget.joined_plaintext_printer(v)
-            except PlaintextPrintError as e:
-                raise PlaintextPrintError(f'error printing {subwidget.title}') from e
-            ret.append(s)
-
-        return ret
+        return print_json_sequence(self.inners, d)
@@ -1,12 +1,13 @@
 from typing import TypeVar, Generic
 
-from fidget.core import format_printer, regex_parser, PlaintextParseError, wrap_plaintext_parser, Fidget, \
-    TemplateLike, inner_plaintext_parser, ParseError
+from fidget.core import Fidget, TemplateLike, inner_plaintext_parser, ParseError, try_parse, Fail
 
 from fidget.widgets.line import FidgetLine
 from fidget.widgets.text import FidgetPlainText
 from fidget.widgets.converter import FidgetConverter
-from fidget.widgets.__util__ import parse_int
+# the parsers and printers are shared with the headless models
+from fidget.model.primitives import int_parser, int_printers, float_parser, float_printers, percentage, ratio, \
+    complex_parser
 
 T = TypeVar('T')
 
@@ -33,12 +34,11 @@ class SimpleLineEdit(Generic[T], FidgetConverter[str, T]):
         ret = printer(v)
         return ret
 
-    def convert(self, v: str) -> T:
-        parser = self.joined_plaintext_parser
-        try:
-            return parser(v)
-        except PlaintextParseError as e:
-            raise ParseError(offender=self.inner) from e
+    def convert_result(self, v: str):
+        result = try_parse(self.joined_plaintext_parser, v)
+        if not result:
+            return Fail(ParseError, offender=self.inner, cause=result)
+        return result
 
     line_edit_cls: TemplateLike[str] = FidgetLine.template()
 
@@ -69,12 +69,11 @@ class SimplePlainEdit(Generic[T], FidgetConverter[str, T]):
         printer = self.joined_plaintext_printer
         return printer(v)
 
-    def convert(self, v: str) -> T:
-        parser = self.joined_plaintext_parser
-        try:
-            return parser(v)
-        except PlaintextParseError as e:
-            raise ParseError(offender=self.inner) from e
+    def convert_result(self, v: str):
+        result = try_parse(self.joined_plaintext_parser, v)
+        if not result:
+            return Fail(ParseError, offender=self.inner, cause=result)
+        return result
 
     line_edit_cls: TemplateLike[str] = FidgetPlainText.template()
 
@@ -88,20 +87,12 @@ class FidgetInt(SimpleLineEdit[int]):
     """
     A line edit that converts the value to int
     """
-    _func = inner_plaintext_parser(staticmethod(wrap_plaintext_parser(ValueError, parse_int)))
-    _cls_printers = [
-        format_printer('n'),
-        format_printer(','),
-        format_printer('_b'),
-        format_printer('_X')
-    ]
+    _func = inner_plaintext_parser(staticmethod(int_parser))
+    _cls_printers = int_printers
 
     @classmethod
     def cls_plaintext_printers(cls):
         yield from super().cls_plaintext_printers()
-        yield hex
-        yield bin
-        yield oct
         yield from cls._cls_printers
 
 
@@ -109,40 +100,11 @@ class FidgetFloat(SimpleLineEdit[float]):
     """
     A line edit that converts the value to float
     """
-    _func = inner_plaintext_parser(staticmethod(wrap_plaintext_parser(ValueError, float)))
-    _cls_printers = [
-        format_printer('f'),
-        format_printer('e'),
-        format_printer('g'),
-        format_printer('%'),
-    ]
-
-    @inner_plaintext_parser
-    @staticmethod
-    @regex_parser(r'([0-9]*(\.[0-9]+)?)%')
-    def percentage(m):
-        try:
-            return float(m[1]) / 100
-        except ValueError as e:
-            raise PlaintextParseError() from e
-
-    @inner_plaintext_parser
-    @staticmethod
-    @regex_parser(r'(?P<num>[0-9]+)\s*/\s*(?P<den>[0-9]*[1-9][0-9]*)')
-    def ratio(m):
-        n = m['num']
-        d = m['den']
-
-        try:
-            n = float(n)
-            d = float(d)
-        except ValueError as e:
-            raise PlaintextParseError() from e
-
-        try:
-            return n / d
-        except ValueError as e:
-            raise PlaintextParseError() from e
+    _func = inner_plaintext_parser(staticmethod(float_parser))
+    _cls_printers = float_printers
+
+    percentage = inner_plaintext_parser(staticmethod(percentage))
+    ratio = inner_plaintext_parser(staticmethod(ratio))
 
     @classmethod
     def cls_plaintext_printers(cls):
@@ -154,7 +116,7 @@ class FidgetComplex(SimpleLineEdit[complex]):
     """
     A line edit that converts the value to complex
     """
-    _func = inner_plaintext_parser(staticmethod(wrap_plaintext_parser(ValueError, complex)))
+    _func = inner_plaintext_parser(staticmethod(complex_parser))
 
 
 def template(*args, **kwargs):
@@ -0,0 +1,730 @@
+from typing import TypeVar, Generic, List, Iterable, Callable, NamedTuple, Type, Dict, Tuple, Optional, Set
+from itertools import chain, repeat
+from functools import partial
+from collections import namedtuple
+
+from fidget.core.plaintext_adapter import high_priority, overlapping, ParseMemo, PlaintextParser
+
+from fidget.backend.QtWidgets import QVBoxLayout, QMenu, QTableView, QStyledItemDelegate, QWidget
+from fidget.backend.QtCore import Qt, QAbstractTableModel, QModelIndex
+from fidget.backend.QtGui import QBrush
+from fidget.backend.Resources import add_row_above_icon, add_row_below_icon, add_col_left_icon, add_col_right_icon, \
+    del_row_icon, del_col_icon
+
+from fidget.core import TemplateLike, Fidget, FidgetTemplate, ParseError, ValidationError, json_parser, \
+    PlaintextPrintError, PlaintextParseError, json_printer
+from fidget.core.result import Ok, Fail
+from fidget.core.__util__ import first_valid, mask, update, error_details
+
+from fidget.model import Model, model_of
+
+from fidget.widgets.idiomatic_inner import SingleFidgetWrapper, MultiFidgetWrapper
+from fidget.widgets.user_util import FidgetInt
+from fidget.widgets.confirmer import FidgetQuestion
+from fidget.widgets.__util__ import only_valid, valid_between, CountBounds, table_printer, to_identifier, \
+    check_row_count, parse_rows, parse_reshaped, print_rows, read_csv, write_csv
+
+T = TypeVar('T')
+
+_UNSET = object()
+"""the value of a cell whose template has no valid initial value, and that was not set since"""
+
+
+class CellsModel(QAbstractTableModel):
+    """
+    A Qt table model of the raw values of the cells of a FidgetGridView
+    """
+
+    def __init__(self, owner: 'FidgetGridView'):
+        super().__init__(owner)
+        self.owner = owner
+        self.cells: List[list] = []  # first row, then column, self.cells[row][column]
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.cells)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self.owner.column_count
+
+    def data(self, index, role=Qt.DisplayRole):
+        i, j = index.row(), index.column()
+        if role == Qt.DisplayRole:
+            return self.owner.cell_text(i, j)
+        if role == Qt.ToolTipRole:
+            error = self.owner.cell_error(i, j)
+            return None if error is None else error_details(error)
+        if role == Qt.ForegroundRole:
+            return None if self.owner.cell_error(i, j) is None else self.owner.invalid_cell_brush
+        return None
+
+    def flags(self, index):
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.owner.column_title(section)
+        return self.owner.row_title(section)
+
+
+class CellDelegate(QStyledItemDelegate):
+    """
+    A delegate that edits a cell of a FidgetGridView with a widget of the cell's template
+    """
+
+    def __init__(self, owner: 'FidgetGridView'):
+        super().__init__(owner)
+        self.owner = owner
+
+    def createEditor(self, parent, option, index):
+        ret: Fidget = self.owner.cell_template(index.column())()
+        ret.setParent(parent)
+        ret.setAutoFillBackground(True)
+        # some widgets shadow the layout method with an attribute
+        layout = QWidget.layout(ret)
+        if layout is not None:
+            layout.setContentsMargins(0, 0, 0, 0)
+        return ret
+
+    def setEditorData(self, editor: Fidget, index):
+        v = self.owner.cell(index.row(), index.column())
+        if v is not _UNSET and editor.fill is not None:
+            editor.fill_value(v)
+
+    def setModelData(self, editor: Fidget, model, index):
+        value = editor.value()
+        if value.is_ok():
+            v = value.value
+        elif getattr(value, 'parsed_value', ...) is not ...:
+            # the cell is set, and shown to be invalid
+            v = value.parsed_value
+        else:
+            # text that cannot be parsed is discarded, the cell keeps its value
+            return
+        self.owner.set_cell(index.row(), index.column(), v)
+
+    def updateEditorGeometry(self, editor, option, index):
+        editor.setGeometry(option.rect)
+
+
+class FidgetGridView(Fidget[List[T]]):
+    """
+    A superclass for grids of cells that are displayed in a QTableView, rather than a widget per cell. The cells hold
+    raw values, that are parsed, validated and printed by headless models of the cells' templates (see
+    fidget.model.model_of). Widgets of the templates are only created to edit a single cell.
+    Since a cell is validated by its model, a template whose widget cannot be modeled, such as one whose class
+    overrides parse or validate, raises a TypeError when the view is created, pass validation_func instead.
+    """
+
+    def __init__(self, title, rows: CountBounds = None, row_button_text_func: Callable[[int], str] = None,
+                 parse_memo_size: int = None, **kwargs):
+        self.row_bounds = CountBounds[first_valid(rows=rows, ROWS=self.ROWS, _self=self)]
+
+        super().__init__(title, **kwargs)
+
+        self.row_button_text_func = first_valid(row_button_text_func=row_button_text_func,
+                                                ROW_BUTTON_TEXT_FUNC=self.ROW_BUTTON_TEXT_FUNC, _self=self)
+
+        self.cells_model: CellsModel = None
+        self.view: QTableView = None
+        self.invalid_cell_brush = QBrush(Qt.red)
+
+        # the number of cells that hold _UNSET
+        self._unset_count = 0
+        # the rows of cells that are not shared with a value returned from parse, and can be set in-place
+        self._owned_rows: Set[int] = set()
+        # the value last returned from parse, only its changed cells are re-validated
+        self._parsed: Optional[list] = None
+        self._validation_errors: Dict[Tuple[int, int], ValidationError] = {}
+        # the cells to re-validate, or None to validate all of them
+        self._unvalidated: Optional[Set[Tuple[int, int]]] = None
+        # opt-in, remembers the values of cell texts parsed in plaintext imports
+        parse_memo_size = first_valid(parse_memo_size=parse_memo_size, PARSE_MEMO_SIZE=self.PARSE_MEMO_SIZE, _self=self)
+        self.parse_memo: Optional[ParseMemo] = ParseMemo(parse_memo_size) if parse_memo_size else None
+
+    ROWS = 1
+    ROW_BUTTON_TEXT_FUNC: Callable[[int], str] = staticmethod(str)
+    PARSE_MEMO_SIZE: int = 0
+
+    column_count: int
+
+    def init_ui(self):
+        super().init_ui()
+        layout = QVBoxLayout(self)
+
+        with self.setup_provided(layout):
+            self.cells_model = CellsModel(self)
+            self.view = QTableView()
+            self.view.setModel(self.cells_model)
+            self.view.setItemDelegate(CellDelegate(self))
+
+            if not self.row_bounds.is_const:
+                header = self.view.verticalHeader()
+                header.setContextMenuPolicy(Qt.CustomContextMenu)
+                header.customContextMenuRequested.connect(self._row_menu)
+
+            layout.addWidget(self.view)
+
+        self.setFocusProxy(self.view)
+
+        with self.suppress_update(call_on_exit=False):
+            self.insert_rows(0, self.row_bounds.initial)
+
+        return layout
+
+    # region cells
+    def cell_template(self, column_number) -> FidgetTemplate:
+        """
+        :return: the template of the widget that edits the cells of a column
+        """
+        raise NotImplementedError
+
+    def column_model(self, column_number) -> Model:
+        """
+        :return: the model that parses, validates and prints the cells of a column
+        """
+        raise NotImplementedError
+
+    def column_title(self, column_number) -> str:
+        raise NotImplementedError
+
+    def row_title(self, row_number) -> str:
+        return self.row_button_text_func(row_number)
+
+    def _cell_name(self, row_num, col_num):
+        return str((row_num, col_num))
+
+    @property
+    def row_count(self):
+        return len(self.cells_model.cells)
+
+    def cell(self, row_num, col_num):
+        """
+        :return: the raw value of a cell
+        """
+        return self.cells_model.cells[row_num][col_num]
+
+    def set_cell(self, row_num, col_num, v):
+        """
+        set the raw value of a cell
+        """
+        cells = self.cells_model.cells
+        if row_num not in self._owned_rows:
+            # the row might be shared with a previously returned value, so it is copied before a change
+            cells[row_num] = list(cells[row_num])
+            self._owned_rows.add(row_num)
+        if cells[row_num][col_num] is _UNSET:
+            self._unset_count -= 1
+        cells[row_num][col_num] = v
+        self._cell_changed(row_num, col_num)
+        if self._unvalidated is not None:
+            self._unvalidated.add((row_num, col_num))
+        index = self.cells_model.index(row_num, col_num)
+        self.cells_model.dataChanged.emit(index, index)
+        self.change_value()
+
+    def _cell_changed(self, row_num, col_num):
+        pass
+
+    def cell_text(self, row_num, col_num) -> str:
+        """
+        :return: the text a cell is displayed as
+        """
+        v = self.cell(row_num, col_num)
+        if v is _UNSET:
+            return ''
+        try:
+            return self.column_model(col_num).joined_plaintext_printer(v)
+        except PlaintextPrintError:
+            return ''
+
+    def cell_error(self, row_num, col_num) -> Optional[Exception]:
+        """
+        :return: the error of a cell that is unset or invalid, if there is one
+        """
+        if self.cell(row_num, col_num) is _UNSET:
+            return self.column_initial(col_num)[1].exception
+        return self._validation_errors.get((row_num, col_num))
+
+    def column_initial(self, column_number) -> Tuple[object, Optional[Fail]]:
+        """
+        :return: the initial value of a column's cells, and the failure that leaves them unset if there is one
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def _initial_of(model: Model) -> Tuple[object, Optional[Fail]]:
+        value = model.value()
+        if value.is_ok():
+            return value.value, None
+        if value.parsed_value is not ...:
+            return value.parsed_value, None
+        return _UNSET, value.fail
+
+    def _new_row(self):
+        return [self.column_initial(j)[0] for j in range(self.column_count)]
+
+    def _unset_columns(self):
+        return sum(self.column_initial(j)[0] is _UNSET for j in range(self.column_count))
+
+    def _structure_changed(self):
+        """
+        a slot for when rows or columns are added or removed
+        """
+        self._owned_rows.clear()
+        self._validation_errors.clear()
+        self._unvalidated = None
+        self.change_value()
+
+    def _forget_cached(self):
+        super()._forget_cached()
+        self._parsed = None
+        self._unvalidated = None
+
+    # endregion
+
+    # region rows
+    def insert_rows(self, index, count=1):
+        """
+        insert new rows of initial cells
+        :param index: the index of the first new row
+        :param count: the number of rows to insert
+        """
+        if count <= 0:
+            return
+        self.cells_model.beginInsertRows(QModelIndex(), index, index + count - 1)
+        self.cells_model.cells[index:index] = [self._new_row() for _ in range(count)]
+        self._unset_count += count * self._unset_columns()
+        self.cells_model.endInsertRows()
+        self._structure_changed()
+
+    def delete_rows(self, index, count=1):
+        """
+        delete rows
+        :param index: the index of the first row to delete
+        :param count: the number of rows to delete
+        """
+        if count <= 0:
+            return
+        cells = self.cells_model.cells
+        self.cells_model.beginRemoveRows(QModelIndex(), index, index + count - 1)
+        self._unset_count -= sum(v is _UNSET for v in chain.from_iterable(cells[index:index + count]))
+        del cells[index:index + count]
+        self.cells_model.endRemoveRows()
+        self._structure_changed()
+
+    def _ask_count(self, title, bounds: CountBounds, current):
+        """
+        ask the user for a number of rows or columns to add
+        :return: the number, or None if the user cancelled
+        """
+        question = FidgetQuestion(
+            FidgetInt(title, validation_func=valid_between(1, None if bounds.max is None else (bounds.max - current))),
+            cancel_value=None
+        )
+        response = question.exec_()
+        if not response.is_ok():
+            return None
+        return response.value or None
+
+    def _ask_insert_rows(self, index):
+        count = self._ask_count('# of rows to add', self.row_bounds, self.row_count)
+        if count:
+            self.insert_rows(index, count)
+
+    def _row_menu(self, pos):
+        header = self.view.verticalHeader()
+        row = header.logicalIndexAt(pos)
+        if row < 0:
+            return
+        menu = QMenu(self)
+        can_add = self.row_bounds.in_bounds(self.row_count + 1)
+        can_del = self.row_bounds.in_bounds(self.row_count - 1)
+
+        menu.addAction(add_row_above_icon(), 'add row above', partial(self.insert_rows, row)).setEnabled(can_add)
+        menu.addAction('add rows above', partial(self._ask_insert_rows, row)).setEnabled(can_add)
+        menu.addAction(add_row_below_icon(), 'add row below', partial(self.insert_rows, row + 1)).setEnabled(can_add)
+        menu.addAction('add rows below', partial(self._ask_insert_rows, row + 1)).setEnabled(can_add)
+        menu.addAction(del_row_icon(), 'delete row', partial(self.delete_rows, row)).setEnabled(can_del)
+
+        menu.exec_(header.mapToGlobal(pos))
+
+    # endregion
+
+    def _value_rows(self, cells: List[list]) -> list:
+        """
+        :return: the rows of the parsed value
+        """
+        return list(cells)
+
+    def parse_result(self):
+        cells = self.cells_model.cells
+        if self._unset_count:
+            i, j = next((i, j) for i, row in enumerate(cells) for j, v in enumerate(row) if v is _UNSET)
+            return Fail(ParseError, f'error parsing {self._cell_name(i, j)}', offender=self.view,
+                        cause=self.column_initial(j)[1])
+        # all the rows are now shared with the returned value
+        self._owned_rows.clear()
+        self._parsed = self._value_rows(cells)
+        return Ok(self._parsed)
+
+    def validate(self, value):
+        super().validate(value)
+        validators = [self.column_model(j).validate for j in range(self.column_count)]
+        if value is not self._parsed or self._unvalidated is None:
+            errors = {}
+            for i, row in enumerate(value):
+                for j, (validate, v) in enumerate(zip(validators, row)):
+                    try:
+                        validate(v)
+                    except ValidationError as e:
+                        errors[i, j] = e
+        else:
+            errors = dict(self._validation_errors)
+            for i, j in self._unvalidated:
+                try:
+                    validators[j](value[i][j])
+                except ValidationError as e:
+                    errors[i, j] = e
+                else:
+                    errors.pop((i, j), None)
+
+        if value is self._parsed:
+            self._unvalidated = set()
+            if errors.keys() != self._validation_errors.keys():
+                self.view.viewport().update()
+            self._validation_errors = errors
+        if errors:
+            i, j = min(errors)
+            raise ValidationError(f'error validating {self._cell_name(i, j)}', offender=self.view) from errors[i, j]
+
+    def _fill_cells(self, cells: List[list], column_count: int = None):
+        """
+        replace all the cells
+        :param column_count: the new number of columns, None if it does not change
+        """
+        self.cells_model.beginResetModel()
+        self.cells_model.cells = cells
+        if column_count is not None:
+            # the table model only reports the new dimensions once it is reset
+            self.column_count = column_count
+        self._unset_count = 0
+        self.cells_model.endResetModel()
+        self._structure_changed()
+        # the rows are new, and not shared with any value
+        self._owned_rows.update(range(len(cells)))
+
+    def fill(self, v):
+        self._fill_cells([list(row) for row in v])
+
+    # region plaintext
+    def _column_parser(self, column_number) -> PlaintextParser:
+        parser = self.column_model(column_number).joined_plaintext_parser
+        if self.parse_memo is not None:
+            parser = self.parse_memo.memoized(parser, self.cell_template(column_number))
+        return parser
+
+    def _check_dimensions(self, v):
+        return check_row_count(v, self.row_bounds)
+
+    def _parse_rows(self, v):
+        """
+        parse a list of rows of strings, with the plaintext parsers of the columns
+        """
+        col_count = self._check_dimensions(v)
+        return parse_rows(v, [[self._column_parser(j) for j in range(col_count)]], col_count)
+
+    def from_csv(self, v):
+        return self._parse_rows(read_csv(v))
+
+    @overlapping
+    @json_parser(list)
+    def from_json(self, v):
+        return self._parse_rows(v)
+
+    @overlapping
+    @json_parser(list)
+    def from_json_reshape(self, v):
+        return parse_reshaped(v, self.row_count, self.column_count,
+                              [[self._column_parser(j) for j in range(self.column_count)]])
+
+    def to_csv(self, v):
+        return write_csv(self.string_matrix(v))
+
+    to_csv.__name__ = 'csv'
+
+    @high_priority
+    @json_printer
+    def to_json(self, v):
+        return self.string_matrix(v)
+
+    def string_matrix(self, v):
+        printers = [self.column_model(j).joined_plaintext_printer for j in range(self.column_count)]
+        return print_rows(v, repeat(printers))
+
+    @property
+    def is_constant_size(self):
+        return self.row_bounds.is_const
+
+    def plaintext_parsers(self):
+        yield self.from_csv
+        yield self.from_json
+        yield from super().plaintext_parsers()
+        yield mask(self.from_json_reshape, __explicit__=not self.is_constant_size)
+
+    # endregion
+
+
+class FidgetMatrixView(Generic[T], SingleFidgetWrapper[T, List[List[T]]], FidgetGridView[T]):
+    """
+    A matrix of cells of the same template, like FidgetMatrix, displayed in a QTableView
+    """
+
+    def __init__(self, inner_template: TemplateLike[T] = None, rows: CountBounds = None, columns: CountBounds = None,
+                 row_button_text_func: Callable[[int], str] = None,
+                 column_button_text_func: Callable[[int], str] = None,
+                 **kwargs):
+        """
+        :param inner_template: the template of the cells
+        :param rows: the bounds of the number of rows
+        :param columns: the bounds of the number of columns
+        :param row_button_text_func: the title of each row's header
+        :param column_button_text_func: the title of each column's header, defaults to row_button_text_func
+        :param kwargs: forwarded to FidgetGridView
+        """
+        self.column_bounds = CountBounds[first_valid(columns=columns, COLUMNS=self.COLUMNS, _self=self)]
+
+        inner_template = only_valid(inner_template=inner_template, INNER_TEMPLATE=self.INNER_TEMPLATE,
+                                    _self=self).template_of()
+
+        super().__init__(inner_template.title, rows=rows, row_button_text_func=row_button_text_func, **kwargs)
+
+        self.inner_template = inner_template
+        self.inner_model = model_of(inner_template)
+        self._initial = self._initial_of(self.inner_model)
+        self.column_button_text_func = first_valid(column_button_text_func=column_button_text_func,
+                                                   COLUMN_BUTTON_TEXT_FUNC=self.COLUMN_BUTTON_TEXT_FUNC, _self=self)
+        if self.column_button_text_func is ...:
+            self.column_button_text_func = self.row_button_text_func
+
+        self.column_count = self.column_bounds.initial
+
+        self.init_ui()
+
+    INNER_TEMPLATE: FidgetTemplate[T] = None
+    COLUMNS = 1
+    COLUMN_BUTTON_TEXT_FUNC: Callable[[int], str] = ...
+
+    def init_ui(self):
+        ret = super().init_ui()
+        if not self.column_bounds.is_const:
+            header = self.view.horizontalHeader()
+            header.setContextMenuPolicy(Qt.CustomContextMenu)
+            header.customContextMenuRequested.connect(self._column_menu)
+        return ret
+
+    def cell_template(self, column_number):
+        return self.inner_template
+
+    def column_model(self, column_number):
+        return self.inner_model
+
+    def column_title(self, column_number):
+        return self.column_button_text_func(column_number)
+
+    def column_initial(self, column_number):
+        return self._initial
+
+    def _new_row(self):
+        return [self._initial[0]] * self.column_count
+
+    def indication_changed(self, value):
+        Fidget.indication_changed(self, value)
+
+    def insert_columns(self, index, count=1):
+        """
+        insert new columns of initial cells
+        :param index: the index of the first new column
+        :param count: the number of columns to insert
+        """
+        if count <= 0:
+            return
+        initial = self._initial[0]
+        cells = self.cells_model.cells
+        self.cells_model.beginInsertColumns(QModelIndex(), index, index + count - 1)
+        for i, row in enumerate(cells):
+            cells[i] = row[:index] + [initial] * count + row[index:]
+        self.column_count += count
+        if initial is _UNSET:
+            self._unset_count += count * len(cells)
+        self.cells_model.endInsertColumns()
+        self._structure_changed()
+
+    def delete_columns(self, index, count=1):
+        """
+        delete columns
+        :param index: the index of the first column to delete
+        :param count: the number of columns to delete
+        """
+        if count <= 0:
+            return
+        cells = self.cells_model.cells
+        self.cells_model.beginRemoveColumns(QModelIndex(), index, index + count - 1)
+        for i, row in enumerate(cells):
+            self._unset_count -= sum(v is _UNSET for v in row[index:index + count])
+            cells[i] = row[:index] + row[index + count:]
+        self.column_count -= count
+        self.cells_model.endRemoveColumns()
+        self._structure_changed()
+
+    def _ask_insert_columns(self, index):
+        count = self._ask_count('# of columns to add', self.column_bounds, self.column_count)
+        if count:
+            self.insert_columns(index, count)
+
+    def _column_menu(self, pos):
+        header = self.view.horizontalHeader()
+        col = header.logicalIndexAt(pos)
+        if col < 0:
+            return
+        menu = QMenu(self)
+        can_add = self.column_bounds.in_bounds(self.column_count + 1)
+        can_del = self.column_bounds.in_bounds(self.column_count - 1)
+
+        menu.addAction(add_col_left_icon(), 'add column left', partial(self.insert_columns, col)).setEnabled(can_add)
+        menu.addAction('add columns left', partial(self._ask_insert_columns, col)).setEnabled(can_add)
+        menu.addAction(add_col_right_icon(), 'add column right',
+                       partial(self.insert_columns, col + 1)).setEnabled(can_add)
+        menu.addAction('add columns right', partial(self._ask_insert_columns, col + 1)).setEnabled(can_add)
+        menu.addAction(del_col_icon(), 'delete column', partial(self.delete_columns, col)).setEnabled(can_del)
+
+        menu.exec_(header.mapToGlobal(pos))
+
+    def fill(self, v):
+        self._fill_cells([list(row) for row in v], column_count=len(v[0]))
+
+    def _check_dimensions(self, v):
+        col_count = super()._check_dimensions(v)
+        if not self.column_bounds.in_bounds(col_count):
+            raise PlaintextParseError(f'column number {col_count} is out of bounds')
+        return col_count
+
+    @property
+    def is_constant_size(self):
+        return self.row_bounds.is_const and self.column_bounds.is_const
+
+    matrix = update(__name__='matrix')(table_printer((
+        ('/', '\\'),
+        ('|', '|'),
+        ('\\', '/')
+    ), ',', '\n'))
+
+    markdown = update(__name__='markdown')(table_printer((
+        ('|', '|'),
+        ('|', '|'),
+        ('|', '|')
+    ), '|', '\n'))
+
+    def plaintext_printers(self):
+        yield self.to_csv
+        yield self.to_json
+        yield self.matrix
+        yield self.markdown
+        yield from super().plaintext_printers()
+
+
+class FidgetTableView(Generic[T], MultiFidgetWrapper[object, List[NamedTuple]], FidgetGridView[NamedTuple]):
+    """
+    Rows of cells, each column of its own template, gathered into namedtuples like FidgetTable, displayed in a
+    QTableView
+    """
+
+    def __init__(self, title: str, inner_templates: Iterable[TemplateLike[T]] = None, rows: CountBounds = None,
+                 **kwargs):
+        """
+        :param title: the title
+        :param inner_templates: the template of each column's cells
+        :param rows: the bounds of the number of rows
+        :param kwargs: forwarded to FidgetGridView
+        """
+        inner_templates = tuple(
+            t.template_of() for t in
+            only_valid(inner_templates=inner_templates, INNER_TEMPLATES=self.INNER_TEMPLATES, _self=self)
+        )
+
+        super().__init__(title, rows=rows, **kwargs)
+
+        self.inner_templates = inner_templates
+        self.column_models = [model_of(t) for t in inner_templates]
+        self._initials = [self._initial_of(m) for m in self.column_models]
+        self.column_count = len(inner_templates)
+
+        self.field_titles = [t.title or '_' + str(i) for i, t in enumerate(inner_templates)]
+        self.value_type: Type[NamedTuple] = namedtuple(to_identifier(self.title),
+                                                       (to_identifier(f) for f in self.field_titles), rename=True)
+
+        # the rows of the last parse, remade only where cells changed, reset when the row count changes
+        self._parsed_rows: List[NamedTuple] = None
+        self._changed_rows: Set[int] = set()
+
+        self.init_ui()
+
+    INNER_TEMPLATES: Iterable[FidgetTemplate[T]] = None
+
+    def cell_template(self, column_number):
+        return self.inner_templates[column_number]
+
+    def column_model(self, column_number):
+        return self.column_models[column_number]
+
+    def column_title(self, column_number):
+        return self.field_titles[column_number]
+
+    def column_initial(self, column_number):
+        return self._initials[column_number]
+
+    def _cell_name(self, row_num, col_num):
+        return f'{row_num}[{self.value_type._fields[col_num]}]'
+
+    def _cell_changed(self, row_num, col_num):
+        self._changed_rows.add(row_num)
+
+    def _structure_changed(self):
+        self._parsed_rows = None
+        super()._structure_changed()
+
+    def _forget_cached(self):
+        self._parsed_rows = None
+        super()._forget_cached()
+
+    def _value_rows(self, cells):
+        if self._parsed_rows is None:
+            self._parsed_rows = [self.value_type._make(row) for row in cells]
+        else:
+            for i in self._changed_rows:
+                self._parsed_rows[i] = self.value_type._make(cells[i])
+        self._changed_rows.clear()
+        return list(self._parsed_rows)
+
+    def _check_dimensions(self, v):
+        col_count = super()._check_dimensions(v)
+        if col_count != self.column_count:
+            raise PlaintextParseError(f'column number mismatch {col_count} (expected {self.column_count})')
+        return col_count
+
+    markdown = update(__name__='markdown')(table_printer((
+        ('|', '|'),
+        ('|', '|'),
+        ('|', '|')
+    ), '|', '\n', header_row=lambda self: self.value_type._fields))
+
+    def plaintext_printers(self):
+        yield self.to_csv
+        yield self.to_json
+        yield self.markdown
+        yield from super().plaintext_printers()